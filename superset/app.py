@@ -36,12 +36,16 @@ from superset.extensions import (
     csrf,
     db,
     encrypted_field_factory,
+    engine_registry,
     feature_flag_manager,
     machine_auth_provider_factory,
     manifest_processor,
     migrate,
+    query_progress_channel,
     results_backend_manager,
+    sql_generation_cache,
     talisman,
+    webdriver_pool,
 )
 from superset.security import SupersetSecurityManager
 from superset.typing import FlaskResponse
@@ -562,6 +566,10 @@ class SupersetAppInitializer:
         self.configure_wtf()
         self.configure_middlewares()
         self.configure_cache()
+        self.configure_engine_registry()
+        self.configure_sql_generation_cache()
+        self.configure_webdriver_pool()
+        self.configure_query_progress()
 
         with self.flask_app.app_context():  # type: ignore
             self.init_app_in_ctx()
@@ -586,6 +594,18 @@ class SupersetAppInitializer:
         cache_manager.init_app(self.flask_app)
         results_backend_manager.init_app(self.flask_app)
 
+    def configure_engine_registry(self) -> None:
+        engine_registry.init_app(self.flask_app)
+
+    def configure_sql_generation_cache(self) -> None:
+        sql_generation_cache.init_app(self.flask_app)
+
+    def configure_webdriver_pool(self) -> None:
+        webdriver_pool.init_app(self.flask_app)
+
+    def configure_query_progress(self) -> None:
+        query_progress_channel.init_app(self.flask_app)
+
     def configure_feature_flags(self) -> None:
         feature_flag_manager.init_app(self.flask_app)
 
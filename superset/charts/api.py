@@ -21,7 +21,6 @@ from io import BytesIO
 from typing import Any, Dict
 from zipfile import ZipFile
 
-import simplejson
 from flask import g, make_response, redirect, request, Response, send_file, url_for
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -73,6 +72,7 @@ from superset.utils.async_query_manager import AsyncQueryTokenException
 from superset.utils.core import (
     ChartDataResultFormat,
     ChartDataResultType,
+    json_dumps_data,
     json_int_dttm_ser,
 )
 from superset.utils.screenshots import ChartScreenshot
@@ -495,15 +495,14 @@ class ChartRestApi(BaseSupersetModelRestApi):
             if not security_manager.can_access("can_csv", "Superset"):
                 return self.response_403()
 
-            # return the first result
+            # return the first result, which is a generator of CSV chunks when
+            # `CSV_STREAMING_EXPORT` is enabled and is then streamed to the client
             data = result["queries"][0]["data"]
             return CsvResponse(data, headers=generate_download_headers("csv"))
 
         if result_format == ChartDataResultFormat.JSON:
-            response_data = simplejson.dumps(
-                {"result": result["queries"]},
-                default=json_int_dttm_ser,
-                ignore_nan=True,
+            response_data = json_dumps_data(
+                {"result": result["queries"]}, default=json_int_dttm_ser
             )
             resp = make_response(response_data, 200)
             resp.headers["Content-Type"] = "application/json; charset=utf-8"
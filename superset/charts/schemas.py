@@ -1135,6 +1135,14 @@ class ChartDataResponseResult(Schema):
     rowcount = fields.Integer(
         description="Amount of rows in result set", allow_none=False,
     )
+    duration_ms = fields.Float(
+        description="Time taken to get the result, in milliseconds", allow_none=True,
+    )
+    post_processing_stats = fields.List(
+        fields.Dict(),
+        description="Operations, duration in milliseconds and peak memory in bytes "
+        "of each post processing step, when the result wasn't cached",
+    )
     data = fields.List(fields.Dict(), description="A list with results")
     applied_filters = fields.List(
         fields.Dict(), description="A list with applied filters"
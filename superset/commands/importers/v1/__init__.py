@@ -26,6 +26,8 @@ from superset.commands.exceptions import CommandException, CommandInvalidError
 from superset.commands.importers.v1.utils import (
     load_metadata,
     load_yaml,
+    load_yamls,
+    log_import_phase,
     METADATA_FILE_NAME,
 )
 from superset.dao.base import BaseDAO
@@ -57,15 +59,19 @@ class ImportModelsCommand(BaseCommand):
 
     @classmethod
     def _get_uuids(cls) -> Set[str]:
-        return {str(model.uuid) for model in db.session.query(cls.dao.model_cls).all()}
+        uuid_column = cls.dao.model_cls.uuid  # type: ignore
+        return {str(uuid) for (uuid,) in db.session.query(uuid_column)}
 
     def run(self) -> None:
-        self.validate()
+        with log_import_phase(self.model_name, "validation"):
+            self.validate()
 
         # rollback to prevent partial imports
         try:
-            self._import(db.session, self._configs, self.overwrite)
-            db.session.commit()
+            with log_import_phase(self.model_name, "import"):
+                self._import(db.session, self._configs, self.overwrite)
+            with log_import_phase(self.model_name, "commit"):
+                db.session.commit()
         except Exception:
             db.session.rollback()
             raise self.import_error()
@@ -98,6 +104,17 @@ class ImportModelsCommand(BaseCommand):
                 exc.messages = {METADATA_FILE_NAME: {"type": exc.messages}}
                 exceptions.append(exc)
 
+        # parse all the YAML files of the bundle at once
+        with log_import_phase(self.model_name, "parsing"):
+            parsed = load_yamls(
+                {
+                    file_name: content
+                    for file_name, content in self.contents.items()
+                    # skip directories
+                    if content and f"{file_name.split('/')[0]}/" in self.schemas
+                }
+            )
+
         # validate objects
         for file_name, content in self.contents.items():
             # skip directories
@@ -108,7 +125,11 @@ class ImportModelsCommand(BaseCommand):
             schema = self.schemas.get(f"{prefix}/")
             if schema:
                 try:
-                    config = load_yaml(file_name, content)
+                    config = (
+                        parsed[file_name]
+                        if file_name in parsed
+                        else load_yaml(file_name, content)
+                    )
 
                     # populate passwords from the request or from existing DBs
                     if file_name in self.passwords:
@@ -0,0 +1,309 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Planning and execution of the post processing operations of a query object.
+
+All the operations are validated before the first one runs. Adjacent operations that
+can share a pass over the frame are fused: consecutive `rolling`, `cum` and `diff`
+operations compute their columns from narrow frames and add them all at once, and a
+`sort` followed by a `select` sorts only the selected columns. Frames created by the
+pipeline itself are updated in place rather than copied.
+"""
+import inspect
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from flask_babel import gettext as _
+from pandas import DataFrame
+
+from superset.exceptions import QueryObjectValidationError
+from superset.utils import pandas_postprocessing
+
+# Runs a step on a frame, knowing whether the frame was created by the pipeline, and
+# returns the new frame and whether it was created by the pipeline
+StepFunc = Callable[[DataFrame, bool], Tuple[DataFrame, bool]]
+
+# operations returning a frame that doesn't share any data with the input frame
+OWNING_OPERATIONS = {
+    "aggregate",
+    "boxplot",
+    "contribution",
+    "cum",
+    "diff",
+    "geodetic_parse",
+    "geohash_decode",
+    "geohash_encode",
+    "pivot",
+    "prophet",
+    "rolling",
+    "sort",
+}
+# operations adding columns computed from some other columns of the frame
+WINDOW_OPERATIONS = {"cum", "diff", "rolling"}
+
+# tracemalloc is global to the process, only one pipeline can be traced at a time
+_trace_memory_lock = threading.Lock()
+
+
+class PostProcessingOperation(NamedTuple):
+    name: str
+    func: Callable[..., DataFrame]
+    options: Dict[str, Any]
+
+
+class PostProcessingStep(NamedTuple):
+    operations: List[str]
+    func: StepFunc
+
+
+def get_operation(post_process: Dict[str, Any]) -> PostProcessingOperation:
+    """
+    Validate a post processing operation and its options.
+
+    :param post_process: the post processing object of a query object
+    :returns: the operation
+    :raises QueryObjectValidationError: If the operation or its options are invalid
+    """
+    name = post_process.get("operation")
+    if not name:
+        raise QueryObjectValidationError(
+            _("`operation` property of post processing object undefined")
+        )
+    func = getattr(pandas_postprocessing, name, None)
+    if name.startswith("_") or not inspect.isfunction(func):
+        raise QueryObjectValidationError(
+            _("Unsupported post processing operation: %(operation)s", operation=name)
+        )
+    options = post_process.get("options") or {}
+    try:
+        inspect.signature(func).bind(None, **options)
+    except TypeError:
+        raise QueryObjectValidationError(
+            _(
+                "Invalid options for %(operation)s: %(options)s",
+                operation=name,
+                options=options,
+            )
+        )
+    return PostProcessingOperation(name, func, options)
+
+
+def _drops_rows(operation: PostProcessingOperation) -> bool:
+    return operation.name == "rolling" and bool(operation.options.get("min_periods"))
+
+
+def _is_fusable_window_operation(operation: PostProcessingOperation) -> bool:
+    return operation.name in WINDOW_OPERATIONS and not _drops_rows(operation)
+
+
+def _run_operation(operation: PostProcessingOperation) -> StepFunc:
+    owns_result = operation.name in OWNING_OPERATIONS and not _drops_rows(operation)
+
+    def func(  # pylint: disable=unused-argument
+        df: DataFrame, owned: bool
+    ) -> Tuple[DataFrame, bool]:
+        return operation.func(df, **operation.options), owns_result
+
+    return func
+
+
+def _run_window_operations(operations: List[PostProcessingOperation]) -> StepFunc:
+    def func(df: DataFrame, owned: bool) -> Tuple[DataFrame, bool]:
+        if not df.columns.is_unique:
+            for operation in operations:
+                df = operation.func(df, **operation.options)
+            return df, True
+
+        # columns computed by the operations, read by the following ones
+        new_columns: Dict[str, Any] = {}
+        for operation in operations:
+            columns = operation.options.get("columns") or {}
+            if not all(
+                column in new_columns or column in df.columns for column in columns
+            ):
+                raise QueryObjectValidationError(
+                    _("Referenced columns not available in DataFrame.")
+                )
+            source_df = DataFrame(
+                {
+                    column: new_columns[column]
+                    if column in new_columns
+                    else df[column].array
+                    for column in columns
+                },
+                index=df.index,
+            )
+            result = operation.func(source_df, **operation.options)
+            for target in columns.values():
+                new_columns[target] = result[target].array
+
+        if owned:
+            for name, values in new_columns.items():
+                df[name] = values
+            return df, True
+        return df.assign(**new_columns), True
+
+    return func
+
+
+def _run_sort_select(
+    sort: PostProcessingOperation, select: PostProcessingOperation
+) -> StepFunc:
+    def func(  # pylint: disable=unused-argument
+        df: DataFrame, owned: bool
+    ) -> Tuple[DataFrame, bool]:
+        sort_columns: Dict[str, bool] = sort.options.get("columns") or {}
+        excluded = select.options.get("exclude") or []
+        rename = select.options.get("rename") or {}
+        selected = [
+            column
+            for column in select.options.get("columns") or df.columns
+            if column not in excluded
+        ]
+        names = [rename.get(column, column) for column in selected]
+        if (
+            df.columns.is_unique
+            and len(set(names)) == len(names)
+            and all(
+                column in df.columns and column in selected for column in sort_columns
+            )
+        ):
+            # only sort the selected columns, which include the sort columns
+            df = select.func(df, **select.options)
+            columns = {
+                rename.get(column, column): ascending
+                for column, ascending in sort_columns.items()
+            }
+            return sort.func(df, columns=columns), True
+        df = sort.func(df, **sort.options)
+        return select.func(df, **select.options), False
+
+    return func
+
+
+def _run_contribution(operation: PostProcessingOperation) -> StepFunc:
+    columns = operation.options.get("columns")
+
+    def func(df: DataFrame, owned: bool) -> Tuple[DataFrame, bool]:
+        if not owned or not columns or not df.columns.is_unique:
+            return operation.func(df, **operation.options), True
+
+        # compute the contributions of the selected columns only, and add them to
+        # the frame rather than to a copy of it
+        if not all(column in df.columns for column in columns):
+            raise QueryObjectValidationError(
+                _("Referenced columns not available in DataFrame.")
+            )
+        result = operation.func(df[columns], **operation.options)
+        for target in operation.options.get("rename_columns") or columns:
+            df[target] = result[target].array
+        return df, True
+
+    return func
+
+
+def plan_post_processing(
+    post_processing: List[Dict[str, Any]]
+) -> List[PostProcessingStep]:
+    """
+    Validate the post processing operations of a query object and fuse the adjacent
+    ones that can share a pass over the frame.
+
+    :param post_processing: the post processing objects of a query object
+    :returns: the steps to run
+    :raises QueryObjectValidationError: If an operation or its options are invalid
+    """
+    operations = [get_operation(post_process) for post_process in post_processing]
+    steps: List[PostProcessingStep] = []
+    i = 0
+    while i < len(operations):
+        operation = operations[i]
+        if _is_fusable_window_operation(operation):
+            group = [operation]
+            while i + 1 < len(operations) and _is_fusable_window_operation(
+                operations[i + 1]
+            ):
+                i += 1
+                group.append(operations[i])
+            steps.append(
+                PostProcessingStep(
+                    [member.name for member in group], _run_window_operations(group),
+                )
+            )
+        elif (
+            operation.name == "sort"
+            and i + 1 < len(operations)
+            and operations[i + 1].name == "select"
+        ):
+            steps.append(
+                PostProcessingStep(
+                    ["sort", "select"], _run_sort_select(operation, operations[i + 1])
+                )
+            )
+            i += 1
+        elif operation.name == "contribution":
+            steps.append(
+                PostProcessingStep([operation.name], _run_contribution(operation))
+            )
+        else:
+            steps.append(
+                PostProcessingStep([operation.name], _run_operation(operation))
+            )
+        i += 1
+    return steps
+
+
+def run_post_processing(
+    df: DataFrame, steps: List[PostProcessingStep], trace_memory: bool = False
+) -> Tuple[DataFrame, List[Dict[str, Any]]]:
+    """
+    Run the post processing steps on a frame, which is left unchanged.
+
+    :param df: the frame to process
+    :param steps: the steps planned by `plan_post_processing`
+    :param trace_memory: whether to trace the peak memory allocated by each step,
+        which slows them down
+    :returns: the processed frame, and the operations, duration and peak memory of
+        each step
+    """
+    trace_memory = trace_memory and not tracemalloc.is_tracing()
+    stats: List[Dict[str, Any]] = []
+    owned = False
+    with _trace_memory_lock if trace_memory else nullcontext():  # type: ignore
+        for step in steps:
+            peak_memory: Optional[int] = None
+            if trace_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                df, owned = step.func(df, owned)
+                if trace_memory:
+                    peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                if trace_memory:
+                    tracemalloc.stop()
+            stats.append(
+                {
+                    "operations": step.operations,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "peak_memory": peak_memory,
+                }
+            )
+    return df, stats
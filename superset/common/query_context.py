@@ -15,7 +15,10 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Any, ClassVar, Dict, List, Optional, Union
+import time
+from datetime import timedelta
+from functools import partial
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -28,15 +31,22 @@ from superset.common.query_actions import get_query_results
 from superset.common.query_object import QueryObject
 from superset.connectors.base.models import BaseDatasource
 from superset.connectors.connector_registry import ConnectorRegistry
+from superset.dataframe import df_to_json_records
 from superset.exceptions import (
     CacheLoadError,
     QueryObjectValidationError,
     SupersetException,
 )
 from superset.extensions import cache_manager, security_manager
+from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
 from superset.utils import csv
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import (
+    get_concurrency_limit_key,
+    load_datasource_relationships,
+    run_concurrently,
+)
 from superset.utils.core import (
     ChartDataResultFormat,
     ChartDataResultType,
@@ -55,7 +65,7 @@ stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
 logger = logging.getLogger(__name__)
 
 
-class QueryContext:
+class QueryContext:  # pylint: disable=too-many-instance-attributes
     """
     The query context contains the query object and additional fields necessary
     to retrieve the data payload for a given viz.
@@ -90,12 +100,25 @@ class QueryContext:
         self.custom_cache_timeout = custom_cache_timeout
         self.result_type = result_type or ChartDataResultType.FULL
         self.result_format = result_format or ChartDataResultFormat.JSON
+        max_csv_rows = config["CSV_EXPORT_MAX_ROWS"]
+        if (
+            self.result_format == ChartDataResultFormat.CSV
+            and config["CSV_STREAMING_EXPORT"]
+            and max_csv_rows is not None
+        ):
+            # the results of chart data queries are loaded in memory before being
+            # streamed, so the rows not exported aren't fetched in the first place
+            for query in self.queries:
+                if not query.row_limit or query.row_limit > max_csv_rows:
+                    query.row_limit = max_csv_rows
         self.cache_values = {
             "datasource": datasource,
             "queries": queries,
             "result_type": self.result_type,
             "result_format": self.result_format,
         }
+        # results of query objects run as part of a fused query, by query object id
+        self.prefetched_results: Dict[int, QueryResult] = {}
 
     def get_query_result(self, query_object: QueryObject) -> Dict[str, Any]:
         """Returns a pandas dataframe based on the query object"""
@@ -111,7 +134,32 @@ class QueryContext:
                 timestamp_format = dttm_col.python_date_format
 
         # The datasource here can be different backend but the interface is common
-        result = self.datasource.query(query_object.to_dict())
+        result = self.prefetched_results.pop(id(query_object), None)
+        raw_cache_key = None
+        cached_dttm = None
+        if not result and config["DATA_CACHE_RAW_QUERY_RESULTS"]:
+            raw_cache_key = self.raw_query_cache_key(query_object)
+            cache_value = self.load_raw_query_result(raw_cache_key)
+            if cache_value:
+                result = QueryResult(
+                    df=cache_value["df"],
+                    query=cache_value["query"],
+                    duration=timedelta(0),
+                )
+                cached_dttm = cache_value["dttm"]
+        if not result:
+            result = self.datasource.query(query_object.to_dict())
+            if raw_cache_key and result.status != QueryStatus.FAILED:
+                # cached before the steps below update the frame in place
+                set_and_log_cache(
+                    cache_manager.data_cache,
+                    raw_cache_key,
+                    config["DATA_CACHE_CODEC"].encode(
+                        {"df": result.df, "query": result.query}
+                    ),
+                    self.cache_timeout,
+                    self.datasource.uid,
+                )
 
         df = result.df
         # Transform the timestamp we received from database to pandas supported
@@ -138,8 +186,65 @@ class QueryContext:
             "status": result.status,
             "error_message": result.error_message,
             "df": df,
+            "cached_dttm": cached_dttm,
+            "post_processing_stats": query_object.post_processing_stats,
         }
 
+    def raw_query_cache_key(self, query_obj: QueryObject) -> Optional[str]:
+        """
+        Returns the cache key of the raw results of the query run for a QueryObject,
+        made out of the executed query rather than of the QueryObject, so that it is
+        shared by the QueryObjects that only differ by their post processing.
+        """
+        query_obj_dict = query_obj.to_dict()
+        try:
+            query = self.datasource.get_query_str(query_obj_dict)
+        except Exception as ex:  # pylint: disable=broad-except
+            # the error is reported when the query is run
+            logger.debug("Could not generate the raw query cache key: %s", ex)
+            return None
+
+        return generate_cache_key(
+            {
+                "query": query,
+                "datasource": self.datasource.uid,
+                "extra_cache_keys": self.datasource.get_extra_cache_keys(
+                    query_obj_dict
+                ),
+                "rls": security_manager.get_rls_ids(self.datasource)
+                if is_feature_enabled("ROW_LEVEL_SECURITY")
+                and self.datasource.is_rls_supported
+                else [],
+                "changed_on": self.datasource.changed_on,
+            },
+            key_prefix="raw-",
+        )
+
+    def load_raw_query_result(
+        self, raw_cache_key: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        if not raw_cache_key or self.force or not cache_manager.data_cache:
+            return None
+        cache_value = cache_manager.data_cache.get(raw_cache_key)
+        if not cache_value:
+            return None
+        stats_logger.incr("loading_from_raw_cache")
+        try:
+            cache_value = {
+                **cache_value,
+                "df": config["DATA_CACHE_CODEC"].decode(cache_value)["df"],
+            }
+        except KeyError as ex:
+            logger.error(
+                "Error reading raw cache: %s",
+                error_msg_from_exception(ex),
+                exc_info=True,
+            )
+            return None
+        stats_logger.incr("loaded_from_raw_cache")
+        logger.info("Serving raw query results from cache")
+        return cache_value
+
     @staticmethod
     def df_metrics_to_num(df: pd.DataFrame, query_object: QueryObject) -> None:
         """Converting metrics to numeric when pandas.read_sql cannot"""
@@ -149,14 +254,28 @@ class QueryContext:
                 # will stay as strings if conversion fails
                 df[col] = df[col].infer_objects()
 
-    def get_data(self, df: pd.DataFrame,) -> Union[str, List[Dict[str, Any]]]:
+    def get_data(
+        self, df: pd.DataFrame,
+    ) -> Union[str, Iterator[str], List[Dict[str, Any]]]:
         if self.result_format == ChartDataResultFormat.CSV:
             include_index = not isinstance(df.index, pd.RangeIndex)
+            if config["CSV_STREAMING_EXPORT"]:
+                # escaped lazily, one chunk at a time, when the response is sent
+                return csv.df_to_escaped_csv_chunks(
+                    csv.split_df(df, config["CSV_EXPORT_CHUNK_SIZE"]),
+                    row_limit=config["CSV_EXPORT_MAX_ROWS"],
+                    index=include_index,
+                    **config["CSV_EXPORT"],
+                )
             result = csv.df_to_escaped_csv(
                 df, index=include_index, **config["CSV_EXPORT"]
             )
             return result or ""
 
+        if config["DATA_JSON_BACKEND"] == "columnar":
+            return df_to_json_records(
+                df, dttm_format="epoch", convert_big_integers=False
+            )
         return df.to_dict(orient="records")
 
     def get_payload(
@@ -164,13 +283,26 @@ class QueryContext:
     ) -> Dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
+        max_workers = config["CHART_DATA_QUERY_THREADS"]
+        if max_workers > 1 and len(self.queries) > 1:
+            load_datasource_relationships(self.datasource)
+
         # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self.result_type, self, query_obj, force_cached
-            )
-            for query_obj in self.queries
-        ]
+        query_results = run_concurrently(
+            [
+                partial(
+                    get_query_results,
+                    query_obj.result_type or self.result_type,
+                    self,
+                    query_obj,
+                    force_cached,
+                )
+                for query_obj in self.queries
+            ],
+            max_workers=max_workers,
+            limit_key=get_concurrency_limit_key(self.datasource),
+            limit=config["CHART_DATA_QUERY_THREADS_PER_DATABASE"],
+        )
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -304,16 +436,19 @@ class QueryContext:
             )
         return annotation_data
 
-    def get_df_payload(  # pylint: disable=too-many-statements,too-many-locals
+    def get_df_payload(  # pylint: disable=too-many-statements,too-many-locals,too-many-branches
         self, query_obj: QueryObject, force_cached: Optional[bool] = False,
     ) -> Dict[str, Any]:
         """Handles caching around the df payload retrieval"""
+        start = time.perf_counter()
         cache_key = self.query_cache_key(query_obj)
         logger.info("Cache key: %s", cache_key)
         is_loaded = False
         stacktrace = None
         df = pd.DataFrame()
         cache_value = None
+        raw_cached_dttm = None
+        post_processing_stats: List[Dict[str, Any]] = []
         status = None
         query = ""
         annotation_data = {}
@@ -323,7 +458,7 @@ class QueryContext:
             if cache_value:
                 stats_logger.incr("loading_from_cache")
                 try:
-                    df = cache_value["df"]
+                    df = config["DATA_CACHE_CODEC"].decode(cache_value)["df"]
                     query = cache_value["query"]
                     annotation_data = cache_value.get("annotation_data", {})
                     status = QueryStatus.SUCCESS
@@ -365,9 +500,13 @@ class QueryContext:
                 query = query_result["query"]
                 error_message = query_result["error_message"]
                 df = query_result["df"]
+                raw_cached_dttm = query_result["cached_dttm"]
+                post_processing_stats = query_result["post_processing_stats"]
                 annotation_data = self.get_annotation_data(query_obj)
 
-                if status != QueryStatus.FAILED:
+                if status != QueryStatus.FAILED and raw_cached_dttm:
+                    is_loaded = True
+                elif status != QueryStatus.FAILED:
                     stats_logger.incr("loaded_from_source")
                     if not self.force:
                         stats_logger.incr("loaded_from_source_without_force")
@@ -386,22 +525,28 @@ class QueryContext:
                 set_and_log_cache(
                     cache_manager.data_cache,
                     cache_key,
-                    {"df": df, "query": query, "annotation_data": annotation_data},
+                    config["DATA_CACHE_CODEC"].encode(
+                        {"df": df, "query": query, "annotation_data": annotation_data}
+                    ),
                     self.cache_timeout,
                     self.datasource.uid,
                 )
         return {
             "cache_key": cache_key,
-            "cached_dttm": cache_value["dttm"] if cache_value is not None else None,
+            "cached_dttm": cache_value["dttm"]
+            if cache_value is not None
+            else raw_cached_dttm,
             "cache_timeout": self.cache_timeout,
             "df": df,
             "annotation_data": annotation_data,
             "error": error_message,
-            "is_cached": cache_value is not None,
+            "is_cached": cache_value is not None or raw_cached_dttm is not None,
             "query": query,
             "status": status,
             "stacktrace": stacktrace,
             "rowcount": len(df.index),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+            "post_processing_stats": post_processing_stats,
         }
 
     def raise_for_access(self) -> None:
@@ -0,0 +1,183 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Fuse the queries of several charts that aggregate the same datasource with the same
+filters, time range and groupby, but different metrics, into a single query.
+"""
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from superset import app
+from superset.extensions import cache_manager
+from superset.models.helpers import QueryResult
+from superset.stats_logger import BaseStatsLogger
+from superset.typing import Metric
+from superset.utils.core import (
+    ChartDataResultType,
+    get_metric_name,
+    json_int_dttm_ser,
+    QueryStatus,
+)
+from superset.utils.hashing import md5_sha_from_dict
+
+if TYPE_CHECKING:
+    from superset.common.query_context import QueryContext
+    from superset.common.query_object import QueryObject
+
+config = app.config
+stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+logger = logging.getLogger(__name__)
+
+FUSABLE_RESULT_TYPES = {ChartDataResultType.FULL, ChartDataResultType.RESULTS}
+
+Member = Tuple["QueryContext", "QueryObject"]
+
+
+def get_fusion_key(
+    query_context: "QueryContext", query_obj: "QueryObject"
+) -> Optional[str]:
+    """
+    Return the key of the queries a query object can be fused with, or `None` if
+    it has to be run on its own.
+
+    Queries of the same table with the same key only differ in their metrics and
+    row limit. The series limit and row offset depend on the metrics or on the
+    row limit, so such queries aren't fused, and neither are templated queries, as
+    templates can refer to the metrics.
+    """
+    datasource = query_context.datasource
+    result_type = query_obj.result_type or query_context.result_type
+    if (  # pylint: disable=too-many-boolean-expressions
+        datasource.type != "table"
+        or result_type not in FUSABLE_RESULT_TYPES
+        or not query_obj.metrics
+        or query_obj.is_rowcount
+        or query_obj.row_offset
+        or query_obj.timeseries_limit
+        or datasource.is_templated(query_obj.to_dict())
+    ):
+        return None
+
+    key = query_obj.to_dict()
+    del key["metrics"]
+    del key["row_limit"]
+    key["datasource"] = datasource.uid
+    return md5_sha_from_dict(key, default=json_int_dttm_ser, ignore_nan=True)
+
+
+def plan_fused_queries(query_contexts: List["QueryContext"]) -> List[List[Member]]:
+    """
+    Group the query objects of the query contexts that can be run as one query.
+    Query objects whose results are already cached are left out, as are groups of
+    a single query object.
+
+    :param query_contexts: Query contexts of the charts of a dashboard
+    :return: Groups of query objects, with the query context they belong to
+    """
+    candidates: Dict[str, List[Member]] = defaultdict(list)
+    for query_context in query_contexts:
+        for query_obj in query_context.queries:
+            key = get_fusion_key(query_context, query_obj)
+            if key is None:
+                continue
+            if not query_context.force and cache_manager.data_cache.cache.has(
+                query_context.query_cache_key(query_obj)
+            ):
+                continue
+            candidates[key].append((query_context, query_obj))
+
+    groups: List[List[Member]] = []
+    for members in candidates.values():
+        # metrics with the same label but different definitions can't be selected
+        # by the same query
+        fused: List[Tuple[Dict[str, Metric], List[Member]]] = []
+        for member in members:
+            metrics = {get_metric_name(metric): metric for metric in member[1].metrics}
+            for fused_metrics, fused_members in fused:
+                if all(
+                    fused_metrics.get(label, metric) == metric
+                    for label, metric in metrics.items()
+                ):
+                    fused_metrics.update(metrics)
+                    fused_members.append(member)
+                    break
+            else:
+                fused.append((metrics, [member]))
+        groups += [
+            fused_members for _, fused_members in fused if len(fused_members) > 1
+        ]
+    return groups
+
+
+def run_fused_query(members: List[Member]) -> None:
+    """
+    Run a single query selecting the metrics of all the query objects of a group,
+    and hand each query context the part of the result of its query object, which
+    is then processed and cached as if it had been queried on its own. Nothing is
+    handed over when the query fails, so that each query reports its own error.
+
+    :param members: Query objects that can be fused, with their query contexts
+    """
+    query_context, query_obj = members[0]
+    metrics: Dict[str, Metric] = {}
+    row_limits: List[int] = []
+    for _, member_query_obj in members:
+        for metric in member_query_obj.metrics or []:
+            metrics.setdefault(get_metric_name(metric), metric)
+        row_limits.append(member_query_obj.row_limit)
+
+    fused_query_obj: Dict[str, Any] = {
+        **query_obj.to_dict(),
+        "metrics": list(metrics.values()),
+        # a row limit of 0 means no limit
+        "row_limit": max(row_limits) if all(row_limits) else 0,
+    }
+    result = query_context.datasource.query(fused_query_obj)
+    if result.status == QueryStatus.FAILED:
+        logger.warning("Fused query failed: %s", result.error_message)
+        return
+
+    stats_logger.incr("fused_queries")
+    metric_labels = set(metrics)
+    for member_query_context, member_query_obj in members:
+        columns = [
+            column for column in result.df.columns if column not in metric_labels
+        ] + member_query_obj.metric_names
+        # the queries share their ordering, so the first rows of the fused result
+        # are the rows of each query
+        df = result.df[columns]
+        if member_query_obj.row_limit:
+            df = df.head(member_query_obj.row_limit)
+        stats_logger.incr("fused_query_objects")
+        member_query_context.prefetched_results[id(member_query_obj)] = QueryResult(
+            df=df.copy(),
+            query=result.query,
+            duration=result.duration,
+            status=result.status,
+        )
+
+
+def fuse_queries(query_contexts: List["QueryContext"]) -> None:
+    """
+    Run the fusable query objects of query contexts as fused queries ahead of
+    computing the payloads of the query contexts.
+
+    :param query_contexts: Query contexts of the charts of a dashboard
+    """
+    for members in plan_fused_queries(query_contexts):
+        run_fused_query(members)
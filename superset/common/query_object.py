@@ -23,11 +23,11 @@ from flask_babel import gettext as _
 from pandas import DataFrame
 
 from superset import app, db
+from superset.common.post_processing import plan_post_processing, run_post_processing
 from superset.connectors.base.models import BaseDatasource
 from superset.connectors.connector_registry import ConnectorRegistry
 from superset.exceptions import QueryObjectValidationError
 from superset.typing import Metric, OrderBy
-from superset.utils import pandas_postprocessing
 from superset.utils.core import (
     ChartDataResultType,
     DatasourceDict,
@@ -91,6 +91,7 @@ class QueryObject:
     columns: List[str]
     orderby: List[OrderBy]
     post_processing: List[Dict[str, Any]]
+    post_processing_stats: List[Dict[str, Any]]
     datasource: Optional[BaseDatasource]
     result_type: Optional[ChartDataResultType]
     is_rowcount: bool
@@ -164,6 +165,7 @@ class QueryObject:
         self.post_processing = [
             post_proc for post_proc in post_processing or [] if post_proc
         ]
+        self.post_processing_stats = []
 
         # Support metric reference/definition in the format of
         #   1. 'metric_name'   - name of predefined metric
@@ -259,6 +261,11 @@ class QueryObject:
                     labels=", ".join(f'"{x}"' for x in dup_labels),
                 )
             )
+        if not error:
+            try:
+                plan_post_processing(self.post_processing)
+            except QueryObjectValidationError as ex:
+                error = ex
         if error and raise_exceptions:
             raise error
         return error
@@ -344,19 +351,8 @@ class QueryObject:
         :raises QueryObjectValidationError: If the post processing operation
                  is incorrect
         """
-        for post_process in self.post_processing:
-            operation = post_process.get("operation")
-            if not operation:
-                raise QueryObjectValidationError(
-                    _("`operation` property of post processing object undefined")
-                )
-            if not hasattr(pandas_postprocessing, operation):
-                raise QueryObjectValidationError(
-                    _(
-                        "Unsupported post processing operation: %(operation)s",
-                        type=operation,
-                    )
-                )
-            options = post_process.get("options", {})
-            df = getattr(pandas_postprocessing, operation)(df, **options)
+        steps = plan_post_processing(self.post_processing)
+        df, self.post_processing_stats = run_post_processing(
+            df, steps, trace_memory=config["POST_PROCESSING_TRACE_MEMORY"]
+        )
         return df
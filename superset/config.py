@@ -43,6 +43,7 @@ from superset.jinja_context import (  # pylint: disable=unused-import
 )
 from superset.stats_logger import DummyStatsLogger
 from superset.typing import CacheConfig
+from superset.utils.cache_codecs import DataCacheCodec
 from superset.utils.core import is_test, parse_boolean_string
 from superset.utils.encrypt import SQLAlchemyUtilsAdapter
 from superset.utils.log import DBEventLogger
@@ -60,6 +61,9 @@ if TYPE_CHECKING:
 
 # Realtime stats logger, a StatsD implementation exists
 STATS_LOGGER = DummyStatsLogger()
+# Event logger committing the logs of each request to the metadata database. Use
+# `superset.utils.log.BufferedDBEventLogger` to commit them in batches from a
+# background thread instead, out of the request critical path.
 EVENT_LOGGER = DBEventLogger()
 
 SUPERSET_LOG_VIEW = True
@@ -128,6 +132,33 @@ VIZ_ROW_LIMIT = 10000
 SAMPLES_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
+# Number of threads running the queries of a chart data request, e.g. the main
+# query along with time comparison or totals queries, or the time comparison
+# queries of legacy time-series charts, concurrently. They are run one after the
+# other when set to 1.
+CHART_DATA_QUERY_THREADS = 1
+# Maximum number of chart data queries run concurrently against the same database
+# by the query threads of a web server process
+CHART_DATA_QUERY_THREADS_PER_DATABASE = 4
+# Trace the peak memory allocated by each post processing step of chart data
+# queries, reported in the `post_processing_stats` of the results along with their
+# duration. Tracing slows the steps down and serializes them across threads.
+POST_PROCESSING_TRACE_MEMORY = False
+# Number of processes fitting the Prophet models of a forecast in parallel, one
+# model per metric. Set to 0 or 1 to fit them sequentially in the requesting
+# process; daemonic processes such as Celery workers always fit sequentially.
+PROPHET_PROCESSES = 0
+# Seconds to wait for the process pool to fit the models of a forecast
+PROPHET_TIMEOUT = 300
+# Seconds to keep fitted forecasts in the data cache, keyed by their series and
+# model parameters. Set to None to always refit the models.
+PROPHET_CACHE_TIMEOUT: Optional[int] = 86400
+# Run the time comparison queries of legacy time-series charts as a single query
+# over their combined time range, split into the shifted windows in pandas. Only
+# applies when the results are identical to running them separately: the shifted
+# windows overlap or touch, no series limit is set and the windows are aligned on
+# a time grain of a day or less.
+TIME_COMPARE_SINGLE_SCAN = False
 SUPERSET_WORKERS = 2  # deprecated
 SUPERSET_CELERY_WORKERS = 32  # deprecated
 
@@ -183,6 +214,26 @@ SQLALCHEMY_CUSTOM_PASSWORD_STORE = None
 # pylint: disable=C0103
 SQLALCHEMY_ENCRYPTED_FIELD_TYPE_ADAPTER = SQLAlchemyUtilsAdapter
 
+# By default a new SQLAlchemy engine with a `NullPool` is created for every query
+# run against an analytics database, meaning a new connection (and possibly a full
+# authentication handshake) is established every time. When enabled, pooled
+# engines are kept around and reused across requests instead. They are keyed by
+# database, effective user, schema and connection parameters, and the least
+# recently used ones are disposed of once more than
+# SQLALCHEMY_ENGINE_POOLING_MAX_ENGINES are open. The pool of each database can be
+# tuned with the `pool_size`, `max_overflow`, `pool_timeout` and `pool_recycle`
+# keys of `engine_params` in its extra attributes.
+SQLALCHEMY_ENGINE_POOLING = False
+SQLALCHEMY_ENGINE_POOLING_MAX_ENGINES = 32
+
+# The SQL generated for the queries of charts is memoized for the duration of a
+# request, so that templates are rendered and statements compiled once even though
+# the SQL is needed both to compute the cache key of a query and to run it. When set
+# to a positive number, the SQL of up to SQL_GENERATION_CACHE_SIZE queries that
+# don't depend on the request, e.g. that aren't templated, is also kept in memory
+# across requests.
+SQL_GENERATION_CACHE_SIZE = 0
+
 # The limit of queries fetched for query search
 QUERY_SEARCH_LIMIT = 1000
 
@@ -502,6 +553,31 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "null"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "null"}
 
+# Codec used to store the query results of charts in the data cache. The default
+# leaves it to the cache backend to pickle dataframes, while the
+# `ArrowDataCacheCodec` and `ParquetDataCacheCodec` of `superset.utils.cache_codecs`
+# store them as compressed Arrow IPC or Parquet bytes, which are typically smaller
+# and faster to load, and allow loading only some of their columns.
+DATA_CACHE_CODEC: DataCacheCodec = DataCacheCodec()
+
+# Also store the raw results of the queries run for charts in the data cache, keyed
+# on the executed query rather than on the whole query object. Charts running the
+# same query with different post processing operations share these results, the
+# post processing being applied on top of them.
+DATA_CACHE_RAW_QUERY_RESULTS = False
+
+# Timeout (in seconds) of the row level security filters of each combination of
+# roles and table in the cache of CACHE_CONFIG, shared across requests and workers.
+# The cache is invalidated when row level security filters or roles change. Filters
+# are always memoized for the duration of a request, None disables the shared cache.
+RLS_FILTERS_CACHE_TIMEOUT: Optional[int] = None
+
+# Timeout (in seconds) of the results of the prequeries returning the top series of
+# charts with a series limit, run for databases that don't support joins, in the
+# data cache. Prequery results are keyed by their SQL and are also reused when
+# refreshing charts, None disables caching them.
+SERIES_LIMIT_PREQUERY_CACHE_TIMEOUT: Optional[int] = None
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
@@ -526,6 +602,32 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# Stream CSV exports of SQL Lab results and chart data to the client chunk by
+# chunk, instead of building the whole file in memory first. SQL Lab results are
+# read from the results backend one row group at a time or fetched incrementally
+# from the database cursor. Chart data is still loaded in memory as a whole, as it
+# may be post processed, and only its conversion to CSV is done chunk by chunk.
+CSV_STREAMING_EXPORT = False
+# Maximum number of rows converted to CSV at a time when streaming exports
+CSV_EXPORT_CHUNK_SIZE = 10000
+# Maximum number of rows of a streamed CSV export, None for no limit. The row limit
+# of the queries of streamed chart data exports is lowered to it before they run.
+CSV_EXPORT_MAX_ROWS: Optional[int] = None
+
+# Backend used to encode chart data and SQL Lab results to JSON. "simplejson"
+# builds the rows value by value and serializes them with simplejson, while
+# "columnar" converts each DataFrame column at once (datetimes, big integers)
+# and serializes the payload with orjson when it is installed.
+DATA_JSON_BACKEND = "simplejson"
+
+# Number of processes parsing the YAML files of an imported bundle in parallel.
+# Set to 0 or 1 to parse them in the requesting process; daemonic processes such
+# as Celery workers always parse them sequentially.
+IMPORT_PARSE_PROCESSES = 0
+# Number of rows of the example data of imported datasets read and inserted at a
+# time
+IMPORT_DATA_CHUNK_SIZE = 10000
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -623,6 +725,11 @@ MAPBOX_API_KEY = os.environ.get("MAPBOX_API_KEY", "")
 # in the results backend. This also becomes the limit when exporting CSVs
 SQL_MAX_ROW = 100000
 
+# Number of rows fetched from the database cursor at a time when building the
+# results of queries. Results are accumulated as Arrow record batches, so this
+# bounds the number of rows held as Python objects at any given time.
+SQL_FETCH_BATCH_SIZE = 10000
+
 # Maximum number of rows displayed in SQL Lab UI
 # Is set to avoid out of memory/localstorage issues in browsers. Does not affect
 # exported CSVs
@@ -647,7 +754,7 @@ SQLLAB_SCHEDULE_WARNING_MESSAGE = None
 
 class CeleryConfig:  # pylint: disable=too-few-public-methods
     BROKER_URL = "sqla+sqlite:///celerydb.sqlite"
-    CELERY_IMPORTS = ("superset.sql_lab", "superset.tasks")
+    CELERY_IMPORTS = ("superset.sql_lab", "superset.tasks", "superset.tasks.upload")
     CELERY_RESULT_BACKEND = "db+sqlite:///celery_results.sqlite"
     CELERYD_LOG_LEVEL = "DEBUG"
     CELERYD_PREFETCH_MULTIPLIER = 1
@@ -679,6 +786,18 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
 
 CELERY_CONFIG = CeleryConfig  # pylint: disable=invalid-name
 
+# Warm up the charts of the `cache-warmup` task strategies by querying them within
+# the Celery worker, rather than by fetching them one after the other from the web
+# servers. Charts whose data is still cached are skipped, and the most viewed
+# charts since `CACHE_WARMUP_USAGE_SINCE` according to the `logs` table are warmed
+# up first.
+CACHE_WARMUP_IN_PROCESS = False
+# Number of threads of the worker warming up charts concurrently
+CACHE_WARMUP_THREADS = 4
+# Maximum number of charts warmed up concurrently against the same database
+CACHE_WARMUP_THREADS_PER_DATABASE = 2
+CACHE_WARMUP_USAGE_SINCE = "7 days ago"
+
 # Set celery config to None to disable all the above configuration
 # CELERY_CONFIG = None
 
@@ -781,6 +900,13 @@ RESULTS_BACKEND: Optional[BaseCache] = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Results are then stored as row groups of at most RESULTS_BACKEND_ARROW_BATCH_SIZE
+# rows, each an Arrow IPC file whose buffers are compressed with the `lz4` or `zstd`
+# codec (or not at all when None). Fetching a page of rows or some of the columns
+# of a result only decompresses the matching buffers of the row groups holding them.
+RESULTS_BACKEND_ARROW_COMPRESSION: Optional[str] = "lz4"
+RESULTS_BACKEND_ARROW_BATCH_SIZE = 10000
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -819,6 +945,18 @@ ALLOWED_USER_CSV_SCHEMA_FUNC: Callable[["Database", "models.User"], List[str]] =
 # Values that should be treated as nulls for the csv uploads.
 CSV_DEFAULT_NA_NAMES = list(STR_NA_VALUES)
 
+# Number of rows of an uploaded CSV file that are read and written to the database
+# at a time, bounding the memory used by large uploads. The column types of a new
+# table are inferred from the first chunk, so later chunks have to fit them.
+CSV_UPLOAD_CHUNK_SIZE = 10000
+
+# Load uploaded CSV files into the database in a Celery task rather than in the web
+# request. The file is stored in UPLOAD_FOLDER, which has to be shared with the
+# workers. The task is registered by the workers started with
+# `superset.tasks.celery_app`, and reports the number of rows loaded so far in its
+# PROGRESS state.
+CSV_UPLOAD_ASYNC = False
+
 # A dictionary of items that gets merged into the Jinja context for
 # SQL Lab. The existing context gets updated with this dictionary,
 # meaning values for existing keys get overwritten by the content of this
@@ -902,6 +1040,19 @@ HIVE_POLL_INTERVAL = 5
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # pylint: disable=line-too-long
 PRESTO_POLL_INTERVAL = 1
 
+# Polls of running Hive and Presto queries get less frequent as they run longer,
+# every 5% of their running time, from the poll interval of the engine up to this
+# maximum time in seconds
+SQLLAB_MAX_POLL_INTERVAL = 5
+# Minimum time in seconds between two commits of the progress of a running query
+# to the metadata database
+SQLLAB_PROGRESS_COMMIT_INTERVAL = 5
+# Redis connection used to push stop requests to the workers running Hive and
+# Presto queries, e.g. {"host": "localhost", "port": 6379, "db": 0}. The workers
+# read the status of the queries from the metadata database on every poll when
+# not set.
+SQLLAB_QUERY_PROGRESS_REDIS_CONFIG: Optional[Dict[str, Any]] = None
+
 # Allow for javascript controls components
 # this enables programmers to customize certain charts (like the
 # geospatial ones) by inputing javascript in controls. This exposes
@@ -1038,6 +1189,15 @@ WEBDRIVER_OPTION_ARGS = [
     "--headless",
 ]
 
+# Number of headless browsers each process keeps around between screenshots for
+# thumbnails, alerts and reports, authenticated as the user they were last used
+# for. A browser is started for each screenshot when set to 0.
+WEBDRIVER_POOL_SIZE = 0
+# Number of screenshots taken by a pooled browser before it is restarted
+WEBDRIVER_POOL_MAX_USES = 50
+# Time in seconds after which an unused pooled browser is quit
+WEBDRIVER_POOL_IDLE_TIMEOUT = 600
+
 # The base URL to query for accessing the user interface
 WEBDRIVER_BASEURL = "http://0.0.0.0:8080/"
 # The base URL for the email report hyperlinks.
@@ -46,6 +46,7 @@ from sqlalchemy import (
     String,
     Table,
     Text,
+    tuple_,
 )
 from sqlalchemy.orm import backref, Query, relationship, RelationshipProperty, Session
 from sqlalchemy.schema import UniqueConstraint
@@ -64,6 +65,7 @@ from superset.exceptions import (
     SupersetGenericDBErrorException,
     SupersetSecurityException,
 )
+from superset.extensions import cache_manager, sql_generation_cache
 from superset.jinja_context import (
     BaseTemplateProcessor,
     ExtraCache,
@@ -76,13 +78,18 @@ from superset.result_set import SupersetResultSet
 from superset.sql_parse import ParsedQuery
 from superset.typing import AdhocMetric, Metric, OrderBy, QueryObjectDict
 from superset.utils import core as utils
+from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import GenericDataType, remove_duplicates
+from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.sql_generation_cache import GeneratedQuery
 
 config = app.config
+stats_logger = config["STATS_LOGGER"]
 metadata = Model.metadata  # pylint: disable=no-member
 logger = logging.getLogger(__name__)
 
 VIRTUAL_TABLE_ALIAS = "virtual_table"
+TEMPLATE_REGEX = re.compile(r"{{|{%")
 
 
 class SqlaQuery(NamedTuple):
@@ -772,13 +779,89 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
     def get_template_processor(self, **kwargs: Any) -> BaseTemplateProcessor:
         return get_template_processor(table=self, database=self.database, **kwargs)
 
+    def get_generated_query(self, query_obj: QueryObjectDict) -> GeneratedQuery:
+        """
+        Generate the SQL of a query object, reusing the SQL already generated for
+        the same query object, datasource definition and row level security filters,
+        so that templates are rendered and statements compiled once per request.
+
+        :param query_obj: query object to generate the SQL of
+        :return: The generated query
+        """
+
+        def generate() -> GeneratedQuery:
+            sqlaq = self.get_sqla_query(**query_obj)
+            sql = self.database.compile_sqla_query(sqlaq.sqla_query)
+            sql = sqlparse.format(sql, reindent=True)
+            return GeneratedQuery(
+                extra_cache_keys=sqlaq.extra_cache_keys,
+                labels_expected=sqlaq.labels_expected,
+                prequeries=sqlaq.prequeries,
+                sql=sql,
+            )
+
+        # templates may depend on the user, the request or the time, and prequeries
+        # on the data, so their SQL isn't reused across requests
+        templated = self.is_templated(query_obj)
+        db_engine_spec = self.database.db_engine_spec
+        shareable = not templated and (
+            db_engine_spec.allows_joins or not query_obj.get("timeseries_limit")
+        )
+        rls_ids = (
+            security_manager.get_rls_ids(self)
+            if is_feature_enabled("ROW_LEVEL_SECURITY") and self.is_rls_supported
+            else []
+        )
+        key = md5_sha_from_dict(
+            {
+                "query_obj": query_obj,
+                "datasource": [
+                    self.uid,
+                    self.table_name,
+                    self.schema,
+                    self.sql,
+                    self.template_params,
+                    self.fetch_values_predicate,
+                    self.main_dttm_col,
+                ],
+                "columns": [
+                    [
+                        col.column_name,
+                        col.expression,
+                        col.type,
+                        col.is_dttm,
+                        col.python_date_format,
+                    ]
+                    for col in self.columns
+                ],
+                "metrics": [
+                    [metric.metric_name, metric.expression] for metric in self.metrics
+                ],
+                "database": [self.database.id, self.database.changed_on],
+                # capabilities of the engine the SQL is generated for
+                "engine_spec": [
+                    db_engine_spec.engine,
+                    db_engine_spec.allows_alias_in_orderby,
+                    db_engine_spec.allows_hidden_ordeby_agg,
+                    db_engine_spec.allows_joins,
+                    db_engine_spec.allows_subqueries,
+                    db_engine_spec.time_groupby_inline,
+                    db_engine_spec.time_secondary_columns,
+                ],
+                "rls": rls_ids,
+                "username": utils.get_username() if templated else None,
+            },
+            default=str,
+        )
+        return sql_generation_cache.get(key, generate, shareable)
+
     def get_query_str_extended(self, query_obj: QueryObjectDict) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
-        sql = self.database.compile_sqla_query(sqlaq.sqla_query)
-        sql = sqlparse.format(sql, reindent=True)
-        sql = self.mutate_query_from_config(sql)
+        generated_query = self.get_generated_query(query_obj)
+        sql = self.mutate_query_from_config(generated_query.sql)
         return QueryStringExtended(
-            labels_expected=sqlaq.labels_expected, sql=sql, prequeries=sqlaq.prequeries
+            labels_expected=generated_query.labels_expected,
+            sql=sql,
+            prequeries=generated_query.prequeries,
         )
 
     def get_query_str(self, query_obj: QueryObjectDict) -> str:
@@ -1280,7 +1363,10 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
             and not time_groupby_inline
             and groupby_exprs_sans_timestamp
         ):
-            if db_engine_spec.allows_joins:
+            if (
+                db_engine_spec.get_series_limit_strategy()
+                == utils.SeriesLimitStrategy.JOIN
+            ):
                 # some sql dialects require for order by expressions
                 # to also be in the select clause -- others, e.g. vertica,
                 # require a unique inner alias
@@ -1351,7 +1437,7 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
                     "order_desc": True,
                 }
 
-                result = self.query(prequery_obj)
+                result = self._query_series_limit(prequery_obj)
                 prequeries.append(result.query)
                 dimensions = [
                     c
@@ -1359,7 +1445,10 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
                     if c not in metrics and c in groupby_exprs_sans_timestamp
                 ]
                 top_groups = self._get_top_groups(
-                    result.df, dimensions, groupby_exprs_sans_timestamp
+                    result.df,
+                    dimensions,
+                    groupby_exprs_sans_timestamp,
+                    tuple_in=db_engine_spec.allows_tuple_in,
                 )
                 qry = qry.where(top_groups)
 
@@ -1402,20 +1491,92 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
             )
         return ob
 
-    def _get_top_groups(  # pylint: disable=no-self-use
-        self,
+    def _query_series_limit(self, prequery_obj: QueryObjectDict) -> QueryResult:
+        """
+        Run the prequery returning the top series of a query, caching its results
+        in the data cache for `SERIES_LIMIT_PREQUERY_CACHE_TIMEOUT` seconds when set.
+
+        :param prequery_obj: query object of the prequery
+        :return: The results of the prequery
+        """
+        cache_timeout = config["SERIES_LIMIT_PREQUERY_CACHE_TIMEOUT"]
+        if cache_timeout is None:
+            return self.query(prequery_obj)
+
+        # the SQL of the prequery, which includes the row level security filters
+        # and rendered templates, identifies its results
+        cache_key = generate_cache_key(
+            {
+                "sql": self.get_query_str(prequery_obj),
+                "datasource": self.uid,
+                "changed_on": self.changed_on,
+                "database": self.database.id,
+            },
+            key_prefix="prequery_",
+        )
+        cache_value = cache_manager.data_cache.get(cache_key)
+        if cache_value:
+            stats_logger.incr("series_limit_prequery.cache_hit")
+            return QueryResult(
+                df=config["DATA_CACHE_CODEC"].decode(cache_value)["df"],
+                query=cache_value["query"],
+                duration=timedelta(0),
+            )
+
+        stats_logger.incr("series_limit_prequery.cache_miss")
+        result = self.query(prequery_obj)
+        if result.status != utils.QueryStatus.FAILED:
+            set_and_log_cache(
+                cache_manager.data_cache,
+                cache_key,
+                config["DATA_CACHE_CODEC"].encode(
+                    {"df": result.df, "query": result.query}
+                ),
+                cache_timeout,
+                self.uid,
+            )
+        return result
+
+    @staticmethod
+    def _get_top_groups(
         df: pd.DataFrame,
         dimensions: List[str],
         groupby_exprs: "OrderedDict[str, Any]",
+        tuple_in: bool = False,
     ) -> ColumnElement:
-        groups = []
-        for _unused, row in df.iterrows():
-            group = []
-            for dimension in dimensions:
-                group.append(groupby_exprs[dimension] == row[dimension])
-            groups.append(and_(*group))
+        """
+        Build the predicate restricting a query to the groups returned by its
+        prequery. Groups are matched with an `IN` predicate when grouping by a single
+        column, or by several columns when `tuple_in` is set, and with `OR`s of
+        equalities otherwise, which can get very large for big series limits.
+
+        :param df: Results of the prequery
+        :param dimensions: Columns of the groups
+        :param groupby_exprs: Expressions of the grouped by columns
+        :param tuple_in: Whether tuple `IN` predicates are supported
+        :return: The predicate
+        """
+        exprs = [groupby_exprs[dimension] for dimension in dimensions]
+        groups = [
+            tuple(None if pd.isnull(value) else value for value in row)
+            for row in df[dimensions].itertuples(index=False)
+        ]
+        # null values can only be matched by `IS NULL` predicates
+        in_groups = [group for group in groups if None not in group]
+        or_groups = [group for group in groups if None in group]
+        predicates = []
+        if len(exprs) == 1 and in_groups:
+            predicates.append(exprs[0].in_([group[0] for group in in_groups]))
+        elif tuple_in and in_groups:
+            predicates.append(tuple_(*exprs).in_(in_groups))
+        else:
+            or_groups = groups
 
-        return or_(*groups)
+        for group in or_groups:
+            predicates.append(
+                and_(*[expr == value for expr, value in zip(exprs, group)])
+            )
+        return or_(*predicates)
 
     def query(self, query_obj: QueryObjectDict) -> QueryResult:
         qry_start_dttm = datetime.now()
@@ -1577,6 +1738,25 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
         :param query_obj: query object to analyze
         :return: True if there are call(s) to an `ExtraCache` method, False otherwise
         """
+        for statement in self._get_templatable_statements(query_obj):
+            if ExtraCache.regex.search(statement):
+                return True
+        return False
+
+    def is_templated(self, query_obj: QueryObjectDict) -> bool:
+        """
+        Detects the presence of Jinja templates in items in query_obj that can be
+        templated, which makes the generated SQL depend on the template context.
+
+        :param query_obj: query object to analyze
+        :return: True if there are templates, False otherwise
+        """
+        return any(
+            TEMPLATE_REGEX.search(statement)
+            for statement in self._get_templatable_statements(query_obj)
+        )
+
+    def _get_templatable_statements(self, query_obj: QueryObjectDict) -> List[str]:
         templatable_statements: List[str] = []
         if self.sql:
             templatable_statements.append(self.sql)
@@ -1591,10 +1771,7 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
             templatable_statements += [
                 f.clause for f in security_manager.get_rls_filters(self)
             ]
-        for statement in templatable_statements:
-            if ExtraCache.regex.search(statement):
-                return True
-        return False
+        return templatable_statements
 
     def get_extra_cache_keys(self, query_obj: QueryObjectDict) -> List[Hashable]:
         """
@@ -1606,8 +1783,7 @@ class SqlaTable(  # pylint: disable=too-many-public-methods,too-many-instance-at
         """
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            sqla_query = self.get_sqla_query(**query_obj)
-            extra_cache_keys += sqla_query.extra_cache_keys
+            extra_cache_keys += self.get_generated_query(query_obj).extra_cache_keys
         return extra_cache_keys
 
 
@@ -1653,3 +1829,34 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
     )
 
     clause = Column(Text, nullable=False)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", security_manager.invalidate_rls_filters
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", security_manager.invalidate_rls_filters
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", security_manager.invalidate_rls_filters
+)
+sa.event.listen(
+    security_manager.role_model, "after_delete", security_manager.invalidate_rls_filters
+)
+sa.event.listen(Session, "after_commit", security_manager.rotate_rls_filters_version)
+sa.event.listen(Session, "after_rollback", security_manager.discard_rls_filters_changes)
+sa.event.listen(
+    security_manager.role_model,
+    "after_update",
+    security_manager.invalidate_rls_filters_memo,
+)
+sa.event.listen(
+    security_manager.user_model,
+    "after_update",
+    security_manager.invalidate_rls_filters_memo,
+)
+sa.event.listen(
+    security_manager.user_model,
+    "after_delete",
+    security_manager.invalidate_rls_filters_memo,
+)
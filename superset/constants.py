@@ -115,6 +115,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "data": "read",
     "data_from_cache": "read",
     "get_charts": "read",
+    "get_chart_data": "read",
     "get_datasets": "read",
     "function_names": "read",
     "available": "read",
@@ -30,9 +30,15 @@ from werkzeug.wrappers import Response as WerkzeugResponse
 from werkzeug.wsgi import FileWrapper
 
 from superset import is_feature_enabled, thumbnail_cache
+from superset.charts.commands.data import ChartDataCommand
+from superset.charts.commands.exceptions import (
+    ChartDataCacheLoadError,
+    ChartDataQueryFailedError,
+)
 from superset.charts.schemas import ChartEntityResponseSchema
 from superset.commands.exceptions import CommandInvalidError
 from superset.commands.importers.v1.utils import get_contents_from_bundle
+from superset.common.query_fusion import fuse_queries
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.dashboards.commands.bulk_delete import BulkDeleteDashboardCommand
 from superset.dashboards.commands.create import CreateDashboardCommand
@@ -58,6 +64,8 @@ from superset.dashboards.filters import (
     FilterRelatedRoles,
 )
 from superset.dashboards.schemas import (
+    DashboardChartDataResponseSchema,
+    DashboardChartDataSchema,
     DashboardDatasetSchema,
     DashboardGetResponseSchema,
     DashboardPostSchema,
@@ -69,10 +77,16 @@ from superset.dashboards.schemas import (
     openapi_spec_methods_override,
     thumbnail_query_schema,
 )
+from superset.exceptions import QueryObjectValidationError
 from superset.extensions import event_logger
 from superset.models.dashboard import Dashboard
 from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.utils.cache import etag_cache
+from superset.utils.core import (
+    ChartDataResultFormat,
+    json_dumps_data,
+    json_int_dttm_ser,
+)
 from superset.utils.screenshots import DashboardScreenshot
 from superset.utils.urls import get_url_path
 from superset.views.base import generate_download_headers
@@ -95,6 +109,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         "bulk_delete",  # not using RouteMethod since locally defined
         "favorite_status",
         "get_charts",
+        "get_chart_data",
         "get_datasets",
     }
     resource_name = "dashboard"
@@ -193,6 +208,8 @@ class DashboardRestApi(BaseSupersetModelRestApi):
     """ Override the name set for this collection of endpoints """
     openapi_spec_component_schemas = (
         ChartEntityResponseSchema,
+        DashboardChartDataSchema,
+        DashboardChartDataResponseSchema,
         DashboardGetResponseSchema,
         DashboardDatasetSchema,
         GetFavStarIdsSchema,
@@ -401,6 +418,91 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         except DashboardNotFoundError:
             return self.response_404()
 
+    @expose("/<id_or_slug>/charts/data", methods=["POST"])
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".get_chart_data",
+        log_to_statsd=False,
+    )
+    def get_chart_data(self, id_or_slug: str) -> Response:
+        """Gets the data of the charts of a dashboard in a single request
+        ---
+        post:
+          description: >-
+            Takes the query contexts of the charts of a dashboard and returns the
+            payload of each of them. Queries of the same dataset with the same
+            filters, time range and groupby are fused into a single query, and the
+            result of each query is still cached on its own.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: id_or_slug
+          requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/DashboardChartDataSchema'
+          responses:
+            200:
+              description: Query results
+              content:
+                application/json:
+                  schema:
+                    $ref: '#/components/schemas/DashboardChartDataResponseSchema'
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            DashboardDAO.get_by_id_or_slug(id_or_slug)
+        except DashboardNotFoundError:
+            return self.response_404()
+        if not request.is_json:
+            return self.response_400(message="Request is not JSON")
+
+        try:
+            queries = DashboardChartDataSchema().load(request.json)["queries"]
+            commands = []
+            query_contexts = []
+            for form_data in queries:
+                command = ChartDataCommand()
+                query_context = command.set_query_context(form_data)
+                if query_context.result_format != ChartDataResultFormat.JSON:
+                    return self.response_400(
+                        message=f"Unsupported result_format: "
+                        f"{query_context.result_format}"
+                    )
+                command.validate()
+                commands.append(command)
+                query_contexts.append(query_context)
+        except QueryObjectValidationError as error:
+            return self.response_400(message=error.message)
+        except ValidationError as error:
+            return self.response_400(message=error.normalized_messages())
+
+        fuse_queries(query_contexts)
+        result = []
+        for command in commands:
+            try:
+                result.append({"result": command.run()["queries"]})
+            except (ChartDataCacheLoadError, ChartDataQueryFailedError) as exc:
+                result.append({"message": exc.message})
+
+        response_data = json_dumps_data({"result": result}, default=json_int_dttm_ser)
+        resp = make_response(response_data, 200)
+        resp.headers["Content-Type"] = "application/json; charset=utf-8"
+        return resp
+
     @expose("/", methods=["POST"])
     @protect()
     @safe
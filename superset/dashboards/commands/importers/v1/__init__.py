@@ -24,6 +24,12 @@ from sqlalchemy.sql import select
 from superset.charts.commands.importers.v1.utils import import_chart
 from superset.charts.schemas import ImportV1ChartSchema
 from superset.commands.importers.v1 import ImportModelsCommand
+from superset.commands.importers.v1.utils import (
+    find_existing,
+    log_import_phase,
+    UUID_BATCH_SIZE,
+)
+from superset.connectors.sqla.models import SqlaTable
 from superset.dashboards.commands.exceptions import DashboardImportError
 from superset.dashboards.commands.importers.v1.utils import (
     find_chart_uuids,
@@ -36,7 +42,9 @@ from superset.databases.commands.importers.v1.utils import import_database
 from superset.databases.schemas import ImportV1DatabaseSchema
 from superset.datasets.commands.importers.v1.utils import import_dataset
 from superset.datasets.schemas import ImportV1DatasetSchema
-from superset.models.dashboard import dashboard_slices
+from superset.models.core import Database
+from superset.models.dashboard import Dashboard, dashboard_slices
+from superset.models.slice import Slice
 
 
 class ImportDashboardsCommand(ImportModelsCommand):
@@ -55,7 +63,7 @@ class ImportDashboardsCommand(ImportModelsCommand):
     import_error = DashboardImportError
 
     # TODO (betodealmeida): refactor to use code from other commands
-    # pylint: disable=too-many-branches, too-many-locals
+    # pylint: disable=too-many-branches, too-many-locals, too-many-statements
     @staticmethod
     def _import(
         session: Session, configs: Dict[str, Any], overwrite: bool = False
@@ -78,51 +86,91 @@ class ImportDashboardsCommand(ImportModelsCommand):
             if file_name.startswith("datasets/") and config["uuid"] in dataset_uuids:
                 database_uuids.add(config["database_uuid"])
 
+        # load the objects that already exist with a few batched lookups, so that
+        # they're not queried one at a time
+        with log_import_phase("dashboard", "lookup"):
+            existing_databases = find_existing(session, Database, database_uuids)
+            existing_datasets = find_existing(session, SqlaTable, dataset_uuids)
+            existing_charts = find_existing(session, Slice, chart_uuids)
+
         # import related databases
         database_ids: Dict[str, int] = {}
-        for file_name, config in configs.items():
-            if file_name.startswith("databases/") and config["uuid"] in database_uuids:
-                database = import_database(session, config, overwrite=False)
-                database_ids[str(database.uuid)] = database.id
-
-        # import datasets with the correct parent ref
+        with log_import_phase("dashboard", "databases"):
+            for file_name, config in configs.items():
+                if (
+                    file_name.startswith("databases/")
+                    and config["uuid"] in database_uuids
+                ):
+                    database = existing_databases.get(
+                        config["uuid"]
+                    ) or import_database(session, config, overwrite=False)
+                    database_ids[str(database.uuid)] = database.id
+
+        # import datasets with the correct parent ref, keeping them referenced so
+        # that the charts find them in the session without querying them again
+        datasets: List[SqlaTable] = []
         dataset_info: Dict[str, Dict[str, Any]] = {}
-        for file_name, config in configs.items():
-            if (
-                file_name.startswith("datasets/")
-                and config["database_uuid"] in database_ids
-            ):
-                config["database_id"] = database_ids[config["database_uuid"]]
-                dataset = import_dataset(session, config, overwrite=False)
-                dataset_info[str(dataset.uuid)] = {
-                    "datasource_id": dataset.id,
-                    "datasource_type": "view" if dataset.is_sqllab_view else "table",
-                    "datasource_name": dataset.table_name,
-                }
+        with log_import_phase("dashboard", "datasets"):
+            for file_name, config in configs.items():
+                if (
+                    file_name.startswith("datasets/")
+                    and config["database_uuid"] in database_ids
+                ):
+                    config["database_id"] = database_ids[config["database_uuid"]]
+                    dataset = existing_datasets.get(config["uuid"]) or import_dataset(
+                        session, config, overwrite=False
+                    )
+                    datasets.append(dataset)
+                    dataset_info[str(dataset.uuid)] = {
+                        "datasource_id": dataset.id,
+                        "datasource_type": "view"
+                        if dataset.is_sqllab_view
+                        else "table",
+                        "datasource_name": dataset.table_name,
+                    }
 
         # import charts with the correct parent ref
         chart_ids: Dict[str, int] = {}
-        for file_name, config in configs.items():
-            if (
-                file_name.startswith("charts/")
-                and config["dataset_uuid"] in dataset_info
-            ):
-                # update datasource id, type, and name
-                config.update(dataset_info[config["dataset_uuid"]])
-                chart = import_chart(session, config, overwrite=False)
-                chart_ids[str(chart.uuid)] = chart.id
-
-        # store the existing relationship between dashboards and charts
-        existing_relationships = session.execute(
-            select([dashboard_slices.c.dashboard_id, dashboard_slices.c.slice_id])
-        ).fetchall()
+        with log_import_phase("dashboard", "charts"):
+            for file_name, config in configs.items():
+                if (
+                    file_name.startswith("charts/")
+                    and config["dataset_uuid"] in dataset_info
+                ):
+                    # update datasource id, type, and name
+                    config.update(dataset_info[config["dataset_uuid"]])
+                    chart = existing_charts.get(config["uuid"]) or import_chart(
+                        session, config, overwrite=False
+                    )
+                    chart_ids[str(chart.uuid)] = chart.id
 
         # import dashboards
-        dashboard_chart_ids: List[Tuple[int, int]] = []
-        for file_name, config in configs.items():
-            if file_name.startswith("dashboards/"):
-                config = update_id_refs(config, chart_ids)
-                dashboard = import_dashboard(session, config, overwrite=overwrite)
+        dashboards: List[Tuple[Dashboard, Dict[str, Any]]] = []
+        with log_import_phase("dashboard", "dashboards"):
+            for file_name, config in configs.items():
+                if file_name.startswith("dashboards/"):
+                    config = update_id_refs(config, chart_ids)
+                    dashboard = import_dashboard(session, config, overwrite=overwrite)
+                    dashboards.append((dashboard, config))
+
+        with log_import_phase("dashboard", "relationships"):
+            # store the existing relationship between the dashboards and charts
+            existing_relationships: Set[Tuple[int, int]] = set()
+            dashboard_ids = [dashboard.id for dashboard, _ in dashboards]
+            for i in range(0, len(dashboard_ids), UUID_BATCH_SIZE):
+                rows = session.execute(
+                    select(
+                        [dashboard_slices.c.dashboard_id, dashboard_slices.c.slice_id]
+                    ).where(
+                        dashboard_slices.c.dashboard_id.in_(
+                            dashboard_ids[i : i + UUID_BATCH_SIZE]
+                        )
+                    )
+                )
+                existing_relationships.update(tuple(row) for row in rows)
+
+            dashboard_chart_ids: List[Tuple[int, int]] = []
+            for dashboard, config in dashboards:
                 for uuid in find_chart_uuids(config["position"]):
                     if uuid not in chart_ids:
                         break
@@ -130,10 +178,10 @@ class ImportDashboardsCommand(ImportModelsCommand):
                     if (dashboard.id, chart_id) not in existing_relationships:
                         dashboard_chart_ids.append((dashboard.id, chart_id))
 
-        # set ref in the dashboard_slices table
-        values = [
-            {"dashboard_id": dashboard_id, "slice_id": chart_id}
-            for (dashboard_id, chart_id) in dashboard_chart_ids
-        ]
-        # pylint: disable=no-value-for-parameter (sqlalchemy/issues/4656)
-        session.execute(dashboard_slices.insert(), values)
+            # set ref in the dashboard_slices table
+            values = [
+                {"dashboard_id": dashboard_id, "slice_id": chart_id}
+                for (dashboard_id, chart_id) in dashboard_chart_ids
+            ]
+            # pylint: disable=no-value-for-parameter (sqlalchemy/issues/4656)
+            session.execute(dashboard_slices.insert(), values)
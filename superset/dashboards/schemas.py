@@ -277,6 +277,24 @@ class GetFavStarIdsSchema(Schema):
     )
 
 
+class DashboardChartDataSchema(Schema):
+    queries = fields.List(
+        fields.Dict(),
+        required=True,
+        description="The query contexts of the charts of the dashboard, as posted "
+        "to `/api/v1/chart/data`. Queries of the same dataset that only differ in "
+        "their metrics are run as a single query.",
+    )
+
+
+class DashboardChartDataResponseSchema(Schema):
+    result = fields.List(
+        fields.Dict(),
+        description="A response for each query context of the request, with the "
+        "`result` or the error `message` of `/api/v1/chart/data`",
+    )
+
+
 class ImportV1DashboardSchema(Schema):
     dashboard_title = fields.String(required=True)
     description = fields.String(allow_none=True)
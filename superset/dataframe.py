@@ -17,9 +17,11 @@
 """ Superset utilities for pandas.DataFrame.
 """
 import warnings
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 
 from superset.utils.core import JS_MAX_INTEGER
 
@@ -53,3 +55,92 @@ def df_to_records(dframe: pd.DataFrame) -> List[Dict[str, Any]]:
         dict(zip(columns, map(_convert_big_integers, row)))
         for row in zip(*[dframe[col] for col in columns])
     )
+
+
+def _map_timestamps(
+    column: pd.Series, func: Callable[[pd.Timestamp], Any]
+) -> List[Any]:
+    return [None if pd.isna(val) else func(val) for val in column.tolist()]
+
+
+def _datetime_column_to_epoch(column: pd.Series) -> List[Any]:
+    """
+    Convert a datetime column to milliseconds since epoch, reading the wall time of
+    timezone aware values as UTC like ``datetime_to_epoch`` does.
+    """
+    if column.dt.tz is not None:
+        column = column.dt.tz_localize(None)
+    values = column.to_numpy().view("i8")
+    # same rounding as ``timedelta.total_seconds() * 1000``
+    result = (values // 1000 / 1e6 * 1000).astype(object)
+    result[column.isna().to_numpy()] = None
+    return result.tolist()
+
+
+def _datetime_column_to_iso(column: pd.Series) -> List[Any]:
+    """
+    Convert a datetime column to the strings ``Timestamp.isoformat`` returns.
+    """
+    values = column.to_numpy()
+    if column.dt.tz is not None or (values.view("i8") % 1000).any():
+        # offsets and nanoseconds are rare enough to format them one at a time
+        return _map_timestamps(column, lambda val: val.isoformat())
+    nanos = values.view("i8")
+    result = np.where(
+        nanos % 1_000_000_000 == 0,
+        np.datetime_as_string(values, unit="s"),
+        np.datetime_as_string(values, unit="us"),
+    ).astype(object)
+    result[column.isna().to_numpy()] = None
+    return result.tolist()
+
+
+def _column_to_json_values(
+    column: pd.Series, dttm_format: str, convert_big_integers: bool
+) -> List[Any]:
+    dtype = column.dtype
+    if is_datetime64_any_dtype(dtype):
+        if dttm_format == "epoch":
+            return _datetime_column_to_epoch(column)
+        return _datetime_column_to_iso(column)
+    if convert_big_integers and isinstance(dtype, np.dtype):
+        if dtype.kind in "iu":
+            values = column.to_numpy()
+            big = (values > JS_MAX_INTEGER) | (values < -JS_MAX_INTEGER)
+            if big.any():
+                result = values.astype(object)
+                result[big] = [str(val) for val in values[big].tolist()]
+                return result.tolist()
+        elif dtype.kind == "O":
+            return [_convert_big_integers(val) for val in column.tolist()]
+    return column.tolist()
+
+
+def df_to_json_records(
+    dframe: pd.DataFrame, dttm_format: str = "iso", convert_big_integers: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame to a set of records ready to be encoded to JSON, one column
+    at a time.
+
+    Datetime columns are converted to ISO 8601 strings or to milliseconds since
+    epoch, with missing values as ``None``. NaN floats are kept and encoded as null.
+
+    :param dframe: the DataFrame to convert
+    :param dttm_format: ``iso`` or ``epoch``, how datetime columns are converted
+    :param convert_big_integers: whether integers larger than ``JS_MAX_INTEGER``
+        are cast to strings
+    :returns: a list of dictionaries reflecting each single row of the DataFrame
+    """
+    if not dframe.columns.is_unique:
+        warnings.warn(
+            "DataFrame columns are not unique, some columns will be omitted.",
+            UserWarning,
+            stacklevel=2,
+        )
+    values = [
+        _column_to_json_values(dframe.iloc[:, i], dttm_format, convert_big_integers)
+        for i in range(len(dframe.columns))
+    ]
+    columns = list(dframe.columns)
+    return [dict(zip(columns, row)) for row in zip(*values)]
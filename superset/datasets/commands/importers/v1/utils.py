@@ -136,13 +136,6 @@ def load_data(
     data = request.urlopen(data_uri)
     if data_uri.endswith(".gz"):
         data = gzip.open(data)
-    df = pd.read_csv(data, encoding="utf-8")
-    dtype = get_dtype(df, dataset)
-
-    # convert temporal columns
-    for column_name, sqla_type in dtype.items():
-        if isinstance(sqla_type, (Date, DateTime)):
-            df[column_name] = pd.to_datetime(df[column_name])
 
     # reuse session when loading data if possible, to make import atomic
     if example_database.sqlalchemy_uri == current_app.config.get(
@@ -154,13 +147,25 @@ def load_data(
         logger.warning("Loading data outside the import transaction")
         connection = example_database.get_sqla_engine()
 
-    df.to_sql(
-        dataset.table_name,
-        con=connection,
-        schema=dataset.schema,
-        if_exists="replace",
-        chunksize=CHUNKSIZE,
-        dtype=dtype,
-        index=False,
-        method="multi",
+    # stream the data into the table instead of loading it in memory at once
+    chunks = pd.read_csv(
+        data, encoding="utf-8", chunksize=current_app.config["IMPORT_DATA_CHUNK_SIZE"]
     )
+    for i, df in enumerate(chunks):
+        dtype = get_dtype(df, dataset)
+
+        # convert temporal columns
+        for column_name, sqla_type in dtype.items():
+            if isinstance(sqla_type, (Date, DateTime)):
+                df[column_name] = pd.to_datetime(df[column_name])
+
+        df.to_sql(
+            dataset.table_name,
+            con=connection,
+            schema=dataset.schema,
+            if_exists="replace" if i == 0 else "append",
+            chunksize=CHUNKSIZE,
+            dtype=dtype,
+            index=False,
+            method="multi",
+        )
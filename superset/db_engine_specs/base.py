@@ -15,15 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 # pylint: disable=unused-argument
+import itertools
 import json
 import logging
 import re
+import uuid
 from contextlib import closing
 from datetime import datetime
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Match,
     NamedTuple,
@@ -37,6 +41,8 @@ from typing import (
 )
 
 import pandas as pd
+import pyarrow as pa
+import sqlalchemy as sa
 import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -44,7 +50,7 @@ from flask import current_app, g
 from flask_babel import gettext as __, lazy_gettext as _
 from marshmallow import fields, Schema
 from sqlalchemy import column, DateTime, select, types
-from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import make_url, URL
@@ -131,6 +137,72 @@ def compile_timegrain_expression(
     return element.name.replace("{col}", compiler.process(element.col, **kwargs))
 
 
+BULK_LOAD_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def bulk_load_text_rows(rows: Iterable[Iterable[Any]]) -> Iterator[str]:
+    """
+    Format rows in the tab separated text format understood by the bulk loaders of
+    PostgreSQL (`COPY ... FROM STDIN`) and MySQL (`LOAD DATA`), where nulls are
+    written as `\\N` and backslashes, tabs and newlines are escaped.
+
+    :param rows: Rows of values, as passed by `pandas.DataFrame.to_sql` to a custom
+           insertion method
+    :return: Lines of text, including the trailing newline
+    """
+    for row in rows:
+        values = []
+        for value in row:
+            if value is None:
+                values.append("\\N")
+                continue
+            if isinstance(value, bool):
+                value = int(value)
+            values.append(str(value).translate(BULK_LOAD_ESCAPES))
+        yield "\t".join(values) + "\n"
+
+
+def cast_to_nullable_integers(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    Cast float columns holding only integral values to the nullable integer type,
+    as pandas turns integer columns having nulls into floats, which would be
+    written with a fraction, e.g. `3.0`, that integer columns can't be loaded from.
+
+    :param df: Dataframe to cast
+    :param columns: Names of the columns that are expected to hold integers
+    :return: Dataframe with the columns cast, if any
+    """
+    casts = {
+        column: "Int64"
+        for column in columns
+        if column in df.columns
+        and pd.api.types.is_float_dtype(df[column])
+        and (df[column].dropna() % 1 == 0).all()
+    }
+    return df.astype(casts) if casts else df
+
+
+def get_sqla_table(
+    connection: Connection, table: Table, autoload: bool = False
+) -> sa.Table:
+    """
+    Get the SQLAlchemy table of a table, e.g. to compile DDL statements with the
+    identifiers quoted for the dialect of the connection.
+
+    :param connection: The connection to the database
+    :param table: The table
+    :param autoload: Whether to reflect the columns of the table
+    :return: The SQLAlchemy table
+    """
+    return sa.Table(
+        table.table,
+        sa.MetaData(),
+        schema=table.schema,
+        autoload=autoload,
+        autoload_with=connection if autoload else None,
+    )
+
+
 class LimitMethod:  # pylint: disable=too-few-public-methods
     """Enum the ways that limits can be applied"""
 
@@ -252,6 +324,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     time_secondary_columns = False
     allows_joins = True
     allows_subqueries = True
+    # Whether `(col1, col2) IN ((val1, val2), ...)` predicates are supported, used
+    # to filter on the top series returned by a series limit prequery
+    allows_tuple_in = False
     allows_alias_in_select = True
     allows_alias_in_orderby = True
     allows_sql_comments = True
@@ -264,6 +339,14 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if TRUE, then it doesn't have to.
     allows_hidden_ordeby_agg = True
 
+    # Whether uploaded files can be written to a table in chunks, i.e. whether
+    # `df_to_sql` supports appending to the table it has just created
+    supports_chunked_upload = True
+    # Whether the new name of a table renamed with `ALTER TABLE ... RENAME TO` is
+    # qualified with its schema, which some engines require to keep the table in
+    # its schema while others reject
+    rename_table_to_qualified_name = True
+
     force_column_alias_quotes = False
     arraysize = 0
     max_column_name_length = 0
@@ -304,6 +387,19 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     def get_allow_cost_estimate(cls, extra: Dict[str, Any]) -> bool:
         return False
 
+    @classmethod
+    def get_series_limit_strategy(cls) -> utils.SeriesLimitStrategy:
+        """
+        Get how queries with a series limit are restricted to their top series.
+        Engines that support joins but plan them poorly can override this method to
+        run a prequery instead.
+
+        :return: Series limit strategy
+        """
+        if cls.allows_joins:
+            return utils.SeriesLimitStrategy.JOIN
+        return utils.SeriesLimitStrategy.PREQUERY
+
     @classmethod
     def get_engine(
         cls,
@@ -484,6 +580,46 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex)
 
+    @classmethod
+    def fetch_batches(
+        cls, cursor: Any, batch_size: int, limit: Optional[int] = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Fetch the result of a query incrementally, as Arrow record batches, so the
+        full result never needs to be held as Python rows. Engines whose driver
+        supports fetching Arrow or columnar data natively can override this method
+        to skip the creation of Python row objects altogether.
+
+        :param cursor: Cursor instance
+        :param batch_size: Maximum number of rows per batch
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Record batches with the columns of the cursor description
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.result_set import ColumnarBuilder, dedup
+
+        if not cursor.description:
+            return
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+
+        builder = ColumnarBuilder(list(cursor.description), cls)
+        column_names = dedup([col[0] for col in cursor.description])
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            try:
+                rows = cursor.fetchmany(size)
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex)
+            if not rows:
+                break
+            yield pa.RecordBatch.from_arrays(
+                builder.convert_rows(rows), names=column_names
+            )
+            if remaining is not None:
+                remaining -= len(rows)
+
     @classmethod
     def expand_data(
         cls, columns: List[Dict[Any, Any]], data: List[Dict[Any, Any]]
@@ -650,11 +786,176 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             # Only add schema when it is preset and non empty.
             to_sql_kwargs["schema"] = table.schema
 
-        if engine.dialect.supports_multivalues_insert:
-            to_sql_kwargs["method"] = "multi"
+        method = cls.get_df_to_sql_method(database, engine)
+        if method:
+            to_sql_kwargs["method"] = method
 
         df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def get_df_to_sql_method(
+        cls, database: "Database", engine: Engine
+    ) -> Optional[Union[str, Callable[..., None]]]:
+        """
+        Return the `method` used by `pandas.DataFrame.to_sql` to insert rows. Can be
+        overridden to plug in an engine-native bulk loader, taking the pandas table,
+        the SQLAlchemy connection, the column names and an iterator of rows.
+
+        :param database: The database the data is uploaded to
+        :param engine: The SQLAlchemy engine of the database
+        :return: `"multi"`, `None` (one `executemany` call per chunk) or a callable
+        """
+        if engine.dialect.supports_multivalues_insert:
+            return "multi"
+        return None
+
+    @classmethod
+    def dfs_to_sql(  # pylint: disable=too-many-arguments
+        cls,
+        database: "Database",
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: Dict[str, Any],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Upload data from an iterable of Pandas DataFrames to a database, one at a
+        time, so that only a single chunk of a large file is held in memory.
+
+        The table is created from the first chunk according to the `if_exists`
+        argument, and the following chunks are appended to it, with the integer
+        columns of the first chunk kept as integers. Engines that don't
+        support chunked uploads get the concatenated chunks in a single call to
+        `df_to_sql`.
+
+        When there are several chunks, they are loaded into a staging table which
+        only replaces, or is appended to, the table once all of them were loaded,
+        so that a chunk failing to be read or loaded leaves the table untouched.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param dfs: The dataframes with the data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        :param progress: Called with the number of rows uploaded so far
+        :return: The number of uploaded rows
+        """
+        if not cls.supports_chunked_upload:
+            dfs = [pd.concat(dfs)]
+
+        chunks = iter(dfs)
+        first_chunks = list(itertools.islice(chunks, 2))
+        if len(first_chunks) < 2:
+            return cls._chunks_to_sql(
+                database, table, first_chunks, to_sql_kwargs, progress
+            )
+
+        engine = cls.get_engine(database)
+        if_exists = to_sql_kwargs.get("if_exists", "fail")
+        if if_exists == "fail" and engine.has_table(table.table, schema=table.schema):
+            raise ValueError(f"Table '{table.table}' already exists.")
+
+        staging_table = Table(
+            table=f"superset_upload_{uuid.uuid4().hex[:16]}", schema=table.schema
+        )
+        try:
+            rows = cls._chunks_to_sql(
+                database,
+                staging_table,
+                itertools.chain(first_chunks, chunks),
+                {**to_sql_kwargs, "if_exists": "fail"},
+                progress,
+            )
+            with engine.begin() as connection:
+                cls.load_staging_table(connection, staging_table, table, if_exists)
+        except Exception:
+            with engine.begin() as connection:
+                get_sqla_table(connection, staging_table).drop(
+                    connection, checkfirst=True
+                )
+            raise
+        return rows
+
+    @classmethod
+    def _chunks_to_sql(  # pylint: disable=too-many-arguments
+        cls,
+        database: "Database",
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: Dict[str, Any],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        rows = 0
+        int_columns: Optional[List[str]] = None
+        for df in dfs:
+            if int_columns is None:
+                int_columns = [
+                    column
+                    for column, dtype in df.dtypes.items()
+                    if pd.api.types.is_integer_dtype(dtype)
+                ]
+            else:
+                df = cast_to_nullable_integers(df, int_columns)
+            cls.df_to_sql(database, table, df, dict(to_sql_kwargs))
+            to_sql_kwargs = {**to_sql_kwargs, "if_exists": "append"}
+            rows += len(df.index)
+            if progress:
+                progress(rows)
+        return rows
+
+    @classmethod
+    def load_staging_table(
+        cls, connection: Connection, staging_table: Table, table: Table, if_exists: str,
+    ) -> None:
+        """
+        Move the rows of a staging table that a file was uploaded to into the
+        table, according to the `if_exists` argument of the upload, and drop it.
+
+        :param connection: The connection to the database
+        :param staging_table: The staging table holding the uploaded rows
+        :param table: The table the file is uploaded to
+        :param if_exists: `fail`, `replace` or `append`
+        """
+        staging = get_sqla_table(connection, staging_table, autoload=True)
+        columns = [column.name for column in staging.columns]
+        target = sa.Table(
+            table.table,
+            sa.MetaData(),
+            *[sa.Column(column) for column in columns],
+            schema=table.schema,
+        )
+        if if_exists == "append" and target.exists(connection):
+            connection.execute(
+                sa.insert(target).from_select(columns, sa.select([staging]))
+            )
+            staging.drop(connection)
+            return
+
+        if if_exists == "replace":
+            target.drop(connection, checkfirst=True)
+        cls.rename_table(connection, staging_table, table.table)
+
+    @classmethod
+    def rename_table(cls, connection: Connection, table: Table, name: str) -> None:
+        """
+        Rename a table, keeping it in its schema.
+
+        :param connection: The connection to the database
+        :param table: The table to rename
+        :param name: The new name of the table
+        """
+        preparer = connection.dialect.identifier_preparer
+        new_name = (
+            preparer.format_table(
+                get_sqla_table(connection, Table(table=name, schema=table.schema))
+            )
+            if cls.rename_table_to_qualified_name
+            else preparer.quote(name)
+        )
+        connection.execute(
+            f"ALTER TABLE {preparer.format_table(get_sqla_table(connection, table))} "
+            f"RENAME TO {new_name}"
+        )
+
     @classmethod
     def convert_dttm(cls, target_type: str, dttm: datetime) -> Optional[str]:
         """
@@ -18,9 +18,8 @@ import logging
 import os
 import re
 import tempfile
-import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from urllib import parse
 
 import numpy as np
@@ -38,7 +37,7 @@ from sqlalchemy.sql.expression import ColumnClause, Select
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.db_engine_specs.presto import PrestoEngineSpec
 from superset.exceptions import SupersetException
-from superset.extensions import cache_manager
+from superset.extensions import cache_manager, query_progress_channel
 from superset.models.sql_lab import Query
 from superset.sql_parse import ParsedQuery, Table
 from superset.utils import core as utils
@@ -91,6 +90,8 @@ class HiveEngineSpec(PrestoEngineSpec):
     max_column_name_length = 767
     allows_alias_to_source_column = True
     allows_hidden_ordeby_agg = False
+    # `df_to_sql` writes a new table from a single Parquet file
+    supports_chunked_upload = False
 
     # When running `SHOW FUNCTIONS`, what is the name of the column with the
     # function names?
@@ -163,6 +164,21 @@ class HiveEngineSpec(PrestoEngineSpec):
         except pyhive.exc.ProgrammingError:
             return []
 
+    @classmethod
+    def fetch_batches(
+        cls, cursor: Any, batch_size: int, limit: Optional[int] = None
+    ) -> Iterator[pa.RecordBatch]:
+        import pyhive
+        from TCLIService import ttypes
+
+        state = cursor.poll()
+        if state.operationState == ttypes.TOperationState.ERROR_STATE:
+            raise Exception("Query error", state.errorMessage)
+        try:
+            yield from super().fetch_batches(cursor, batch_size, limit)
+        except pyhive.exc.ProgrammingError:
+            return
+
     @classmethod
     def df_to_sql(
         cls,
@@ -325,52 +341,54 @@ class HiveEngineSpec(PrestoEngineSpec):
         tracking_url = None
         job_id = None
         query_id = query.id
-        while polled.operationState in unfinished_states:
-            query = session.query(type(query)).filter_by(id=query_id).one()
-            if query.status == QueryStatus.STOPPED:
-                cursor.cancel()
-                break
-
-            log = cursor.fetch_logs() or ""
-            if log:
-                log_lines = log.splitlines()
-                progress = cls.progress(log_lines)
-                logger.info(
-                    "Query %s: Progress total: %s", str(query_id), str(progress)
-                )
-                needs_commit = False
-                if progress > query.progress:
-                    query.progress = progress
-                    needs_commit = True
-                if not tracking_url:
-                    tracking_url = cls.get_tracking_url(log_lines)
-                    if tracking_url:
-                        job_id = tracking_url.split("/")[-2]
-                        logger.info(
-                            "Query %s: Found the tracking url: %s",
-                            str(query_id),
-                            tracking_url,
-                        )
-                        tracking_url = current_app.config["TRACKING_URL_TRANSFORMER"]
-                        logger.info(
-                            "Query %s: Transformation applied: %s",
-                            str(query_id),
-                            tracking_url,
-                        )
-                        query.tracking_url = tracking_url
-                        logger.info("Query %s: Job id: %s", str(query_id), str(job_id))
-                        needs_commit = True
-                if job_id and len(log_lines) > last_log_line:
-                    # Wait for job id before logging things out
-                    # this allows for prefixing all log lines and becoming
-                    # searchable in something like Kibana
-                    for l in log_lines[last_log_line:]:
-                        logger.info("Query %s: [%s] %s", str(query_id), str(job_id), l)
-                    last_log_line = len(log_lines)
-                if needs_commit:
-                    session.commit()
-            time.sleep(current_app.config["HIVE_POLL_INTERVAL"])
-            polled = cursor.poll()
+        with query_progress_channel.track(
+            query, session, current_app.config["HIVE_POLL_INTERVAL"]
+        ) as tracker:
+            while polled.operationState in unfinished_states:
+                if tracker.is_stopped():
+                    cursor.cancel()
+                    break
+
+                log = cursor.fetch_logs() or ""
+                if log:
+                    log_lines = log.splitlines()
+                    progress = cls.progress(log_lines)
+                    logger.info(
+                        "Query %s: Progress total: %s", str(query_id), str(progress)
+                    )
+                    tracker.set_progress(progress)
+                    if not tracking_url:
+                        tracking_url = cls.get_tracking_url(log_lines)
+                        if tracking_url:
+                            job_id = tracking_url.split("/")[-2]
+                            logger.info(
+                                "Query %s: Found the tracking url: %s",
+                                str(query_id),
+                                tracking_url,
+                            )
+                            tracking_url = current_app.config[
+                                "TRACKING_URL_TRANSFORMER"
+                            ]
+                            logger.info(
+                                "Query %s: Transformation applied: %s",
+                                str(query_id),
+                                tracking_url,
+                            )
+                            tracker.commit(tracking_url=tracking_url)
+                            logger.info(
+                                "Query %s: Job id: %s", str(query_id), str(job_id)
+                            )
+                    if job_id and len(log_lines) > last_log_line:
+                        # Wait for job id before logging things out
+                        # this allows for prefixing all log lines and becoming
+                        # searchable in something like Kibana
+                        for l in log_lines[last_log_line:]:
+                            logger.info(
+                                "Query %s: [%s] %s", str(query_id), str(job_id), l
+                            )
+                        last_log_line = len(log_lines)
+                tracker.wait()
+                polled = cursor.poll()
 
     @classmethod
     def get_columns(
@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import io
 import json
 import logging
 import re
@@ -22,6 +23,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Match,
     Optional,
@@ -31,13 +33,19 @@ from typing import (
     Union,
 )
 
+import pyarrow as pa
 from flask_babel import gettext as __
 from pytz import _FixedOffset  # type: ignore
 from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.types import String, TypeEngine
 
-from superset.db_engine_specs.base import BaseEngineSpec, BaseParametersMixin
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    BaseParametersMixin,
+    bulk_load_text_rows,
+)
 from superset.errors import SupersetErrorType
 from superset.exceptions import SupersetException
 from superset.utils import core as utils
@@ -87,6 +95,7 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
 
     engine = ""
     engine_name = "PostgreSQL"
+    rename_table_to_qualified_name = False
 
     _time_grain_expressions = {
         None: "{col}",
@@ -143,6 +152,13 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
             return []
         return super().fetch_data(cursor, limit)
 
+    @classmethod
+    def fetch_batches(
+        cls, cursor: Any, batch_size: int, limit: Optional[int] = None
+    ) -> Iterator[pa.RecordBatch]:
+        cursor.tzinfo_factory = FixedOffsetTimezone
+        return super().fetch_batches(cursor, batch_size, limit)
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "(timestamp 'epoch' + {col} * interval '1 second')"
@@ -151,6 +167,7 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
 class PostgresEngineSpec(PostgresBaseEngineSpec, BaseParametersMixin):
     engine = "postgresql"
     engine_aliases = {"postgres"}
+    allows_tuple_in = True
 
     drivername = "postgresql+psycopg2"
     sqlalchemy_uri_placeholder = (
@@ -219,6 +236,37 @@ class PostgresEngineSpec(PostgresBaseEngineSpec, BaseParametersMixin):
             return f"""TO_TIMESTAMP('{dttm_formatted}', 'YYYY-MM-DD HH24:MI:SS.US')"""
         return None
 
+    @classmethod
+    def get_df_to_sql_method(
+        cls, database: "Database", engine: Engine
+    ) -> Optional[Union[str, Callable[..., None]]]:
+        if engine.dialect.driver == "psycopg2":
+            return cls.copy_from_stdin
+        return super().get_df_to_sql_method(database, engine)
+
+    @staticmethod
+    def copy_from_stdin(
+        pd_table: Any, conn: Connection, keys: List[str], data_iter: Iterator[Any]
+    ) -> None:
+        """
+        Insert rows with `COPY ... FROM STDIN`, which is much faster than batches of
+        multi-row `INSERT` statements.
+        """
+        # not using the SQLAlchemy identifier preparer, which escapes `%` for the
+        # DBAPI parameter substitution that `copy_expert` doesn't do
+        def quote(identifier: str) -> str:
+            return '"' + identifier.replace('"', '""') + '"'
+
+        table = quote(pd_table.name)
+        if pd_table.schema:
+            table = f"{quote(pd_table.schema)}.{table}"
+        columns = ", ".join(quote(key) for key in keys)
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table} ({columns}) FROM STDIN",
+                io.StringIO("".join(bulk_load_text_rows(data_iter))),
+            )
+
     @staticmethod
     def get_extra_params(database: "Database") -> Dict[str, Any]:
         """
@@ -18,7 +18,7 @@ import logging
 import re
 import textwrap
 import time
-from collections import defaultdict, deque
+from collections import deque
 from contextlib import closing
 from datetime import datetime
 from distutils.version import StrictVersion
@@ -54,6 +54,7 @@ from superset import cache_manager, is_feature_enabled
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.errors import SupersetErrorType
 from superset.exceptions import SupersetTemplateException
+from superset.extensions import query_progress_channel
 from superset.models.sql_lab import Query
 from superset.models.sql_types.presto_sql_types import (
     Array,
@@ -144,10 +145,92 @@ def get_children(column: Dict[str, str]) -> List[Dict[str, str]]:
     raise Exception(f"Unknown type {type_}!")
 
 
+# placeholder of the values missing from the rows being expanded by `expand_data`
+MISSING = object()
+
+
+def unnest_array_column(
+    table: Dict[str, List[Any]], name: str, num_rows: int, unnested_rows: List[int]
+) -> Tuple[int, List[int]]:
+    """
+    Unnest the arrays of a column into consecutive rows, in place.
+
+    Each row whose array has more elements than the rows already unnested after
+    it is followed by new rows, missing the values of the other columns. The
+    rows are then gathered by index for all the columns at once, rather than
+    inserted one at a time.
+
+    :param table: Values of the rows by column name
+    :param name: Name of the array column
+    :param num_rows: Number of rows
+    :param unnested_rows: Number of rows unnested after each row at the current
+           level of nested arrays
+    :return: The new number of rows, and of rows unnested after each row
+    """
+    arrays = table[name]
+    # index of the original row of each new row, `num_rows` for the added ones
+    indices: List[int] = []
+    new_unnested_rows: List[int] = []
+    new_values: List[Any] = []
+    i = 0
+    while i < num_rows:
+        values = arrays[i]
+        if isinstance(values, str):
+            values = destringify(values)
+        if values and values is not MISSING:
+            current_unnested_rows = unnested_rows[i]
+            missing = max(len(values) - 1 - current_unnested_rows, 0)
+            block = current_unnested_rows + 1
+            indices.extend(range(i, i + block))
+            indices.extend([num_rows] * missing)
+            new_unnested_rows.append(current_unnested_rows + missing)
+            new_unnested_rows.extend([0] * (block + missing - 1))
+            # the rows already unnested beyond the length of the array keep
+            # their values
+            new_values.extend(values)
+            new_values.extend(arrays[i + len(values) : i + block])
+            i += block
+        else:
+            indices.append(i)
+            new_unnested_rows.append(unnested_rows[i])
+            new_values.append(values)
+            i += 1
+
+    if len(indices) != num_rows:
+        for column_name, column_values in table.items():
+            column_values.append(MISSING)
+            table[column_name] = [column_values[index] for index in indices]
+    table[name] = new_values
+    return len(indices), new_unnested_rows
+
+
+def expand_row_column(
+    table: Dict[str, List[Any]], name: str, children: List[str], num_rows: int
+) -> None:
+    """
+    Expand the fields of the rows of a column into new columns, in place.
+
+    :param table: Values of the rows by column name
+    :param name: Name of the row column
+    :param children: Names of the columns of the fields
+    :param num_rows: Number of rows
+    """
+    rows = table[name]
+    for i, values in enumerate(rows):
+        if isinstance(values, str):
+            rows[i] = destringify(values)
+    for position, child in enumerate(children):
+        child_values = table.setdefault(child, [MISSING] * num_rows)
+        for i, values in enumerate(rows):
+            if values and values is not MISSING and position < len(values):
+                child_values[i] = values[position]
+
+
 class PrestoEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-methods
     engine = "presto"
     engine_name = "Presto"
     allows_alias_to_source_column = False
+    allows_tuple_in = True
 
     _time_grain_expressions = {
         None: "{col}",
@@ -796,16 +879,27 @@ class PrestoEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-metho
         if not is_feature_enabled("PRESTO_EXPAND_DATA"):
             return columns, data, []
 
+        # the data is processed column by column, rows missing a value being
+        # blank in the expanded data set
+        num_rows = len(data)
+        table: Dict[str, List[Any]] = {
+            column["name"]: [row.get(column["name"], MISSING) for row in data]
+            for column in columns
+        }
+
         # process each column, unnesting ARRAY types and
         # expanding ROW types into new columns
         to_process = deque((column, 0) for column in columns)
         all_columns: List[Dict[str, Any]] = []
+        all_column_names = set()
         expanded_columns = []
         current_array_level = None
         while to_process:
             column, level = to_process.popleft()
-            if column["name"] not in [column["name"] for column in all_columns]:
+            name = column["name"]
+            if name not in all_column_names:
                 all_columns.append(column)
+                all_column_names.add(name)
 
             # When unnesting arrays we need to keep track of how many extra rows
             # were added, for each original row. This is necessary when we expand
@@ -813,45 +907,16 @@ class PrestoEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-metho
             # added by the first. every time we change a level in the nested arrays
             # we reinitialize this.
             if level != current_array_level:
-                unnested_rows: Dict[int, int] = defaultdict(int)
+                unnested_rows = [0] * num_rows
                 current_array_level = level
 
-            name = column["name"]
-            values: Optional[Union[str, List[Any]]]
-
             if column["type"].startswith("ARRAY("):
                 # keep processing array children; we append to the right so that
                 # multiple nested arrays are processed breadth-first
                 to_process.append((get_children(column)[0], level + 1))
-
-                # unnest array objects data into new rows
-                i = 0
-                while i < len(data):
-                    row = data[i]
-                    values = row.get(name)
-                    if isinstance(values, str):
-                        row[name] = values = destringify(values)
-                    if values:
-                        # how many extra rows we need to unnest the data?
-                        extra_rows = len(values) - 1
-
-                        # how many rows were already added for this row?
-                        current_unnested_rows = unnested_rows[i]
-
-                        # add any necessary rows
-                        missing = extra_rows - current_unnested_rows
-                        for _ in range(missing):
-                            data.insert(i + current_unnested_rows + 1, {})
-                            unnested_rows[i] += 1
-
-                        # unnest array into rows
-                        for j, value in enumerate(values):
-                            data[i + j][name] = value
-
-                        # skip newly unnested rows
-                        i += unnested_rows[i]
-
-                    i += 1
+                num_rows, unnested_rows = unnest_array_column(
+                    table, name, num_rows, unnested_rows
+                )
 
             if column["type"].startswith("ROW("):
                 # expand columns; we append them to the left so they are added
@@ -859,18 +924,18 @@ class PrestoEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-metho
                 expanded = get_children(column)
                 to_process.extendleft((column, level) for column in expanded[::-1])
                 expanded_columns.extend(expanded)
+                expand_row_column(
+                    table, name, [child["name"] for child in expanded], num_rows
+                )
 
-                # expand row objects into new columns
-                for row in data:
-                    values = row.get(name) or []
-                    if isinstance(values, str):
-                        row[name] = values = cast(List[Any], destringify(values))
-                    for value, col in zip(values, expanded):
-                        row[col["name"]] = value
-
-        data = [
-            {k["name"]: row.get(k["name"], "") for k in all_columns} for row in data
+        names = [column["name"] for column in all_columns]
+        values = [
+            ["" if value is MISSING else value for value in table[name]]
+            if name in table
+            else [""] * num_rows
+            for name in names
         ]
+        data = [dict(zip(names, row)) for row in zip(*values)]
 
         return all_columns, data, expanded_columns
 
@@ -948,36 +1013,34 @@ class PrestoEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-metho
         # if the query is done
         # https://github.com/dropbox/PyHive/blob/
         # b34bdbf51378b3979eaf5eca9e956f06ddc36ca0/pyhive/presto.py#L178
-        while polled:
-            # Update the object and wait for the kill signal.
-            stats = polled.get("stats", {})
+        with query_progress_channel.track(query, session, poll_interval) as tracker:
+            while polled:
+                # Update the object and wait for the kill signal.
+                stats = polled.get("stats", {})
 
-            query = session.query(type(query)).filter_by(id=query_id).one()
-            if query.status in [QueryStatus.STOPPED, QueryStatus.TIMED_OUT]:
-                cursor.cancel()
-                break
-
-            if stats:
-                state = stats.get("state")
-
-                # if already finished, then stop polling
-                if state == "FINISHED":
+                if tracker.is_stopped():
+                    cursor.cancel()
                     break
 
-                completed_splits = float(stats.get("completedSplits"))
-                total_splits = float(stats.get("totalSplits"))
-                if total_splits and completed_splits:
-                    progress = 100 * (completed_splits / total_splits)
-                    logger.info(
-                        "Query {} progress: {} / {} "  # pylint: disable=logging-format-interpolation
-                        "splits".format(query_id, completed_splits, total_splits)
-                    )
-                    if progress > query.progress:
-                        query.progress = progress
-                    session.commit()
-            time.sleep(poll_interval)
-            logger.info("Query %i: Polling the cursor for progress", query_id)
-            polled = cursor.poll()
+                if stats:
+                    state = stats.get("state")
+
+                    # if already finished, then stop polling
+                    if state == "FINISHED":
+                        break
+
+                    completed_splits = float(stats.get("completedSplits"))
+                    total_splits = float(stats.get("totalSplits"))
+                    if total_splits and completed_splits:
+                        progress = 100 * (completed_splits / total_splits)
+                        logger.info(
+                            "Query {} progress: {} / {} "  # pylint: disable=logging-format-interpolation
+                            "splits".format(query_id, completed_splits, total_splits)
+                        )
+                        tracker.set_progress(progress)
+                tracker.wait()
+                logger.info("Query %i: Polling the cursor for progress", query_id)
+                polled = cursor.poll()
 
     @classmethod
     def _extract_error_message(cls, ex: Exception) -> str:
@@ -16,9 +16,10 @@
 # under the License.
 import json
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Iterator, Optional, TYPE_CHECKING
 from urllib import parse
 
+import pyarrow as pa
 from sqlalchemy.engine.url import URL
 
 from superset.db_engine_specs.postgres import PostgresBaseEngineSpec
@@ -31,6 +32,7 @@ if TYPE_CHECKING:
 class SnowflakeEngineSpec(PostgresBaseEngineSpec):
     engine = "snowflake"
     engine_name = "Snowflake"
+    allows_tuple_in = True
     force_column_alias_quotes = True
     max_column_name_length = 256
 
@@ -65,6 +67,32 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
             selected_schema = parse.quote(selected_schema, safe="")
             uri.database = database + "/" + selected_schema
 
+    @classmethod
+    def fetch_batches(
+        cls, cursor: Any, batch_size: int, limit: Optional[int] = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Fetch the result as Arrow tables when the connector supports it, which is the
+        case when it's installed with the `pandas` extra and the result is returned
+        in Arrow format.
+        """
+        try:
+            tables = cursor.fetch_arrow_batches()
+        except Exception:  # pylint: disable=broad-except
+            yield from super().fetch_batches(cursor, batch_size, limit)
+            return
+
+        remaining = limit
+        for table in tables or []:
+            for batch in table.to_batches(max_chunksize=batch_size):
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    batch = batch.slice(0, remaining)
+                    remaining -= batch.num_rows
+                if batch.num_rows:
+                    yield batch
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "DATEADD(S, {col}, '1970-01-01')"
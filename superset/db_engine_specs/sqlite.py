@@ -15,11 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 from datetime import datetime
-from typing import List, Optional, TYPE_CHECKING
+from typing import Callable, List, Optional, TYPE_CHECKING, Union
 
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 
 from superset.db_engine_specs.base import BaseEngineSpec
+from superset.sql_parse import Table
 from superset.utils import core as utils
 
 if TYPE_CHECKING:
@@ -30,6 +32,7 @@ if TYPE_CHECKING:
 class SqliteEngineSpec(BaseEngineSpec):
     engine = "sqlite"
     engine_name = "SQLite"
+    rename_table_to_qualified_name = False
 
     # pylint: disable=line-too-long
     _time_grain_expressions = {
@@ -57,6 +60,14 @@ class SqliteEngineSpec(BaseEngineSpec):
     def epoch_to_dttm(cls) -> str:
         return "datetime({col}, 'unixepoch')"
 
+    @classmethod
+    def get_df_to_sql_method(
+        cls, database: "Database", engine: Engine
+    ) -> Optional[Union[str, Callable[..., None]]]:
+        # a prepared statement run with `executemany` is faster than multi-row
+        # inserts, which are also limited by the maximum number of bound parameters
+        return None
+
     @classmethod
     def get_all_datasource_names(
         cls, database: "Database", datasource_type: str
@@ -90,6 +101,18 @@ class SqliteEngineSpec(BaseEngineSpec):
             return f"""'{dttm.isoformat(sep=" ", timespec="microseconds")}'"""
         return None
 
+    @classmethod
+    def rename_table(cls, connection: Connection, table: Table, name: str) -> None:
+        """
+        Rename a table without rewriting the views referencing it, as SQLite
+        otherwise fails the rename if any view of the database is broken.
+        """
+        connection.execute("PRAGMA legacy_alter_table = ON")
+        try:
+            super().rename_table(connection, table, name)
+        finally:
+            connection.execute("PRAGMA legacy_alter_table = OFF")
+
     @classmethod
     def get_table_names(
         cls, database: "Database", inspector: Inspector, schema: Optional[str]
@@ -30,8 +30,12 @@ from werkzeug.local import LocalProxy
 from superset.utils.async_query_manager import AsyncQueryManager
 from superset.utils.cache_manager import CacheManager
 from superset.utils.encrypt import EncryptedFieldFactory
+from superset.utils.engine_registry import EngineRegistry
 from superset.utils.feature_flag_manager import FeatureFlagManager
 from superset.utils.machine_auth import MachineAuthProviderFactory
+from superset.utils.query_progress import QueryProgressChannel
+from superset.utils.sql_generation_cache import SqlGenerationCache
+from superset.utils.webdriver_pool import WebDriverPool
 
 
 class ResultsBackendManager:
@@ -106,11 +110,15 @@ csrf = CSRFProtect()
 db = SQLA()
 _event_logger: Dict[str, Any] = {}
 encrypted_field_factory = EncryptedFieldFactory()
+engine_registry = EngineRegistry()
 event_logger = LocalProxy(lambda: _event_logger.get("event_logger"))
 feature_flag_manager = FeatureFlagManager()
 machine_auth_provider_factory = MachineAuthProviderFactory()
 manifest_processor = UIManifestProcessor(APP_DIR)
 migrate = Migrate()
+query_progress_channel = QueryProgressChannel()
 results_backend_manager = ResultsBackendManager()
 security_manager = LocalProxy(lambda: appbuilder.sm)
+sql_generation_cache = SqlGenerationCache()
 talisman = Talisman()
+webdriver_pool = WebDriverPool()
@@ -23,10 +23,11 @@ from contextlib import closing
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
 
 import numpy
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sqla
 import sqlparse
 from flask import g, request
@@ -43,23 +44,29 @@ from sqlalchemy import (
     Table,
     Text,
 )
-from sqlalchemy.engine import Dialect, Engine, url
+from sqlalchemy.engine import Connection, Dialect, Engine, url
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import make_url, URL
 from sqlalchemy.exc import ArgumentError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapper, relationship
 from sqlalchemy.pool import NullPool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import expression, Select
 
 from superset import app, db_engine_specs, is_feature_enabled
 from superset.db_engine_specs.base import TimeGrain
-from superset.extensions import cache_manager, encrypted_field_factory, security_manager
+from superset.extensions import (
+    cache_manager,
+    encrypted_field_factory,
+    engine_registry,
+    security_manager,
+)
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.models.tags import FavStarUpdater
 from superset.result_set import SupersetResultSet
 from superset.utils import cache as cache_util, core as utils
+from superset.utils.engine_registry import POOL_ONLY_PARAMS
 
 config = app.config
 custom_password_store = config["SQLALCHEMY_CUSTOM_PASSWORD_STORE"]
@@ -303,10 +310,26 @@ class Database(
     def get_sqla_engine(
         self,
         schema: Optional[str] = None,
-        nullpool: bool = True,
+        nullpool: Optional[bool] = None,
         user_name: Optional[str] = None,
         source: Optional[utils.QuerySource] = None,
     ) -> Engine:
+        """
+        Get the SQLAlchemy engine of the database.
+
+        :param schema: Schema the connection defaults to
+        :param nullpool: Whether to create a new engine without connection pooling.
+               Defaults to reusing a pooled engine when `SQLALCHEMY_ENGINE_POOLING`
+               is enabled
+        :param user_name: User to impersonate, defaults to the logged in user
+        :param source: Where the query originates from, passed to
+               `DB_CONNECTION_MUTATOR`
+        :return: SQLAlchemy engine
+        """
+        if nullpool is None:
+            nullpool = not engine_registry.enabled
+        # transient databases, e.g. when testing a connection, are never pooled
+        nullpool = nullpool or self.id is None
         extra = self.get_extra()
         sqlalchemy_url = make_url(self.sqlalchemy_uri_decrypted)
         self.db_engine_spec.adjust_database_uri(sqlalchemy_url, schema)
@@ -324,6 +347,8 @@ class Database(
         params = extra.get("engine_params", {})
         if nullpool:
             params["poolclass"] = NullPool
+            for key in POOL_ONLY_PARAMS:
+                params.pop(key, None)
 
         connect_args = params.get("connect_args", {})
         if self.impersonate_user:
@@ -349,7 +374,11 @@ class Database(
                 sqlalchemy_url, params, effective_username, security_manager, source
             )
 
-        return create_engine(sqlalchemy_url, **params)
+        if nullpool:
+            return create_engine(sqlalchemy_url, **params)
+        return engine_registry.get_engine(
+            self.id, effective_username, schema, sqlalchemy_url, params
+        )
 
     def get_reserved_words(self) -> Set[str]:
         return self.get_dialect().preparer.reserved_words
@@ -357,17 +386,28 @@ class Database(
     def get_quoter(self) -> Callable[[str, Any], str]:
         return self.get_dialect().identifier_preparer.quote
 
-    def get_df(  # pylint: disable=too-many-locals
-        self,
-        sql: str,
-        schema: Optional[str] = None,
-        mutator: Optional[Callable[[pd.DataFrame], None]] = None,
-    ) -> pd.DataFrame:
+    def _execute_statements(
+        self, engine: Engine, cursor: Any, sql: str, schema: Optional[str] = None
+    ) -> None:
+        """Execute the statements of a script, leaving the results of the last one
+        to be fetched from the cursor"""
         sqls = [str(s).strip(" ;") for s in sqlparse.parse(sql)]
-
-        engine = self.get_sqla_engine(schema=schema)
         username = utils.get_username()
 
+        def _log_query(sql: str) -> None:
+            if log_query:
+                log_query(engine.url, sql, schema, username, __name__, security_manager)
+
+        for sql_ in sqls[:-1]:
+            _log_query(sql_)
+            self.db_engine_spec.execute(cursor, sql_)
+            cursor.fetchall()
+
+        _log_query(sqls[-1])
+        self.db_engine_spec.execute(cursor, sqls[-1])
+
+    @staticmethod
+    def _serialize_nested_columns(df: pd.DataFrame) -> None:
         def needs_conversion(df_series: pd.Series) -> bool:
             return (
                 not df_series.empty
@@ -375,34 +415,80 @@ class Database(
                 and isinstance(df_series[0], (list, dict))
             )
 
-        def _log_query(sql: str) -> None:
-            if log_query:
-                log_query(engine.url, sql, schema, username, __name__, security_manager)
+        for col, coltype in df.dtypes.to_dict().items():
+            if coltype == numpy.object_ and needs_conversion(df[col]):
+                df[col] = df[col].apply(utils.json_dumps_w_dates)
+
+    def get_df(
+        self,
+        sql: str,
+        schema: Optional[str] = None,
+        mutator: Optional[Callable[[pd.DataFrame], None]] = None,
+    ) -> pd.DataFrame:
+        engine = self.get_sqla_engine(schema=schema)
 
         with closing(engine.raw_connection()) as conn:
             cursor = conn.cursor()
-            for sql_ in sqls[:-1]:
-                _log_query(sql_)
-                self.db_engine_spec.execute(cursor, sql_)
-                cursor.fetchall()
-
-            _log_query(sqls[-1])
-            self.db_engine_spec.execute(cursor, sqls[-1])
+            self._execute_statements(engine, cursor, sql, schema)
 
-            data = self.db_engine_spec.fetch_data(cursor)
-            result_set = SupersetResultSet(
-                data, cursor.description, self.db_engine_spec
+            batches = self.db_engine_spec.fetch_batches(
+                cursor, config["SQL_FETCH_BATCH_SIZE"]
+            )
+            result_set = SupersetResultSet.from_record_batches(
+                list(batches), cursor.description, self.db_engine_spec
             )
             df = result_set.to_pandas_df()
             if mutator:
                 df = mutator(df)
 
-            for col, coltype in df.dtypes.to_dict().items():
-                if coltype == numpy.object_ and needs_conversion(df[col]):
-                    df[col] = df[col].apply(utils.json_dumps_w_dates)
-
+            self._serialize_nested_columns(df)
             return df
 
+    def iter_dfs(
+        self,
+        sql: str,
+        schema: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a query and fetch its results incrementally, so that the full result
+        never needs to be held in memory.
+
+        :param sql: Script whose last statement returns the results
+        :param schema: Default schema of the statements
+        :param batch_size: Maximum number of rows of the data frames, defaults to
+               `SQL_FETCH_BATCH_SIZE`
+        :param limit: Maximum number of rows to fetch
+        :return: Data frames of the results, the first one always being returned
+        """
+        engine = self.get_sqla_engine(schema=schema)
+
+        with closing(engine.raw_connection()) as conn:
+            cursor = conn.cursor()
+            self._execute_statements(engine, cursor, sql, schema)
+
+            batches = self.db_engine_spec.fetch_batches(
+                cursor, batch_size or config["SQL_FETCH_BATCH_SIZE"], limit
+            )
+            empty = True
+            for batch in batches:
+                empty = False
+                yield self._batches_to_df([batch], cursor.description)
+            # empty results still need their columns
+            if empty and cursor.description:
+                yield self._batches_to_df([], cursor.description)
+
+    def _batches_to_df(
+        self, batches: List[pa.RecordBatch], cursor_description: Any
+    ) -> pd.DataFrame:
+        result_set = SupersetResultSet.from_record_batches(
+            batches, cursor_description, self.db_engine_spec
+        )
+        df = result_set.to_pandas_df()
+        self._serialize_nested_columns(df)
+        return df
+
     def compile_sqla_query(self, qry: Select, schema: Optional[str] = None) -> str:
         engine = self.get_sqla_engine(schema=schema)
 
@@ -698,8 +784,16 @@ class Database(
         return sqla_url.get_dialect()()  # pylint: disable=no-member
 
 
+def invalidate_engines(
+    mapper: Mapper, connection: Connection, target: Database
+) -> None:
+    engine_registry.invalidate(target.id)
+
+
 sqla.event.listen(Database, "after_insert", security_manager.set_perm)
 sqla.event.listen(Database, "after_update", security_manager.set_perm)
+sqla.event.listen(Database, "after_update", invalidate_engines)
+sqla.event.listen(Database, "after_delete", invalidate_engines)
 
 
 class Log(Model):  # pylint: disable=too-few-public-methods
@@ -297,7 +297,7 @@ def set_related_perm(_mapper: Mapper, _connection: Connection, target: Slice) ->
     src_class = target.cls_model
     id_ = target.datasource_id
     if id_:
-        ds = db.session.query(src_class).filter_by(id=int(id_)).first()
+        ds = db.session.query(src_class).get(int(id_))
         if ds:
             target.perm = ds.perm
             target.schema_perm = ds.schema_perm
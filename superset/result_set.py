@@ -19,7 +19,18 @@
 import datetime
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Type
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -28,9 +39,29 @@ import pyarrow as pa
 from superset import db_engine_specs
 from superset.typing import DbapiDescription, DbapiResult
 from superset.utils import core as utils
+from superset.utils.core import GenericDataType
 
 logger = logging.getLogger(__name__)
 
+# number of rows transposed into columns at a time
+ROW_BATCH_SIZE = 50000
+# number of non-null values used to infer the Arrow type of a column
+TYPE_SAMPLE_SIZE = 1000
+
+ARROW_CONVERSION_ERRORS = (
+    pa.lib.ArrowInvalid,
+    pa.lib.ArrowTypeError,
+    pa.lib.ArrowNotImplementedError,
+    OverflowError,
+    TypeError,  # this is super hackey,
+    # https://issues.apache.org/jira/browse/ARROW-7855
+)
+
+GENERIC_PA_TYPES: Dict[GenericDataType, pa.DataType] = {
+    GenericDataType.BOOLEAN: pa.bool_(),
+    GenericDataType.STRING: pa.string(),
+}
+
 
 def dedup(l: List[str], suffix: str = "__", case_sensitive: bool = True) -> List[str]:
     """De-duplicates a list of string by suffixing a counter
@@ -71,20 +102,212 @@ def destringify(obj: str) -> Any:
     return json.loads(obj)
 
 
+def stringify_offending_values(values: List[Any]) -> List[Optional[str]]:
+    """Serialize the values Arrow is unable to convert, leaving strings and nulls
+    untouched"""
+    return [
+        value if value is None or isinstance(value, str) else stringify(value)
+        for value in values
+    ]
+
+
+def is_enforceable_type(pa_type: pa.DataType) -> bool:
+    """Whether a type inferred from a sample can safely be enforced on the remaining
+    values of a column without silently coercing them. Integer types are excluded
+    as Arrow truncates floats when converting them to integers."""
+    return (
+        pa.types.is_boolean(pa_type)
+        or pa.types.is_floating(pa_type)
+        or pa.types.is_string(pa_type)
+        or (pa.types.is_timestamp(pa_type) and pa_type.tz is None)
+    )
+
+
+def values_to_array(
+    values: List[Any], pa_type: Optional[pa.DataType] = None
+) -> pa.Array:
+    """
+    Convert the values of a single column to an Arrow array.
+
+    :param values: Column values as returned by the DB-API driver
+    :param pa_type: Expected Arrow type. Inferred from the values when missing or
+           when the values don't conform to it
+    :return: Arrow array. Nested values and values Arrow is unable to convert are
+             serialized to JSON strings
+    """
+    array: Optional[pa.Array] = None
+    if pa_type is not None:
+        try:
+            array = pa.array(values, type=pa_type)
+        except ARROW_CONVERSION_ERRORS:
+            pass
+
+    if array is None:
+        try:
+            array = pa.array(values)
+        except ARROW_CONVERSION_ERRORS:
+            # attempt serialization of the offending values as strings
+            return pa.array(stringify_offending_values(values))
+
+    if pa.types.is_nested(array.type):
+        # TODO: revisit nested column serialization once nested types
+        #  are added as a natively supported column type in Superset
+        #  (superset.utils.core.GenericDataType).
+        return pa.array(
+            [None if value is None else stringify(value) for value in values]
+        )
+
+    if pa.types.is_temporal(array.type):
+        # workaround for bug converting
+        # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+        # related: https://issues.apache.org/jira/browse/ARROW-5248
+        sample = next((value for value in values if value), None)
+        if sample and isinstance(sample, datetime.datetime):
+            try:
+                if sample.tzinfo:
+                    tz = sample.tzinfo
+                    series = pd.Series(values, dtype="datetime64[ns]")
+                    series = pd.to_datetime(series).dt.tz_localize(tz)
+                    array = pa.Array.from_pandas(series, type=pa.timestamp("ns", tz=tz))
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.exception(ex)
+
+    return array
+
+
+def merge_chunks(chunks: List[pa.Array]) -> Union[pa.Array, pa.ChunkedArray]:
+    """
+    Combine the arrays built from the batches of a single column.
+
+    Batches containing only nulls are cast to the type of the other batches. If
+    batches were converted to conflicting types, the column is converted again
+    as a whole.
+
+    :param chunks: Arrays of the column, one per batch
+    :return: Array or chunked array of a single type
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+
+    pa_types = {chunk.type for chunk in chunks if not pa.types.is_null(chunk.type)}
+    if len(pa_types) > 1:
+        return values_to_array(
+            [value for chunk in chunks for value in chunk.to_pylist()]
+        )
+
+    pa_type = pa_types.pop() if pa_types else pa.null()
+    return pa.chunked_array(
+        [
+            chunk if chunk.type == pa_type else pa.nulls(len(chunk), type=pa_type)
+            for chunk in chunks
+        ],
+        type=pa_type,
+    )
+
+
+class ColumnarBuilder:
+    """
+    Builds the Arrow arrays of a result set incrementally, from batches of rows.
+
+    The Arrow type of every column is inferred once, from a sample of its first
+    non-null values or, when the sample is empty, from the column spec of the type
+    reported in the cursor description. Subsequent batches are converted with that
+    type, skipping Arrow's per-value type inference.
+    """
+
+    def __init__(
+        self,
+        cursor_description: List[Tuple[Any, ...]],
+        db_engine_spec: Type[db_engine_specs.BaseEngineSpec],
+    ):
+        self.db_engine_spec = db_engine_spec
+        self.native_types = [
+            self.get_native_type(description) for description in cursor_description
+        ]
+        self.pa_types: List[Optional[pa.DataType]] = [None] * len(cursor_description)
+        self.chunks: List[List[pa.Array]] = [[] for _ in cursor_description]
+
+    def get_native_type(self, description: Tuple[Any, ...]) -> Optional[str]:
+        if len(description) < 2:
+            return None
+        try:
+            return self.db_engine_spec.get_datatype(description[1])
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    def infer_pa_type(self, index: int, values: List[Any]) -> Optional[pa.DataType]:
+        sample = list(
+            islice((value for value in values if value is not None), TYPE_SAMPLE_SIZE)
+        )
+        if not sample:
+            column_spec = self.db_engine_spec.get_column_spec(
+                self.native_types[index],
+                source=utils.ColumnTypeSource.CURSOR_DESCRIPION,
+            )
+            if column_spec:
+                return GENERIC_PA_TYPES.get(column_spec.generic_type)
+            return None
+
+        try:
+            pa_type = pa.array(sample).type
+        except ARROW_CONVERSION_ERRORS:
+            return None
+        return pa_type if is_enforceable_type(pa_type) else None
+
+    def convert_rows(self, rows: Sequence[Sequence[Any]]) -> List[pa.Array]:
+        """
+        Transpose a batch of rows and convert each of its columns to Arrow.
+
+        :param rows: Rows as returned by the DB-API driver
+        :return: One array per column
+        """
+        arrays: List[pa.Array] = []
+        for index, column in enumerate(islice(zip(*rows), len(self.pa_types))):
+            values = list(column)
+            if self.pa_types[index] is None:
+                self.pa_types[index] = self.infer_pa_type(index, values)
+            arrays.append(values_to_array(values, self.pa_types[index]))
+        return arrays
+
+    def append_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        self.append_arrays(self.convert_rows(rows))
+
+    def append_batch(self, batch: pa.RecordBatch) -> None:
+        """
+        Append a record batch, either built by `convert_rows` or fetched natively
+        by the driver, in which case nested columns are serialized to JSON strings.
+
+        :param batch: Record batch with the columns of the cursor description
+        """
+        self.append_arrays(
+            [
+                values_to_array(array.to_pylist())
+                if pa.types.is_nested(array.type)
+                else array
+                for array in batch.columns
+            ]
+        )
+
+    def append_arrays(self, arrays: List[pa.Array]) -> None:
+        for chunks, array in zip(self.chunks, arrays):
+            chunks.append(array)
+
+    def finish(self) -> List[Union[pa.Array, pa.ChunkedArray]]:
+        return [merge_chunks(chunks) for chunks in self.chunks if chunks]
+
+
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals,too-many-branches
+    def __init__(
         self,
         data: DbapiResult,
         cursor_description: DbapiDescription,
         db_engine_spec: Type[db_engine_specs.BaseEngineSpec],
+        batch_size: int = ROW_BATCH_SIZE,
     ):
         self.db_engine_spec = db_engine_spec
         data = data or []
         column_names: List[str] = []
-        pa_data: List[pa.Array] = []
         deduped_cursor_desc: List[Tuple[Any, ...]] = []
-        numpy_dtype: List[Tuple[str, ...]] = []
-        stringified_arr: np.ndarray
 
         if cursor_description:
             # get deduped list of column names
@@ -96,57 +319,16 @@ class SupersetResultSet:
                 for column_name, description in zip(column_names, cursor_description)
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(
-                                    array[column], dtype="datetime64[ns]"
-                                )
-                                series = pd.to_datetime(series).dt.tz_localize(tz)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series, type=pa.timestamp("ns", tz=tz)
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
-
-        self.table = pa.Table.from_arrays(pa_data, names=column_names)
+        if not isinstance(data, list):
+            data = list(data)
+
+        # transpose the rows into per-column Python lists one batch at a time,
+        # which avoids materializing an intermediate copy of the full result
+        builder = ColumnarBuilder(deduped_cursor_desc, db_engine_spec)
+        for start in range(0, len(data), batch_size):
+            builder.append_rows(data[start : start + batch_size])
+
+        self.table = pa.Table.from_arrays(builder.finish(), names=column_names)
         self._type_dict: Dict[str, Any] = {}
         try:
             # The driver may not be passing a cursor.description
@@ -158,6 +340,33 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def from_record_batches(
+        cls,
+        batches: Iterable[pa.RecordBatch],
+        cursor_description: DbapiDescription,
+        db_engine_spec: Type[db_engine_specs.BaseEngineSpec],
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from record batches, e.g. the ones yielded by
+        `BaseEngineSpec.fetch_batches`, without going through Python rows.
+
+        :param batches: Record batches with the columns of the cursor description
+        :param cursor_description: Description of the cursor the batches came from
+        :param db_engine_spec: Engine spec of the database
+        :return: Result set
+        """
+        result_set = cls([], cursor_description, db_engine_spec)
+        column_names: List[str] = []
+        if cursor_description:
+            column_names = dedup([col[0] for col in cursor_description])
+
+        builder = ColumnarBuilder(list(cursor_description or []), db_engine_spec)
+        for batch in batches:
+            builder.append_batch(batch)
+        result_set.table = pa.Table.from_arrays(builder.finish(), names=column_names)
+        return result_set
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
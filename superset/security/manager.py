@@ -18,9 +18,21 @@
 """A set of constants and methods to manage permissions and security"""
 import logging
 import re
-from typing import Any, Callable, cast, List, Optional, Set, Tuple, TYPE_CHECKING, Union
+import uuid
+from typing import (
+    Any,
+    Callable,
+    cast,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
-from flask import current_app, g
+from flask import current_app, g, has_app_context
 from flask_appbuilder import Model
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_appbuilder.security.sqla.manager import SecurityManager
@@ -41,7 +53,7 @@ from flask_appbuilder.security.views import (
 from flask_appbuilder.widgets import ListWidget
 from sqlalchemy import and_, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import object_session, Session
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.query import Query as SqlaQuery
 
@@ -64,6 +76,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+RLS_FILTERS_VERSION_CACHE_KEY = "rls_filters_version"
+RLS_FILTERS_CHANGED_SESSION_KEY = "rls_filters_changed"
+
+
+class RLSFilter(NamedTuple):
+    id: int
+    group_key: Optional[str]
+    clause: str
+
 
 class SupersetSecurityListWidget(ListWidget):
     """
@@ -1024,75 +1045,194 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .one_or_none()
         )
 
-    def get_rls_filters(self, table: "BaseDatasource") -> List[SqlaQuery]:
+    def get_rls_filters(self, table: "BaseDatasource") -> List[RLSFilter]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        The filters only depend on the roles of the user and are memoized for the
+        duration of the request, and for `RLS_FILTERS_CACHE_TIMEOUT` seconds in the
+        cache when set.
+
         :param table: The table to check against
         :returns: A list of filters
         """
-        if hasattr(g, "user") and hasattr(g.user, "id"):
-            from superset.connectors.sqla.models import (
-                RLSFilterRoles,
-                RLSFilterTables,
-                RowLevelSecurityFilter,
-            )
+        if not (hasattr(g, "user") and hasattr(g.user, "id")):
+            return []
+
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
 
-            user_roles = (
-                self.get_session.query(assoc_user_role.c.role_id)
-                .filter(assoc_user_role.c.user_id == g.user.get_id())
-                .subquery()
+        stats_logger = current_app.config["STATS_LOGGER"]
+        cache_timeout = current_app.config["RLS_FILTERS_CACHE_TIMEOUT"]
+        memo = g.setdefault("rls_filters", {})
+
+        user_id = g.user.get_id()
+        role_ids = memo.get(("roles", user_id))
+        if role_ids is None:
+            role_ids = sorted(
+                role_id
+                for (role_id,) in self.get_session.query(
+                    assoc_user_role.c.role_id
+                ).filter(assoc_user_role.c.user_id == user_id)
             )
-            regular_filter_roles = (
-                self.get_session.query(RLSFilterRoles.c.rls_filter_id)
-                .join(RowLevelSecurityFilter)
-                .filter(
-                    RowLevelSecurityFilter.filter_type
-                    == RowLevelSecurityFilterType.REGULAR
+            memo[("roles", user_id)] = role_ids
+
+        key = (tuple(role_ids), table.id)
+        filters = memo.get(key)
+        if filters is not None:
+            stats_logger.incr("rls_filters.memo_hit")
+            return filters
+
+        cache_key = None
+        if cache_timeout is not None:
+            roles = ",".join(str(role_id) for role_id in role_ids)
+            version = cache_manager.cache.get(RLS_FILTERS_VERSION_CACHE_KEY)
+            if version is not None:
+                cache_key = f"rls_filters_{version}_{table.id}_{roles}"
+                filters = cache_manager.cache.get(cache_key)
+                if filters is not None:
+                    stats_logger.incr("rls_filters.cache_hit")
+                    memo[key] = filters
+                    return filters
+            else:
+                # the version was evicted or never set, so any cached filters may
+                # be stale. Set a new one before reading the filters, so that they
+                # aren't cached under a version rotated by a change since.
+                version = uuid.uuid4().hex
+                cache_manager.cache.set(
+                    RLS_FILTERS_VERSION_CACHE_KEY, version, timeout=0
                 )
-                .filter(RLSFilterRoles.c.role_id.in_(user_roles))
-                .subquery()
+                cache_key = f"rls_filters_{version}_{table.id}_{roles}"
+
+        stats_logger.incr("rls_filters.cache_miss")
+        filters = [
+            RLSFilter(filter_.id, filter_.group_key, filter_.clause)
+            for filter_ in self._get_rls_filters_query(role_ids, table.id)
+        ]
+        memo[key] = filters
+        if cache_key is not None:
+            cache_manager.cache.set(cache_key, filters, timeout=cache_timeout)
+        return filters
+
+    def _get_rls_filters_query(self, role_ids: List[int], table_id: int) -> SqlaQuery:
+        from superset.connectors.sqla.models import (
+            RLSFilterRoles,
+            RLSFilterTables,
+            RowLevelSecurityFilter,
+        )
+
+        regular_filter_roles = (
+            self.get_session.query(RLSFilterRoles.c.rls_filter_id)
+            .join(RowLevelSecurityFilter)
+            .filter(
+                RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.REGULAR
             )
-            base_filter_roles = (
-                self.get_session.query(RLSFilterRoles.c.rls_filter_id)
-                .join(RowLevelSecurityFilter)
-                .filter(
-                    RowLevelSecurityFilter.filter_type
-                    == RowLevelSecurityFilterType.BASE
-                )
-                .filter(RLSFilterRoles.c.role_id.in_(user_roles))
-                .subquery()
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
+            .subquery()
+        )
+        base_filter_roles = (
+            self.get_session.query(RLSFilterRoles.c.rls_filter_id)
+            .join(RowLevelSecurityFilter)
+            .filter(
+                RowLevelSecurityFilter.filter_type == RowLevelSecurityFilterType.BASE
             )
-            filter_tables = (
-                self.get_session.query(RLSFilterTables.c.rls_filter_id)
-                .filter(RLSFilterTables.c.table_id == table.id)
-                .subquery()
+            .filter(RLSFilterRoles.c.role_id.in_(role_ids))
+            .subquery()
+        )
+        filter_tables = (
+            self.get_session.query(RLSFilterTables.c.rls_filter_id)
+            .filter(RLSFilterTables.c.table_id == table_id)
+            .subquery()
+        )
+        return (
+            self.get_session.query(
+                RowLevelSecurityFilter.id,
+                RowLevelSecurityFilter.group_key,
+                RowLevelSecurityFilter.clause,
             )
-            query = (
-                self.get_session.query(
-                    RowLevelSecurityFilter.id,
-                    RowLevelSecurityFilter.group_key,
-                    RowLevelSecurityFilter.clause,
-                )
-                .filter(RowLevelSecurityFilter.id.in_(filter_tables))
-                .filter(
-                    or_(
-                        and_(
-                            RowLevelSecurityFilter.filter_type
-                            == RowLevelSecurityFilterType.REGULAR,
-                            RowLevelSecurityFilter.id.in_(regular_filter_roles),
-                        ),
-                        and_(
-                            RowLevelSecurityFilter.filter_type
-                            == RowLevelSecurityFilterType.BASE,
-                            RowLevelSecurityFilter.id.notin_(base_filter_roles),
-                        ),
-                    )
+            .filter(RowLevelSecurityFilter.id.in_(filter_tables))
+            .filter(
+                or_(
+                    and_(
+                        RowLevelSecurityFilter.filter_type
+                        == RowLevelSecurityFilterType.REGULAR,
+                        RowLevelSecurityFilter.id.in_(regular_filter_roles),
+                    ),
+                    and_(
+                        RowLevelSecurityFilter.filter_type
+                        == RowLevelSecurityFilterType.BASE,
+                        RowLevelSecurityFilter.id.notin_(base_filter_roles),
+                    ),
                 )
             )
-            return query.all()
-        return []
+        )
+
+    @staticmethod
+    def invalidate_rls_filters(  # pylint: disable=unused-argument
+        mapper: Mapper, connection: Connection, target: Model
+    ) -> None:
+        """
+        Invalidate the memoized row level security filters when row level security
+        filters or roles change, and flag the session so that the cached filters are
+        invalidated once the change is committed.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The mapped instance being changed
+        """
+        if has_app_context():
+            g.pop("rls_filters", None)
+        session = object_session(target)
+        if session is not None:
+            session.info[RLS_FILTERS_CHANGED_SESSION_KEY] = True
+
+    @staticmethod
+    def rotate_rls_filters_version(session: Session) -> None:
+        """
+        Invalidate the cached row level security filters once changes to them are
+        committed, as rotating the version before would let other processes cache
+        the filters they read from the database before the commit under the new
+        version.
+
+        :param session: The session being committed
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if (
+            session.info.pop(RLS_FILTERS_CHANGED_SESSION_KEY, False)
+            and has_app_context()
+            and current_app.config["RLS_FILTERS_CACHE_TIMEOUT"] is not None
+        ):
+            cache_manager.cache.set(
+                RLS_FILTERS_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=0
+            )
+
+    @staticmethod
+    def discard_rls_filters_changes(session: Session) -> None:
+        """
+        Clear the changes to row level security filters flagged on a session when
+        they are rolled back.
+
+        :param session: The session being rolled back
+        """
+        session.info.pop(RLS_FILTERS_CHANGED_SESSION_KEY, None)
+
+    @staticmethod
+    def invalidate_rls_filters_memo(  # pylint: disable=unused-argument
+        mapper: Mapper, connection: Connection, target: Model
+    ) -> None:
+        """
+        Invalidate the row level security filters memoized for the request, when the
+        roles of a user change.
+
+        :param mapper: The table mapper
+        :param connection: The DB-API connection
+        :param target: The mapped instance being changed
+        """
+        if has_app_context():
+            g.pop("rls_filters", None)
 
     def get_rls_ids(self, table: "BaseDatasource") -> List[int]:
         """
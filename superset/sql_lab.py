@@ -22,9 +22,6 @@ from sys import getsizeof
 from typing import Any, cast, Dict, List, Optional, Tuple, Union
 
 import backoff
-import msgpack
-import pyarrow as pa
-import simplejson as json
 from celery.exceptions import SoftTimeLimitExceeded
 from celery.task.base import Task
 from flask_babel import lazy_gettext as _
@@ -32,15 +29,17 @@ from sqlalchemy.orm import Session
 from werkzeug.local import LocalProxy
 
 from superset import app, results_backend, results_backend_use_msgpack, security_manager
-from superset.dataframe import df_to_records
+from superset.dataframe import df_to_json_records, df_to_records
 from superset.db_engine_specs import BaseEngineSpec
 from superset.extensions import celery_app
 from superset.models.core import Database
 from superset.models.sql_lab import LimitingFactor, Query
 from superset.result_set import SupersetResultSet
 from superset.sql_parse import CtasMethod, ParsedQuery
+from superset.utils.arrow_results import pack_payload, serialize_table
 from superset.utils.celery import session_scope
 from superset.utils.core import (
+    json_dumps_data,
     json_iso_dttm_ser,
     QuerySource,
     QueryStatus,
@@ -66,6 +65,7 @@ stats_logger = config["STATS_LOGGER"]
 SQLLAB_TIMEOUT = config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]
 SQLLAB_HARD_TIMEOUT = SQLLAB_TIMEOUT + 60
 SQL_MAX_ROW = config["SQL_MAX_ROW"]
+SQL_FETCH_BATCH_SIZE = config["SQL_FETCH_BATCH_SIZE"]
 SQLLAB_CTAS_NO_LIMIT = config["SQLLAB_CTAS_NO_LIMIT"]
 SQL_QUERY_MUTATOR = config.get("SQL_QUERY_MUTATOR") or dummy_sql_query_mutator
 log_query = config["QUERY_LOGGER"]
@@ -256,12 +256,16 @@ def execute_sql_statement(
                 query.id,
                 str(query.to_dict()),
             )
-            data = db_engine_spec.fetch_data(cursor, increased_limit)
-            if query.limit is None or len(data) <= query.limit:
+            batches = list(
+                db_engine_spec.fetch_batches(
+                    cursor, SQL_FETCH_BATCH_SIZE, increased_limit
+                )
+            )
+            if query.limit is None or sum(b.num_rows for b in batches) <= query.limit:
                 query.limiting_factor = LimitingFactor.NOT_LIMITED
             else:
                 # return 1 row less than increased_query
-                data = data[:-1]
+                batches[-1] = batches[-1].slice(0, batches[-1].num_rows - 1)
     except Exception as ex:
         logger.error("Query %d: %s", query.id, type(ex), exc_info=True)
         logger.debug("Query %d: %s", query.id, ex)
@@ -269,7 +273,9 @@ def execute_sql_statement(
 
     logger.debug("Query %d: Fetching cursor description", query.id)
     cursor_description = cursor.description
-    return SupersetResultSet(data, cursor_description, db_engine_spec)
+    return SupersetResultSet.from_record_batches(
+        batches, cursor_description, db_engine_spec
+    )
 
 
 def _serialize_payload(
@@ -277,9 +283,9 @@ def _serialize_payload(
 ) -> Union[bytes, str]:
     logger.debug("Serializing to msgpack: %r", use_msgpack)
     if use_msgpack:
-        return msgpack.dumps(payload, default=json_iso_dttm_ser, use_bin_type=True)
+        return pack_payload(payload, default=json_iso_dttm_ser)
 
-    return json.dumps(payload, default=json_iso_dttm_ser, ignore_nan=True)
+    return json_dumps_data(payload, default=json_iso_dttm_ser)
 
 
 def _serialize_and_expand_data(
@@ -296,18 +302,20 @@ def _serialize_and_expand_data(
         with stats_timing(
             "sqllab.query.results_backend_pa_serialization", stats_logger
         ):
-            data = (
-                pa.default_serialization_context()
-                .serialize(result_set.pa_table)
-                .to_buffer()
-                .to_pybytes()
+            data = serialize_table(
+                result_set.pa_table,
+                compression=config["RESULTS_BACKEND_ARROW_COMPRESSION"],
+                batch_size=config["RESULTS_BACKEND_ARROW_BATCH_SIZE"],
             )
 
         # expand when loading data from results backend
         all_columns, expanded_columns = (selected_columns, [])
     else:
         df = result_set.to_pandas_df()
-        data = df_to_records(df) or []
+        if config["DATA_JSON_BACKEND"] == "columnar":
+            data = df_to_json_records(df) or []
+        else:
+            data = df_to_records(df) or []
 
         if expand_data:
             all_columns, data, expanded_columns = db_engine_spec.expand_data(
@@ -484,7 +492,12 @@ def execute_sql_statements(  # pylint: disable=too-many-arguments, too-many-loca
             if cache_timeout is None:
                 cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            # the record batches of Arrow payloads are compressed already
+            compressed = (
+                serialized_payload
+                if results_backend_use_msgpack
+                else zlib_compress(serialized_payload)
+            )
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
@@ -18,7 +18,10 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime
+from enum import Enum
+from functools import partial
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 from urllib import request
 from urllib.error import URLError
 
@@ -26,17 +29,38 @@ from celery.utils.log import get_task_logger
 from sqlalchemy import and_, func
 
 from superset import app, db
-from superset.extensions import celery_app
+from superset.extensions import cache_manager, celery_app
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.tags import Tag, TaggedObject
+from superset.utils.concurrency import (
+    concurrency_limit,
+    get_concurrency_limit_key,
+    run_concurrently,
+)
 from superset.utils.date_parser import parse_human_datetime
-from superset.views.utils import build_extra_filters
+from superset.utils.dates import now_as_float
+from superset.views.utils import build_extra_filters, get_viz
+from superset.viz import viz_types
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.INFO)
 
+# A chart to warm up, along with the form data overriding the saved one, e.g. the
+# default filters of the dashboard it belongs to
+ChartWarmUp = Tuple[Slice, Optional[Dict[str, Any]]]
+
+
+class WarmUpStatus(str, Enum):
+    """
+    Outcome of warming up the cache of a chart in process
+    """
+
+    WARMED = "warmed"
+    FRESH = "fresh"
+    FAILED = "failed"
+
 
 def get_form_data(
     chart_id: int, dashboard: Optional[Dashboard] = None
@@ -89,8 +113,10 @@ class Strategy:
     """
     A cache warm up strategy.
 
-    Each strategy defines a `get_urls` method that returns a list of URLs to
-    be fetched from the `/superset/warm_up_cache/` endpoint.
+    Each strategy defines a `get_charts` method that returns the charts to warm
+    up, along with their form data overrides. They are either fetched from the
+    web servers through the URLs returned by `get_urls`, or warmed up within the
+    Celery worker when `CACHE_WARMUP_IN_PROCESS` is set.
 
     Strategies can be configured in `superset/config.py`:
 
@@ -111,8 +137,11 @@ class Strategy:
     def __init__(self) -> None:
         pass
 
+    def get_charts(self) -> List[ChartWarmUp]:
+        raise NotImplementedError("Subclasses must implement get_charts!")
+
     def get_urls(self) -> List[str]:
-        raise NotImplementedError("Subclasses must implement get_urls!")
+        return [get_url(chart, form_data) for chart, form_data in self.get_charts()]
 
 
 class DummyStrategy(Strategy):
@@ -133,11 +162,11 @@ class DummyStrategy(Strategy):
 
     name = "dummy"
 
-    def get_urls(self) -> List[str]:
+    def get_charts(self) -> List[ChartWarmUp]:
         session = db.create_scoped_session()
         charts = session.query(Slice).all()
 
-        return [get_url(chart) for chart in charts]
+        return [(chart, None) for chart in charts]
 
 
 class TopNDashboardsStrategy(Strategy):
@@ -165,8 +194,8 @@ class TopNDashboardsStrategy(Strategy):
         self.top_n = top_n
         self.since = parse_human_datetime(since) if since else None
 
-    def get_urls(self) -> List[str]:
-        urls = []
+    def get_charts(self) -> List[ChartWarmUp]:
+        charts: List[ChartWarmUp] = []
         session = db.create_scoped_session()
 
         records = (
@@ -182,9 +211,9 @@ class TopNDashboardsStrategy(Strategy):
         for dashboard in dashboards:
             for chart in dashboard.slices:
                 form_data_with_filters = get_form_data(chart.id, dashboard)
-                urls.append(get_url(chart, form_data_with_filters))
+                charts.append((chart, form_data_with_filters))
 
-        return urls
+        return charts
 
 
 class DashboardTagsStrategy(Strategy):
@@ -209,8 +238,8 @@ class DashboardTagsStrategy(Strategy):
         super(DashboardTagsStrategy, self).__init__()
         self.tags = tags or []
 
-    def get_urls(self) -> List[str]:
-        urls = []
+    def get_charts(self) -> List[ChartWarmUp]:
+        charts: List[ChartWarmUp] = []
         session = db.create_scoped_session()
 
         tags = session.query(Tag).filter(Tag.name.in_(self.tags)).all()
@@ -231,7 +260,7 @@ class DashboardTagsStrategy(Strategy):
         tagged_dashboards = session.query(Dashboard).filter(Dashboard.id.in_(dash_ids))
         for dashboard in tagged_dashboards:
             for chart in dashboard.slices:
-                urls.append(get_url(chart))
+                charts.append((chart, None))
 
         # add charts that are tagged
         tagged_objects = (
@@ -247,22 +276,165 @@ class DashboardTagsStrategy(Strategy):
         chart_ids = [tagged_object.object_id for tagged_object in tagged_objects]
         tagged_charts = session.query(Slice).filter(Slice.id.in_(chart_ids))
         for chart in tagged_charts:
-            urls.append(get_url(chart))
+            charts.append((chart, None))
 
-        return urls
+        return charts
 
 
 strategies = [DummyStrategy, TopNDashboardsStrategy, DashboardTagsStrategy]
 
 
+def get_chart_usage(
+    chart_ids: Iterable[int], since: Optional[datetime] = None
+) -> Dict[int, int]:
+    """
+    Count the views of charts recorded in the `logs` table.
+
+    :param chart_ids: Ids of the charts
+    :param since: Only count the views since this date when set
+    :return: Number of views by chart id, charts without views being omitted
+    """
+    query = (
+        db.session.query(Log.slice_id, func.count(Log.slice_id))
+        .filter(Log.slice_id.in_(list(chart_ids)))
+        .group_by(Log.slice_id)
+    )
+    if since:
+        query = query.filter(Log.dttm >= since)
+    return dict(query.all())
+
+
+def prioritize_charts(charts: List[ChartWarmUp]) -> List[ChartWarmUp]:
+    """
+    Remove the duplicate charts to warm up and order them by decreasing usage,
+    so that the most viewed charts are warmed up first.
+    """
+    unique_charts: Dict[Tuple[int, str], ChartWarmUp] = {}
+    for chart, form_data in charts:
+        key = (chart.id, json.dumps(form_data, sort_keys=True, default=str))
+        unique_charts.setdefault(key, (chart, form_data))
+
+    since = app.config["CACHE_WARMUP_USAGE_SINCE"]
+    usage = get_chart_usage(
+        {chart.id for chart, _ in unique_charts.values()},
+        parse_human_datetime(since) if since else None,
+    )
+    return sorted(
+        unique_charts.values(), key=lambda warm_up: -usage.get(warm_up[0].id, 0)
+    )
+
+
+def warm_up_chart(
+    chart_id: int,
+    form_data: Optional[Dict[str, Any]] = None,
+    limit_key: Optional[Hashable] = None,
+    limit: Optional[int] = None,
+) -> WarmUpStatus:
+    """
+    Warm up the cache of a chart within the current process, unless its data is
+    still cached.
+
+    :param chart_id: Id of the chart
+    :param form_data: Form data overriding the saved one of the chart
+    :param limit_key: Key of the `concurrency_limit` the query is subject to
+    :param limit: Maximum number of charts warmed up concurrently for `limit_key`
+    :return: Whether the chart was warmed up, fresh or failed
+    """
+    try:
+        chart = db.session.query(Slice).get(chart_id)
+        if not chart or not chart.datasource:
+            raise Exception("Chart or its datasource does not exist")
+
+        form_data = {**chart.form_data, **(form_data or {})}
+        viz_type = form_data.get("viz_type", "table")
+        if viz_type not in viz_types:
+            # the queries of the other charts are built by the frontend
+            raise Exception(f"Charts of type {viz_type} can't be warmed up")
+
+        viz_obj = get_viz(
+            datasource_type=chart.datasource.type,
+            datasource_id=chart.datasource.id,
+            form_data=form_data,
+        )
+        query_obj = viz_obj.query_obj()
+        cache_key = viz_obj.cache_key(query_obj) if query_obj else None
+        if cache_key and cache_manager.data_cache.cache.has(cache_key):
+            return WarmUpStatus.FRESH
+
+        if limit_key is not None and limit is not None:
+            with concurrency_limit(limit_key, limit):
+                payload = viz_obj.get_payload(query_obj)
+        else:
+            payload = viz_obj.get_payload(query_obj)
+        if viz_obj.has_error(payload):
+            logger.error("Error warming up chart %s: %s", chart_id, payload["errors"])
+            return WarmUpStatus.FAILED
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Error warming up chart %s", chart_id)
+        return WarmUpStatus.FAILED
+    return WarmUpStatus.WARMED
+
+
+def warm_up_charts(charts: List[ChartWarmUp]) -> Dict[str, List[int]]:
+    """
+    Warm up the cache of charts within the current process, in a thread pool of
+    `CACHE_WARMUP_THREADS` threads, the most viewed charts first.
+
+    The charts whose data is still cached are skipped rather than refreshed, and
+    at most `CACHE_WARMUP_THREADS_PER_DATABASE` queries run concurrently against
+    the same database.
+
+    :param charts: Charts to warm up, along with their form data overrides
+    :return: Ids of the charts by `WarmUpStatus`
+    """
+    stats_logger = app.config["STATS_LOGGER"]
+    limit = app.config["CACHE_WARMUP_THREADS_PER_DATABASE"]
+    start_time = now_as_float()
+
+    charts = prioritize_charts(charts)
+    funcs = []
+    for chart, form_data in charts:
+        # the warm up has its own limits, as the queries of a chart can be subject
+        # to the limits of chart data requests, e.g. for time comparisons, which
+        # would block forever if the warm up held all their permits
+        limit_key = (
+            f"warmup_{get_concurrency_limit_key(chart.datasource)}"
+            if chart.datasource
+            else None
+        )
+        funcs.append(partial(warm_up_chart, chart.id, form_data, limit_key, limit))
+    statuses = run_concurrently(funcs, max_workers=app.config["CACHE_WARMUP_THREADS"])
+
+    results: Dict[str, List[int]] = {status.value: [] for status in WarmUpStatus}
+    for (chart, _), status in zip(charts, statuses):
+        results[status.value].append(chart.id)
+
+    duration = now_as_float() - start_time
+    stats_logger.timing("cache_warmup.duration", duration)
+    stats_logger.gauge(
+        "cache_warmup.charts_per_second",
+        len(charts) * 1000 / duration if duration else 0,
+    )
+    for status, chart_ids in results.items():
+        stats_logger.gauge(f"cache_warmup.{status}", len(chart_ids))
+    logger.info(
+        "Warmed up %i charts in %.2f ms: %s",
+        len(charts),
+        duration,
+        {status: len(chart_ids) for status, chart_ids in results.items()},
+    )
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
-) -> Union[Dict[str, List[str]], str]:
+) -> Union[Dict[str, List[str]], Dict[str, List[int]], str]:
     """
     Warm up cache.
 
-    This task periodically hits charts to warm up the cache.
+    This task periodically hits charts to warm up the cache, or queries them
+    within the worker when `CACHE_WARMUP_IN_PROCESS` is set.
 
     """
     logger.info("Loading strategy")
@@ -284,6 +456,9 @@ def cache_warmup(
         logger.exception(message)
         return message
 
+    if app.config["CACHE_WARMUP_IN_PROCESS"]:
+        return warm_up_charts(strategy.get_charts())
+
     results: Dict[str, List[str]] = {"success": [], "errors": []}
     for url in strategy.get_urls():
         try:
@@ -24,6 +24,7 @@ import logging
 import time
 import urllib.request
 from collections import namedtuple
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from email.utils import make_msgid, parseaddr
 from typing import (
@@ -35,7 +36,6 @@ from typing import (
     Optional,
     Tuple,
     TYPE_CHECKING,
-    Union,
 )
 from urllib.error import URLError
 
@@ -47,7 +47,6 @@ from flask import current_app, render_template, url_for
 from flask_babel import gettext as __
 from retry.api import retry_call
 from selenium.common.exceptions import WebDriverException
-from selenium.webdriver import chrome, firefox
 from selenium.webdriver.remote.webdriver import WebDriver
 from sqlalchemy import func
 from sqlalchemy.exc import NoSuchColumnError, ResourceClosedError
@@ -209,6 +208,17 @@ def create_webdriver(session: Session) -> WebDriver:
     )
 
 
+@contextmanager
+def lease_webdriver(session: Session) -> Iterator[WebDriver]:
+    """
+    Lease a driver authenticated as the reports user from the pool of the worker
+    """
+    with WebDriverProxy(driver_type=config["WEBDRIVER_TYPE"]).lease(
+        get_reports_user(session)
+    ) as driver:
+        yield driver
+
+
 def get_reports_user(session: Session) -> "User":
     return (
         session.query(security_manager.user_model)
@@ -220,25 +230,6 @@ def get_reports_user(session: Session) -> "User":
     )
 
 
-def destroy_webdriver(
-    driver: Union[chrome.webdriver.WebDriver, firefox.webdriver.WebDriver]
-) -> None:
-    """
-    Destroy a driver
-    """
-
-    # This is some very flaky code in selenium. Hence the retries
-    # and catch-all exceptions
-    try:
-        retry_call(driver.close, tries=2)
-    except Exception:  # pylint: disable=broad-except
-        pass
-    try:
-        driver.quit()
-    except Exception:  # pylint: disable=broad-except
-        pass
-
-
 def deliver_dashboard(  # pylint: disable=too-many-locals
     dashboard_id: int,
     recipients: Optional[str],
@@ -260,28 +251,29 @@ def deliver_dashboard(  # pylint: disable=too-many-locals
             "Superset.dashboard", user_friendly=True, dashboard_id_or_slug=dashboard.id
         )
 
-        # Create a driver, fetch the page, wait for the page to render
-        driver = create_webdriver(session)
-        window = config["WEBDRIVER_WINDOW"]["dashboard"]
-        driver.set_window_size(*window)
-        driver.get(dashboard_url)
-        time.sleep(EMAIL_PAGE_RENDER_WAIT)
-
-        # Set up a function to retry once for the element.
-        # This is buggy in certain selenium versions with firefox driver
-        get_element = getattr(driver, "find_element_by_class_name")
-        element = retry_call(
-            get_element, fargs=["grid-container"], tries=2, delay=EMAIL_PAGE_RENDER_WAIT
-        )
+        # Lease a driver, fetch the page, wait for the page to render
+        with lease_webdriver(session) as driver:
+            window = config["WEBDRIVER_WINDOW"]["dashboard"]
+            driver.set_window_size(*window)
+            driver.get(dashboard_url)
+            time.sleep(EMAIL_PAGE_RENDER_WAIT)
+
+            # Set up a function to retry once for the element.
+            # This is buggy in certain selenium versions with firefox driver
+            get_element = getattr(driver, "find_element_by_class_name")
+            element = retry_call(
+                get_element,
+                fargs=["grid-container"],
+                tries=2,
+                delay=EMAIL_PAGE_RENDER_WAIT,
+            )
 
-        try:
-            screenshot = element.screenshot_as_png
-        except WebDriverException:
-            # Some webdrivers do not support screenshots for elements.
-            # In such cases, take a screenshot of the entire page.
-            screenshot = driver.screenshot()  # pylint: disable=no-member
-        finally:
-            destroy_webdriver(driver)
+            try:
+                screenshot = element.screenshot_as_png
+            except WebDriverException:
+                # Some webdrivers do not support screenshots for elements.
+                # In such cases, take a screenshot of the entire page.
+                screenshot = driver.screenshot()  # pylint: disable=no-member
 
         # Generate the email body and attachments
         report_content = _generate_report_content(
@@ -402,36 +394,33 @@ def _get_slice_screenshot(slice_id: int, session: Session) -> ScreenshotData:
 def _get_slice_visualization(
     slc: Slice, delivery_type: EmailDeliveryType, session: Session
 ) -> ReportContent:
-    # Create a driver, fetch the page, wait for the page to render
-    driver = create_webdriver(session)
-    window = config["WEBDRIVER_WINDOW"]["slice"]
-    driver.set_window_size(*window)
-
     slice_url = _get_url_path("Superset.slice", slice_id=slc.id)
     slice_url_user_friendly = _get_url_path(
         "Superset.slice", slice_id=slc.id, user_friendly=True
     )
 
-    driver.get(slice_url)
-    time.sleep(EMAIL_PAGE_RENDER_WAIT)
+    # Lease a driver, fetch the page, wait for the page to render
+    with lease_webdriver(session) as driver:
+        window = config["WEBDRIVER_WINDOW"]["slice"]
+        driver.set_window_size(*window)
+        driver.get(slice_url)
+        time.sleep(EMAIL_PAGE_RENDER_WAIT)
 
-    # Set up a function to retry once for the element.
-    # This is buggy in certain selenium versions with firefox driver
-    element = retry_call(
-        driver.find_element_by_class_name,
-        fargs=["chart-container"],
-        tries=2,
-        delay=EMAIL_PAGE_RENDER_WAIT,
-    )
+        # Set up a function to retry once for the element.
+        # This is buggy in certain selenium versions with firefox driver
+        element = retry_call(
+            driver.find_element_by_class_name,
+            fargs=["chart-container"],
+            tries=2,
+            delay=EMAIL_PAGE_RENDER_WAIT,
+        )
 
-    try:
-        screenshot = element.screenshot_as_png
-    except WebDriverException:
-        # Some webdrivers do not support screenshots for elements.
-        # In such cases, take a screenshot of the entire page.
-        screenshot = driver.screenshot()  # pylint: disable=no-member
-    finally:
-        destroy_webdriver(driver)
+        try:
+            screenshot = element.screenshot_as_png
+        except WebDriverException:
+            # Some webdrivers do not support screenshots for elements.
+            # In such cases, take a screenshot of the entire page.
+            screenshot = driver.screenshot()  # pylint: disable=no-member
 
     # Generate the email body and attachments
     return _generate_report_content(
@@ -0,0 +1,77 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from celery import Task
+
+from superset import app, db
+from superset.extensions import celery_app
+from superset.models.core import Database
+from superset.sql_parse import Table
+from superset.views.database.upload import load_csv
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="load_csv_to_database", bind=True)
+def load_csv_to_database(  # pylint: disable=too-many-arguments
+    self: Task,
+    database_id: int,
+    table_name: str,
+    schema: Optional[str],
+    path: str,
+    read_csv_kwargs: Dict[str, Any],
+    to_sql_kwargs: Dict[str, Any],
+    user_id: Optional[int],
+) -> int:
+    """
+    Load a CSV file stored in the upload folder into a database table, reporting the
+    number of rows loaded so far in the PROGRESS state of the task. The file is
+    removed once it has been loaded.
+    """
+
+    def progress(rows: int) -> None:
+        # tasks that are run eagerly don't have an id to store their state under
+        if self.request.id:
+            self.update_state(state="PROGRESS", meta={"rows": rows})
+
+    with app.app_context():  # type: ignore
+        stats_logger = app.config["STATS_LOGGER"]
+        try:
+            database = db.session.query(Database).filter_by(id=database_id).one()
+            table = Table(table=table_name, schema=schema)
+            sqla_table = load_csv(
+                database,
+                table,
+                path,
+                read_csv_kwargs,
+                to_sql_kwargs,
+                user_id,
+                progress=progress,
+            )
+        except Exception:
+            db.session.rollback()
+            logger.exception("Unable to upload CSV file to table %s", table_name)
+            stats_logger.incr("failed_csv_upload")
+            raise
+        finally:
+            os.remove(path)
+
+        stats_logger.incr("successful_csv_upload")
+        return sqla_table.id
@@ -0,0 +1,172 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Storage format of SQL Lab query results in the results backend.
+
+A stored payload is framed as a magic string, the length of the msgpack encoded
+query metadata, the metadata itself and the result table. The table is split in
+row groups, each stored as an independently compressed Arrow IPC file (Feather
+V2) and listed in an index, so that reading a page of rows or a subset of the
+columns only decompresses the matching buffers, directly from the stored bytes.
+"""
+import struct
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import msgpack
+import pyarrow as pa
+from pyarrow import feather
+
+from superset.exceptions import SerializationError
+
+MAGIC = b"SUPERSET_ARROW_IPC_1\n"
+HEADER_LENGTH = struct.Struct(">I")
+
+
+def serialize_table(
+    table: pa.Table, compression: Optional[str] = None, batch_size: int = 10000
+) -> bytes:
+    """
+    Serialize a table as row groups of Arrow IPC files, preceded by their index.
+
+    :param table: Table to serialize
+    :param compression: Codec compressing the buffers of the row groups, `lz4`,
+           `zstd` or None
+    :param batch_size: Maximum number of rows per row group
+    :return: Serialized table
+    """
+    groups: List[bytes] = []
+    # offset, length and number of rows of each row group
+    index: List[Tuple[int, int, int]] = []
+    offset = 0
+    # an empty table is stored as an empty row group to keep its schema
+    for start in range(0, table.num_rows or 1, batch_size):
+        group = table.slice(start, batch_size)
+        sink = pa.BufferOutputStream()
+        feather.write_feather(group, sink, compression=compression or "uncompressed")
+        groups.append(sink.getvalue().to_pybytes())
+        index.append((offset, len(groups[-1]), group.num_rows))
+        offset += len(groups[-1])
+
+    header = msgpack.dumps(index)
+    return b"".join([HEADER_LENGTH.pack(len(header)), header, *groups])
+
+
+def _read_index(
+    data: Union[bytes, pa.Buffer]
+) -> Tuple[List[Tuple[int, int, int]], pa.Buffer]:
+    buffer = data if isinstance(data, pa.Buffer) else pa.py_buffer(data)
+    try:
+        (header_length,) = HEADER_LENGTH.unpack_from(buffer)
+        body_offset = HEADER_LENGTH.size + header_length
+        # Arrow doesn't bound check slices of buffers
+        if body_offset > buffer.size:
+            raise ValueError("Truncated header")
+        index = msgpack.loads(buffer.slice(HEADER_LENGTH.size, header_length))
+        body = buffer.slice(body_offset)
+        if any(start + length > body.size for start, length, _ in index):
+            raise ValueError("Truncated row group")
+    except (pa.ArrowException, struct.error, ValueError) as ex:
+        raise SerializationError("Unable to deserialize table") from ex
+    return index, body
+
+
+def get_num_rows(data: Union[bytes, pa.Buffer]) -> int:
+    """
+    Get the number of rows of a serialized table, without deserializing it.
+
+    :param data: Serialized table
+    :return: Number of rows
+    """
+    index, _ = _read_index(data)
+    return sum(rows for _, _, rows in index)
+
+
+def deserialize_table(  # pylint: disable=too-many-locals
+    data: Union[bytes, pa.Buffer],
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> pa.Table:
+    """
+    Deserialize a page of a table stored as indexed row groups.
+
+    :param data: Serialized table
+    :param offset: Index of the first row to read
+    :param limit: Number of rows to read, defaults to all the remaining ones
+    :param columns: Columns to read, defaults to all of them
+    :return: Deserialized table
+    """
+    end = None if limit is None else offset + limit
+    index, body = _read_index(data)
+    try:
+        tables: List[pa.Table] = []
+        first_row = 0
+        group_start = 0
+        for group_offset, group_length, group_rows in index:
+            group_end = group_start + group_rows
+            if group_end > offset and (end is None or group_start < end):
+                if not tables:
+                    first_row = group_start
+                source = pa.BufferReader(body.slice(group_offset, group_length))
+                tables.append(feather.read_table(source, columns=columns))
+            group_start = group_end
+
+        if not tables:
+            # the page is past the end of the table, only its schema is needed
+            source = pa.BufferReader(body.slice(index[0][0], index[0][1]))
+            tables.append(feather.read_table(source, columns=columns).slice(0, 0))
+            first_row = offset
+    except (pa.ArrowException, struct.error, ValueError) as ex:
+        raise SerializationError("Unable to deserialize table") from ex
+
+    table = pa.concat_tables(tables)
+    return table.slice(offset - first_row, limit)
+
+
+def pack_payload(
+    payload: Dict[str, Any], default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Frame a query payload whose `data` key holds a serialized table.
+
+    :param payload: Query payload
+    :param default: Serializer for values msgpack doesn't support
+    :return: Framed payload
+    """
+    metadata = {key: value for key, value in payload.items() if key != "data"}
+    header = msgpack.dumps(metadata, default=default, use_bin_type=True)
+    return b"".join([MAGIC, HEADER_LENGTH.pack(len(header)), header, payload["data"]])
+
+
+def unpack_payload(blob: bytes) -> Tuple[Dict[str, Any], pa.Buffer]:
+    """
+    Unframe a query payload, without copying the serialized table.
+
+    :param blob: Framed payload
+    :return: Query metadata and serialized table
+    """
+    if not blob.startswith(MAGIC):
+        raise SerializationError("Unknown results payload format")
+    buffer = pa.py_buffer(blob)
+    offset = len(MAGIC) + HEADER_LENGTH.size
+    if offset > len(blob):
+        raise SerializationError("Truncated results payload")
+    (header_length,) = HEADER_LENGTH.unpack_from(blob, len(MAGIC))
+    if offset + header_length > len(blob):
+        raise SerializationError("Truncated results payload")
+    metadata = msgpack.loads(blob[offset : offset + header_length], raw=False)
+    return metadata, buffer.slice(offset + header_length)
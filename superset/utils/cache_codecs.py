@@ -0,0 +1,161 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the values stored in the data cache, which hold the dataframe of a
+query under the `df` key along with metadata such as the executed query.
+"""
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, List, Optional, Type
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import feather
+
+logger = logging.getLogger(__name__)
+
+
+class DataCacheCodec:
+    """
+    Stores dataframes as is, leaving it to the cache backend to pickle them.
+
+    Values encoded by any of the codecs can be decoded by all of them, so that
+    entries written before changing `DATA_CACHE_CODEC` remain readable.
+    """
+
+    def encode(  # pylint: disable=no-self-use
+        self, value: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return value
+
+    def decode(  # pylint: disable=no-self-use
+        self, value: Dict[str, Any], columns: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Decode a cached value.
+
+        :param value: Value read from the cache
+        :param columns: Columns of the dataframe to load, defaults to all of them
+        :return: Value holding the dataframe under the `df` key
+        """
+        header = value.get("df_header")
+        if header:
+            codec = COLUMNAR_CODECS[header["format"]]
+            value = {key: val for key, val in value.items() if key != "df_header"}
+            value["df"] = codec.deserialize(value["df"], columns)
+        elif columns is not None and isinstance(value.get("df"), pd.DataFrame):
+            value = {**value, "df": value["df"][columns]}
+        return value
+
+
+class ColumnarDataCacheCodec(DataCacheCodec, ABC):
+    """
+    Stores dataframes as bytes in a columnar format, described by a small header
+    stored alongside them. Dataframes that can't be represented in the format,
+    e.g. having columns of mixed types, are left to the cache backend.
+    """
+
+    format: ClassVar[str] = ""
+
+    def __init__(
+        self, compression: str = "lz4", compression_level: Optional[int] = None
+    ) -> None:
+        self.compression = compression
+        self.compression_level = compression_level
+
+    @abstractmethod
+    def serialize(self, df: pd.DataFrame) -> bytes:
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def deserialize(data: bytes, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        pass
+
+    def encode(self, value: Dict[str, Any]) -> Dict[str, Any]:
+        df = value.get("df")
+        if (
+            not isinstance(df, pd.DataFrame)
+            or isinstance(df.columns, pd.MultiIndex)
+            or not all(isinstance(column, str) for column in df.columns)
+        ):
+            return value
+
+        try:
+            data = self.serialize(df)
+        except (pa.ArrowException, TypeError, ValueError) as ex:
+            logger.info("Dataframe can't be stored as %s: %s", self.format, str(ex))
+            return value
+
+        return {
+            **value,
+            "df": data,
+            "df_header": {"format": self.format, "rowcount": len(df.index)},
+        }
+
+
+class ArrowDataCacheCodec(ColumnarDataCacheCodec):
+    """Stores dataframes as compressed Arrow IPC files (Feather V2)"""
+
+    format = "arrow"
+
+    def serialize(self, df: pd.DataFrame) -> bytes:
+        sink = pa.BufferOutputStream()
+        feather.write_feather(
+            df,
+            sink,
+            compression=self.compression,
+            compression_level=self.compression_level,
+        )
+        return sink.getvalue().to_pybytes()
+
+    @staticmethod
+    def deserialize(data: bytes, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        table = feather.read_table(pa.BufferReader(data), columns=columns)
+        return table.to_pandas(integer_object_nulls=True)
+
+
+class ParquetDataCacheCodec(ColumnarDataCacheCodec):
+    """Stores dataframes as compressed Parquet files"""
+
+    format = "parquet"
+
+    def __init__(
+        self, compression: str = "snappy", compression_level: Optional[int] = None
+    ) -> None:
+        super().__init__(compression, compression_level)
+
+    def serialize(self, df: pd.DataFrame) -> bytes:
+        sink = pa.BufferOutputStream()
+        pq.write_table(
+            pa.Table.from_pandas(df),
+            sink,
+            compression=self.compression,
+            compression_level=self.compression_level,
+        )
+        return sink.getvalue().to_pybytes()
+
+    @staticmethod
+    def deserialize(data: bytes, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        table = pq.read_table(pa.BufferReader(data), columns=columns)
+        return table.to_pandas(integer_object_nulls=True)
+
+
+COLUMNAR_CODECS: Dict[str, Type[ColumnarDataCacheCodec]] = {
+    codec.format: codec for codec in (ArrowDataCacheCodec, ParquetDataCacheCodec)
+}
@@ -0,0 +1,158 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    TypeVar,
+)
+
+from flask import (
+    _request_ctx_stack,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+
+if TYPE_CHECKING:
+    from superset.connectors.base.models import BaseDatasource
+
+ResultType = TypeVar("ResultType")
+
+_semaphores: Dict[Hashable, threading.BoundedSemaphore] = {}
+_semaphores_lock = threading.Lock()
+
+
+@contextmanager
+def concurrency_limit(key: Hashable, limit: int) -> Iterator[None]:
+    """
+    Bound the number of threads of the process running the block concurrently
+    for the same key, e.g. the id of the database being queried.
+
+    :param key: Key the limit applies to
+    :param limit: Maximum number of threads running the block concurrently
+    """
+    with _semaphores_lock:
+        semaphore = _semaphores.get(key)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(limit)
+            _semaphores[key] = semaphore
+    with semaphore:
+        yield
+
+
+def get_concurrency_limit_key(datasource: "BaseDatasource") -> str:
+    """
+    Key limiting the concurrent queries to the database of a datasource, or to
+    the datasource itself when it isn't backed by a database.
+    """
+    database = getattr(datasource, "database", None)
+    return f"database_{database.id}" if database else datasource.uid
+
+
+def load_datasource_relationships(datasource: "BaseDatasource") -> None:
+    """
+    Load the relationships of a datasource needed to query it, as it is bound to
+    the session of the calling thread which can't be shared with worker threads.
+    """
+    for relationship in ("columns", "metrics", "database", "cluster"):
+        getattr(datasource, relationship, None)
+
+
+def copy_current_context(func: Callable[[], ResultType]) -> Callable[[], ResultType]:
+    """
+    Wrap a function so that, when called from another thread, it runs within
+    the Flask app and request contexts of the calling thread, with the same
+    attributes set on `g` (e.g. the logged in user).
+
+    :param func: Function to wrap
+    :return: Wrapped function
+    """
+    if not has_app_context():
+        return func
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_values = dict(g.__dict__)
+    request_ctx = None
+    user = None
+    if has_request_context():
+        request_ctx = _request_ctx_stack.top.copy()
+        user = getattr(_request_ctx_stack.top, "user", None)
+
+    def wrapper() -> ResultType:
+        with app.app_context():
+            for key, value in g_values.items():
+                setattr(g, key, value)
+            if request_ctx is None:
+                return func()
+            with request_ctx:
+                # avoid reloading the user flask-login already loaded
+                if user is not None:
+                    request_ctx.user = user
+                return func()
+
+    return wrapper
+
+
+def run_concurrently(
+    funcs: Sequence[Callable[[], ResultType]],
+    max_workers: int,
+    limit_key: Optional[Hashable] = None,
+    limit: Optional[int] = None,
+) -> List[ResultType]:
+    """
+    Call functions in a thread pool, within the Flask contexts of the caller.
+
+    The functions are simply called one after the other when `max_workers` is 1
+    or lower. Results are returned in the same order as the functions, and the
+    first exception raised, in that order, is reraised.
+
+    :param funcs: Functions to call
+    :param max_workers: Maximum number of threads
+    :param limit_key: Key of the `concurrency_limit` the threads are subject to,
+           e.g. the database being queried
+    :param limit: Maximum number of threads of the process running functions
+           concurrently for `limit_key`
+    :return: Results of the functions
+    """
+    if max_workers <= 1 or len(funcs) <= 1:
+        return [func() for func in funcs]
+
+    def limited(func: Callable[[], ResultType]) -> Callable[[], ResultType]:
+        if limit_key is None or limit is None:
+            return func
+
+        def wrapper() -> ResultType:
+            with concurrency_limit(limit_key, limit):
+                return func()
+
+        return wrapper
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(funcs))) as executor:
+        futures = [
+            executor.submit(copy_current_context(limited(func))) for func in funcs
+        ]
+        return [future.result() for future in futures]
@@ -65,6 +65,7 @@ import bleach
 import markdown as md
 import numpy as np
 import pandas as pd
+import simplejson
 import sqlalchemy as sa
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
@@ -105,6 +106,11 @@ try:
 except ImportError:
     pass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from superset.connectors.base.models import BaseColumn, BaseDatasource
     from superset.models.core import Database
@@ -293,6 +299,18 @@ class RowLevelSecurityFilterType(str, Enum):
     BASE = "Base"
 
 
+class SeriesLimitStrategy(str, Enum):
+    """
+    How queries with a series limit are restricted to their top series
+    """
+
+    # inner join with a subquery returning the top series
+    JOIN = "join"
+    # prequery returning the top series, whose values are filtered on with `IN`
+    # predicates, or `OR`s of equalities when grouping by several columns
+    PREQUERY = "prequery"
+
+
 class TimeRangeEndpoint(str, Enum):
     """
     The time range endpoint types which represent inclusive, exclusive, or unknown.
@@ -608,6 +626,31 @@ def json_dumps_w_dates(payload: Dict[Any, Any]) -> str:
     return json.dumps(payload, default=json_int_dttm_ser)
 
 
+def json_dumps_data(payload: Any, default: Callable[[Any], Any]) -> str:
+    """
+    Serialize chart data or query results with the ``DATA_JSON_BACKEND``, NaN and
+    infinite floats being encoded as null.
+
+    Bytes are always handed to ``default``. The ``columnar`` backend uses orjson
+    when it is installed, falling back to simplejson for payloads orjson cannot
+    encode, e.g. integers over 64 bits.
+
+    :param payload: the object to serialize
+    :param default: the serializer of objects that are not natively supported
+    :returns: the JSON document
+    """
+    if current_app.config["DATA_JSON_BACKEND"] == "columnar" and orjson:
+        try:
+            return orjson.dumps(
+                payload,
+                default=default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return simplejson.dumps(payload, default=default, ignore_nan=True, encoding=None)
+
+
 def error_msg_from_exception(ex: Exception) -> str:
     """Translate exception into error message
 
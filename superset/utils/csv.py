@@ -16,7 +16,7 @@
 # under the License.
 import re
 import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 from urllib.error import URLError
 
 import pandas as pd
@@ -69,6 +69,39 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     return df.to_csv(**kwargs)
 
 
+def df_to_escaped_csv_chunks(
+    dfs: Iterable[pd.DataFrame], row_limit: Optional[int] = None, **kwargs: Any
+) -> Iterator[str]:
+    """
+    Convert data frames sharing the same columns to a single escaped CSV document,
+    one chunk per data frame, so that only one of them is held in memory at a time.
+
+    :param dfs: Data frames to convert, the first one providing the header
+    :param row_limit: Maximum number of rows to write
+    :param kwargs: Options passed to `DataFrame.to_csv`
+    :return: Chunks of the CSV document
+    """
+    header = kwargs.pop("header", True)
+    remaining = row_limit
+    for df in dfs:
+        if remaining is not None:
+            df = df[:remaining]
+            remaining -= len(df.index)
+        yield df_to_escaped_csv(df, header=header, **kwargs)
+        header = False
+        if remaining is not None and remaining <= 0:
+            break
+
+
+def split_df(df: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Split a data frame in chunks of at most `chunk_size` rows. An empty data frame
+    is returned as a single empty chunk, keeping its columns.
+    """
+    for start in range(0, len(df.index) or 1, chunk_size):
+        yield df[start : start + chunk_size]
+
+
 def get_chart_csv_data(
     chart_url: str, auth_cookies: Optional[Dict[str, str]] = None
 ) -> Optional[bytes]:
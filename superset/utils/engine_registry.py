@@ -0,0 +1,160 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.pool import QueuePool
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+from superset.utils.hashing import md5_sha_from_dict
+
+logger = logging.getLogger(__name__)
+
+# `create_engine` parameters only supported by pools keeping connections around,
+# which need to be discarded when creating an engine with a `NullPool`
+POOL_ONLY_PARAMS = ("pool_size", "max_overflow", "pool_timeout")
+
+
+class EngineKey(NamedTuple):
+    database_id: int
+    effective_username: Optional[str]
+    schema: Optional[str]
+    # hash of the URL and engine parameters, which changes whenever the
+    # connection settings of the database are edited
+    params_hash: str
+
+
+def get_params_hash(sqlalchemy_url: URL, params: Dict[str, Any]) -> str:
+    return md5_sha_from_dict(
+        {"url": str(sqlalchemy_url), "params": params}, default=str
+    )
+
+
+class EngineRegistry:
+    """
+    Registry of pooled SQLAlchemy engines shared across requests, bounded to the
+    `SQLALCHEMY_ENGINE_POOLING_MAX_ENGINES` most recently used ones.
+
+    Engines are keyed by database, effective user, schema and a hash of the
+    connection parameters, so editing a database never hands out an engine built
+    with stale settings, even in processes that didn't observe the change.
+    """
+
+    def __init__(self) -> None:
+        self._engines: "OrderedDict[EngineKey, Engine]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._enabled = False
+        self._max_engines = 0
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+
+    def init_app(self, app: Flask) -> None:
+        self._enabled = app.config["SQLALCHEMY_ENGINE_POOLING"]
+        self._max_engines = app.config["SQLALCHEMY_ENGINE_POOLING_MAX_ENGINES"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def get_engine(  # pylint: disable=too-many-arguments
+        self,
+        database_id: int,
+        effective_username: Optional[str],
+        schema: Optional[str],
+        sqlalchemy_url: URL,
+        params: Dict[str, Any],
+    ) -> Engine:
+        """
+        Return the pooled engine for a database connection, creating it if needed.
+
+        :param database_id: Id of the database
+        :param effective_username: User the connection is impersonating, if any
+        :param schema: Schema the connection defaults to, if any
+        :param sqlalchemy_url: URL the engine connects to
+        :param params: `create_engine` parameters
+        :return: SQLAlchemy engine
+        """
+        key = EngineKey(
+            database_id,
+            effective_username,
+            schema,
+            get_params_hash(sqlalchemy_url, params),
+        )
+        evicted = []
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine:
+                self._engines.move_to_end(key)
+                self._stats_logger.incr("engine_registry.hit")
+            else:
+                self._stats_logger.incr("engine_registry.miss")
+                engine = create_engine(sqlalchemy_url, **params)
+                self._engines[key] = engine
+                while len(self._engines) > self._max_engines:
+                    evicted.append(self._engines.popitem(last=False)[1])
+
+        for evicted_engine in evicted:
+            self._stats_logger.incr("engine_registry.evicted")
+            evicted_engine.dispose()
+        self.log_pool_stats()
+        return engine
+
+    def invalidate(self, database_id: int) -> None:
+        """
+        Dispose of all the engines of a database.
+
+        :param database_id: Id of the database
+        """
+        with self._lock:
+            keys = [key for key in self._engines if key.database_id == database_id]
+            engines = [self._engines.pop(key) for key in keys]
+
+        for engine in engines:
+            engine.dispose()
+
+    def clear(self) -> None:
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+
+        for engine in engines:
+            engine.dispose()
+
+    def log_pool_stats(self) -> None:
+        with self._lock:
+            pools = [engine.pool for engine in self._engines.values()]
+
+        self._stats_logger.gauge("engine_registry.engines", len(pools))
+        queue_pools = [pool for pool in pools if isinstance(pool, QueuePool)]
+        self._stats_logger.gauge(
+            "engine_registry.connections.checked_out",
+            sum(pool.checkedout() for pool in queue_pools),
+        )
+        self._stats_logger.gauge(
+            "engine_registry.connections.idle",
+            sum(pool.checkedin() for pool in queue_pools),
+        )
+        self._stats_logger.gauge(
+            "engine_registry.connections.overflow",
+            sum(max(pool.overflow(), 0) for pool in queue_pools),
+        )
@@ -14,23 +14,43 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import atexit
 import functools
 import inspect
 import json
 import logging
+import os
+import queue
+import random
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta
-from typing import Any, Callable, cast, Dict, Iterator, Optional, Type, Union
-
-from flask import current_app, g, request
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
+
+from flask import current_app, Flask, g, has_app_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 from typing_extensions import Literal
 
 from superset.stats_logger import BaseStatsLogger
 
+if TYPE_CHECKING:
+    from superset.models.core import Log
+
 
 def collect_request_payload() -> Dict[str, Any]:
     """Collect log payload identifiable from request context"""
@@ -308,9 +328,32 @@ class DBEventLogger(AbstractEventLogger):
         *args: Any,
         **kwargs: Any,
     ) -> None:
+        self.save_logs(
+            self.get_logs(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
+            )
+        )
+
+    @staticmethod
+    def get_logs(  # pylint: disable=too-many-arguments
+        user_id: Optional[int],
+        action: str,
+        dashboard_id: Optional[int],
+        duration_ms: Optional[int],
+        slice_id: Optional[int],
+        referrer: Optional[str],
+        records: List[Dict[str, Any]],
+    ) -> List["Log"]:
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
+        # the time of the event, as buffered logs are only saved later on
+        dttm = datetime.utcnow()
         logs = []
         for record in records:
             json_string: Optional[str]
@@ -326,8 +369,13 @@ class DBEventLogger(AbstractEventLogger):
                 duration_ms=duration_ms,
                 referrer=referrer,
                 user_id=user_id,
+                dttm=dttm,
             )
             logs.append(log)
+        return logs
+
+    @staticmethod
+    def save_logs(logs: List["Log"]) -> None:
         try:
             sesh = current_app.appbuilder.get_session
             sesh.bulk_save_objects(logs)
@@ -335,3 +383,132 @@ class DBEventLogger(AbstractEventLogger):
         except SQLAlchemyError as ex:
             logging.error("DBEventLogger failed to log event(s)")
             logging.exception(ex)
+
+
+class BufferedDBEventLogger(  # pylint: disable=too-many-instance-attributes
+    DBEventLogger
+):
+    """
+    Event logger that commits logs to Superset DB in batches from a background
+    thread, rather than within the request being logged.
+
+    Logs are buffered in a queue of at most `max_queue_size` logs, flushed every
+    `flush_interval` seconds or as soon as `batch_size` logs are buffered. Once
+    the queue is more than `sample_threshold` full, only a `sample_rate` fraction
+    of the logs is kept, and logs are dropped once it is full.
+
+        EVENT_LOGGER = BufferedDBEventLogger(batch_size=500, flush_interval=5)
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 1,
+        sample_threshold: float = 0.8,
+        sample_rate: float = 0.1,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_threshold = sample_threshold
+        self.sample_rate = sample_rate
+        self._queue: "queue.Queue[Log]" = queue.Queue(max_queue_size)
+        self._app: Optional[Flask] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        atexit.register(self.flush)
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: Optional[int],
+        action: str,
+        dashboard_id: Optional[int],
+        duration_ms: Optional[int],
+        slice_id: Optional[int],
+        referrer: Optional[str],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._start()
+        stats_logger = self.stats_logger
+        for log in self.get_logs(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        ):
+            if (
+                self._queue.qsize() >= self.max_queue_size * self.sample_threshold
+                and random.random() >= self.sample_rate
+            ):
+                stats_logger.incr("event_logger.sampled_out")
+                continue
+            try:
+                self._queue.put_nowait(log)
+            except queue.Full:
+                stats_logger.incr("event_logger.dropped")
+
+        queue_depth = self._queue.qsize()
+        stats_logger.gauge("event_logger.queue_depth", queue_depth)
+        if queue_depth >= self.batch_size:
+            self._flush_event.set()
+
+    def _start(self) -> None:
+        """Start the flushing thread of the process if not running yet"""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+
+        with self._lock:
+            if self._pid == pid:
+                return
+            if self._pid is not None:
+                # the thread and logs buffered by the parent of a forked process
+                # aren't usable by the child
+                self._queue = queue.Queue(self.max_queue_size)
+                self._flush_event = threading.Event()
+            self._app = current_app._get_current_object()  # pylint: disable=W0212
+            threading.Thread(target=self._run, name="event-logger", daemon=True).start()
+            self._pid = pid
+
+    def _run(self) -> None:
+        while True:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("BufferedDBEventLogger failed to flush event(s)")
+
+    def flush(self) -> None:
+        """Commit the logs buffered by the process to Superset DB"""
+        if not self._app:
+            return
+
+        with self._flush_lock:
+            logs: List["Log"] = []
+            while True:
+                try:
+                    logs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not logs:
+                return
+
+            # the session of the calling thread is removed when popping a context
+            with nullcontext() if has_app_context() else self._app.app_context():
+                stats_logger = self.stats_logger
+                start = time.monotonic()
+                for i in range(0, len(logs), self.batch_size):
+                    self.save_logs(logs[i : i + self.batch_size])
+                stats_logger.timing(
+                    "event_logger.flush_time", (time.monotonic() - start) * 1000
+                )
+                stats_logger.gauge("event_logger.flushed", len(logs))
@@ -14,23 +14,29 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import hashlib
 import logging
+import multiprocessing
 from decimal import Decimal
-from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from functools import partial, wraps
+from typing import Any, Callable, cast, Dict, List, Optional, Tuple, Union
 
 import geohash as geohash_lib
 import numpy as np
+from flask import current_app
 from flask_babel import gettext as _
 from geopy.point import Point
-from pandas import DataFrame, NamedAgg, Series, Timestamp
+from pandas import concat, DataFrame, NamedAgg, Series, Timestamp
+from pandas.util import hash_pandas_object
 
 from superset.exceptions import QueryObjectValidationError
+from superset.extensions import cache_manager
 from superset.utils.core import (
     DTTM_ALIAS,
     PostProcessingBoxplotWhiskerType,
     PostProcessingContributionOrientation,
 )
+from superset.utils.hashing import md5_sha_from_dict
 
 NUMPY_FUNCTIONS = {
     "average": np.average,
@@ -58,6 +64,8 @@ NUMPY_FUNCTIONS = {
     "var": np.var,
 }
 
+BOXPLOT_OPERATORS = ("mean", "median", "max", "min", "q1", "q3", "count", "outliers")
+
 DENYLIST_ROLLING_FUNCTIONS = (
     "count",
     "corr",
@@ -127,6 +135,7 @@ def _flatten_column_after_pivot(
 
 def validate_column_args(*argnames: str) -> Callable[..., Any]:
     def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
         def wrapped(df: DataFrame, **options: Any) -> Any:
             columns = df.columns.tolist()
             for name in argnames:
@@ -618,6 +627,19 @@ def _prophet_parse_seasonality(
         return input_value
 
 
+def _import_prophet() -> Any:
+    try:
+        prophet_logger = logging.getLogger("prophet.plot")
+
+        prophet_logger.setLevel(logging.CRITICAL)
+        from prophet import Prophet  # pylint: disable=import-error
+
+        prophet_logger.setLevel(logging.NOTSET)
+    except ModuleNotFoundError:
+        raise QueryObjectValidationError(_("`prophet` package not installed"))
+    return Prophet
+
+
 def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     df: DataFrame,
     confidence_interval: float,
@@ -630,15 +652,7 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     """
     Fit a prophet model and return a DataFrame with predicted results.
     """
-    try:
-        prophet_logger = logging.getLogger("prophet.plot")
-
-        prophet_logger.setLevel(logging.CRITICAL)
-        from prophet import Prophet  # pylint: disable=import-error
-
-        prophet_logger.setLevel(logging.NOTSET)
-    except ModuleNotFoundError:
-        raise QueryObjectValidationError(_("`prophet` package not installed"))
+    Prophet = _import_prophet()  # pylint: disable=invalid-name
     model = Prophet(
         interval_width=confidence_interval,
         yearly_seasonality=yearly_seasonality,
@@ -653,6 +667,56 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     return forecast.join(df.set_index("ds"), on="ds").set_index(["ds"])
 
 
+def _prophet_cache_key(df: DataFrame, params: Dict[str, Any]) -> str:
+    series_hash = hashlib.md5(
+        hash_pandas_object(df, index=False).values.tobytes()
+    ).hexdigest()
+    return "prophet-" + md5_sha_from_dict({"series": series_hash, **params})
+
+
+def _prophet_forecast(series: List[DataFrame], **params: Any) -> List[DataFrame]:
+    """
+    Fit a prophet model to each series and return their predicted results. Forecasts
+    are reused from the data cache when the series and parameters are unchanged, and
+    the other series are fitted in a pool of `PROPHET_PROCESSES` processes.
+    """
+    config = current_app.config
+    cache_timeout = config["PROPHET_CACHE_TIMEOUT"]
+    keys = [_prophet_cache_key(df, params) for df in series]
+    forecasts: List[Optional[DataFrame]] = [
+        cache_manager.data_cache.get(key) if cache_timeout is not None else None
+        for key in keys
+    ]
+    missing = [i for i, forecast in enumerate(forecasts) if forecast is None]
+
+    fit_and_predict = partial(_prophet_fit_and_predict, **params)
+    processes = min(config["PROPHET_PROCESSES"], len(missing))
+    # daemonic processes, e.g. Celery workers, can't have children
+    if processes > 1 and not multiprocessing.current_process().daemon:
+        # imported once, before the worker processes are forked
+        _import_prophet()
+        with multiprocessing.Pool(processes) as pool:
+            try:
+                results = pool.map_async(
+                    fit_and_predict, [series[i] for i in missing]
+                ).get(config["PROPHET_TIMEOUT"])
+            except multiprocessing.TimeoutError:
+                raise QueryObjectValidationError(
+                    _(
+                        "Forecast timed out after %(timeout)s seconds",
+                        timeout=config["PROPHET_TIMEOUT"],
+                    )
+                )
+    else:
+        results = [fit_and_predict(series[i]) for i in missing]
+
+    for i, result in zip(missing, results):
+        forecasts[i] = result
+        if cache_timeout is not None:
+            cache_manager.data_cache.set(keys[i], result, timeout=cache_timeout)
+    return cast(List[DataFrame], forecasts)
+
+
 def prophet(  # pylint: disable=too-many-arguments
     df: DataFrame,
     time_grain: str,
@@ -708,34 +772,71 @@ def prophet(  # pylint: disable=too-many-arguments
     if len(df.columns) < 2:
         raise QueryObjectValidationError(_("DataFrame include at least one series"))
 
-    target_df = DataFrame()
-    for column in [column for column in df.columns if column != DTTM_ALIAS]:
-        fit_df = _prophet_fit_and_predict(
-            df=df[[DTTM_ALIAS, column]].rename(columns={DTTM_ALIAS: "ds", column: "y"}),
-            confidence_interval=confidence_interval,
-            yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
-            weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
-            daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
-            periods=periods,
-            freq=freq,
-        )
-        new_columns = [
-            f"{column}__yhat",
-            f"{column}__yhat_lower",
-            f"{column}__yhat_upper",
-            f"{column}",
-        ]
-        fit_df.columns = new_columns
-        if target_df.empty:
-            target_df = fit_df
-        else:
-            for new_column in new_columns:
-                target_df = target_df.assign(**{new_column: fit_df[new_column]})
+    columns = [column for column in df.columns if column != DTTM_ALIAS]
+    forecasts = _prophet_forecast(
+        [
+            df[[DTTM_ALIAS, column]].rename(columns={DTTM_ALIAS: "ds", column: "y"})
+            for column in columns
+        ],
+        confidence_interval=confidence_interval,
+        yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
+        weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
+        daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
+        periods=periods,
+        freq=freq,
+    )
+    target_df = concat(
+        [
+            fit_df.set_axis(
+                [
+                    f"{column}__yhat",
+                    f"{column}__yhat_lower",
+                    f"{column}__yhat_upper",
+                    f"{column}",
+                ],
+                axis=1,
+            )
+            for column, fit_df in zip(columns, forecasts)
+        ],
+        axis=1,
+    )
     target_df.reset_index(level=0, inplace=True)
     return target_df.rename(columns={"ds": DTTM_ALIAS})
 
 
-def boxplot(
+def _boxplot_outliers(
+    values: np.ndarray,
+    codes: np.ndarray,
+    whisker_low: np.ndarray,
+    whisker_high: np.ndarray,
+    num_groups: int,
+) -> List[List[Any]]:
+    """
+    Collect the values outside of the whiskers of their group, the values above the
+    high whisker followed by the ones below the low whisker.
+
+    :param values: values of the metric for each row
+    :param codes: position of the group of each row
+    :param whisker_low: low whisker of each group
+    :param whisker_high: high whisker of each group
+    :param num_groups: number of groups
+    :return: list of outliers for each group
+    """
+    with np.errstate(invalid="ignore"):
+        above = values > whisker_high[codes]
+        below = values < whisker_low[codes]
+    outlier_rows = np.flatnonzero(above | below)
+    # a stable sort keeps the original order of the values within each group
+    order = np.lexsort((below[outlier_rows], codes[outlier_rows]))
+    outlier_rows = outlier_rows[order]
+    counts = np.bincount(codes[outlier_rows], minlength=num_groups)
+    return [
+        group_outliers.tolist()
+        for group_outliers in np.split(values[outlier_rows], np.cumsum(counts)[:-1])
+    ]
+
+
+def boxplot(  # pylint: disable=too-many-locals
     df: DataFrame,
     groupby: List[str],
     metrics: List[str],
@@ -766,27 +867,7 @@ def boxplot(
     :return: DataFrame with boxplot statistics per groupby
     """
 
-    def quartile1(series: Series) -> float:
-        return np.nanpercentile(series, 25, interpolation="midpoint")
-
-    def quartile3(series: Series) -> float:
-        return np.nanpercentile(series, 75, interpolation="midpoint")
-
-    if whisker_type == PostProcessingBoxplotWhiskerType.TUKEY:
-
-        def whisker_high(series: Series) -> float:
-            upper_outer_lim = quartile3(series) + 1.5 * (
-                quartile3(series) - quartile1(series)
-            )
-            return series[series <= upper_outer_lim].max()
-
-        def whisker_low(series: Series) -> float:
-            lower_outer_lim = quartile1(series) - 1.5 * (
-                quartile3(series) - quartile1(series)
-            )
-            return series[series >= lower_outer_lim].min()
-
-    elif whisker_type == PostProcessingBoxplotWhiskerType.PERCENTILE:
+    if whisker_type == PostProcessingBoxplotWhiskerType.PERCENTILE:
         if (
             not isinstance(percentiles, (list, tuple))
             or len(percentiles) != 2
@@ -800,36 +881,81 @@ def boxplot(
                     "of which the first is lower than the second value"
                 )
             )
-        low, high = percentiles[0], percentiles[1]
-
-        def whisker_high(series: Series) -> float:
-            return np.nanpercentile(series, high)
-
-        def whisker_low(series: Series) -> float:
-            return np.nanpercentile(series, low)
+    for metric in metrics:
+        if metric not in df:
+            raise QueryObjectValidationError(
+                _(
+                    "Column referenced by aggregate is undefined: %(column)s",
+                    column=metric,
+                )
+            )
 
+    if groupby:
+        df_groupby = df.groupby(by=groupby)
     else:
-        whisker_high = np.max
-        whisker_low = np.min
-
-    def outliers(series: Series) -> Set[float]:
-        above = series[series > whisker_high(series)]
-        below = series[series < whisker_low(series)]
-        return above.tolist() + below.tolist()
-
-    operators: Dict[str, Callable[[Any], Any]] = {
-        "mean": np.mean,
-        "median": np.median,
-        "max": whisker_high,
-        "min": whisker_low,
-        "q1": quartile1,
-        "q3": quartile3,
-        "count": np.ma.count,
-        "outliers": outliers,
-    }
-    aggregates: Dict[str, Dict[str, Union[str, Callable[..., Any]]]] = {
-        f"{metric}__{operator_name}": {"column": metric, "operator": operator}
-        for operator_name, operator in operators.items()
-        for metric in metrics
-    }
-    return aggregate(df, groupby=groupby, aggregates=aggregates)
+        df_groupby = df.groupby(lambda _: True)
+    # position of the group of each row, -1 for rows with null groupby values
+    codes = df_groupby.ngroup().to_numpy()
+    rows = codes >= 0
+    codes = codes[rows]
+    index = df_groupby.size().index
+    if len(index) == 0:
+        # there are no groups to calculate statistics for, e.g. if the frame is
+        # empty or all groupby values are null
+        return DataFrame(
+            columns=groupby
+            + [
+                f"{metric}__{operator_name}"
+                for operator_name in BOXPLOT_OPERATORS
+                for metric in metrics
+            ]
+        )
+
+    statistics: Dict[str, Dict[str, Any]] = {}
+    for metric in metrics:
+        series = df_groupby[metric]
+        values = df[metric][rows].to_numpy()
+        quartiles = series.quantile([0.25, 0.75], interpolation="midpoint").unstack()
+        q1 = quartiles[0.25].to_numpy()
+        q3 = quartiles[0.75].to_numpy()
+
+        if whisker_type == PostProcessingBoxplotWhiskerType.TUKEY:
+            # the whiskers are the most extreme values within 1.5 IQR of the quartiles
+            upper_limit = (q3 + 1.5 * (q3 - q1))[codes]
+            lower_limit = (q1 - 1.5 * (q3 - q1))[codes]
+            upper = values <= upper_limit
+            lower = values >= lower_limit
+            highest = Series(values[upper]).groupby(codes[upper]).max()
+            lowest = Series(values[lower]).groupby(codes[lower]).min()
+            whisker_high = highest.reindex(range(len(index))).to_numpy()
+            whisker_low = lowest.reindex(range(len(index))).to_numpy()
+        elif whisker_type == PostProcessingBoxplotWhiskerType.PERCENTILE:
+            low, high = percentiles[0], percentiles[1]  # type: ignore
+            whiskers = series.quantile([low / 100, high / 100]).unstack()
+            whisker_low = whiskers[low / 100].to_numpy()
+            whisker_high = whiskers[high / 100].to_numpy()
+        else:
+            whisker_high = series.max().to_numpy()
+            whisker_low = series.min().to_numpy()
+
+        statistics[metric] = {
+            "mean": series.mean().to_numpy(),
+            "median": series.median().to_numpy(),
+            "max": whisker_high,
+            "min": whisker_low,
+            "q1": q1,
+            "q3": q3,
+            "count": series.size().to_numpy(),
+            "outliers": _boxplot_outliers(
+                values, codes, whisker_low, whisker_high, len(index)
+            ),
+        }
+
+    return DataFrame(
+        {
+            f"{metric}__{operator_name}": metric_statistics[operator_name]
+            for operator_name in BOXPLOT_OPERATORS
+            for metric, metric_statistics in statistics.items()
+        },
+        index=index,
+    ).reset_index(drop=not groupby)
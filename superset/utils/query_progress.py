@@ -0,0 +1,223 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING
+
+import redis
+from flask import Flask
+from sqlalchemy.orm import Session
+
+from superset.utils.core import QueryStatus
+
+if TYPE_CHECKING:
+    from superset.models.sql_lab import Query
+
+logger = logging.getLogger(__name__)
+
+STOP_KEY_TIMEOUT = 24 * 60 * 60
+
+
+class QueryProgressTracker:  # pylint: disable=too-many-instance-attributes
+    """
+    Tracks the progress of a running query, and whether it was stopped.
+
+    Polls get less frequent as the query runs longer, from the poll interval of
+    the database up to `SQLLAB_MAX_POLL_INTERVAL` seconds. Progress updates are
+    committed at most every `SQLLAB_PROGRESS_COMMIT_INTERVAL` seconds, and stop
+    requests are pushed through Redis when `SQLLAB_QUERY_PROGRESS_REDIS_CONFIG`
+    is set, rather than read from the metadata database on every poll.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        query: "Query",
+        session: Session,
+        poll_interval: float,
+        max_poll_interval: float,
+        commit_interval: float,
+        pubsub: Optional[redis.client.PubSub] = None,
+        stopped: bool = False,
+    ) -> None:
+        self._query = query
+        self._query_id = query.id
+        self._session = session
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max(max_poll_interval, poll_interval)
+        self._commit_interval = commit_interval
+        self._pubsub = pubsub
+        self._stopped = stopped
+        self._start = time.monotonic()
+        self._progress = query.progress or 0
+        self._committed_progress = self._progress
+        self._last_commit = self._start
+
+    @property
+    def poll_interval(self) -> float:
+        """Time in seconds to wait before polling the query again"""
+        age = time.monotonic() - self._start
+        return min(max(self._poll_interval, age / 20), self._max_poll_interval)
+
+    def is_stopped(self) -> bool:
+        """Whether the query was stopped or timed out"""
+        if self._pubsub is None and not self._stopped:
+            status = (
+                self._session.query(type(self._query).status)
+                .filter_by(id=self._query_id)
+                .scalar()
+            )
+            self._stopped = status in (QueryStatus.STOPPED, QueryStatus.TIMED_OUT)
+        return self._stopped
+
+    def wait(self) -> None:
+        """Wait until the next poll, or until the query is stopped"""
+        interval = self.poll_interval
+        if self._pubsub is None:
+            time.sleep(interval)
+            return
+
+        deadline = time.monotonic() + interval
+        while not self._stopped:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                return
+            try:
+                message = self._pubsub.get_message(timeout=timeout)
+            except redis.RedisError:
+                logger.warning(
+                    "Lost the stop requests of query %i, falling back to polling "
+                    "the metadata database",
+                    self._query_id,
+                )
+                self._pubsub = None
+                time.sleep(max(deadline - time.monotonic(), 0))
+                return
+            if message and message["type"] == "message":
+                self._stopped = True
+
+    def set_progress(self, progress: float) -> None:
+        """Record the progress of the query, committed if due"""
+        if progress <= self._progress:
+            return
+        self._progress = progress
+        if time.monotonic() - self._last_commit >= self._commit_interval:
+            self.commit()
+
+    def commit(self, **values: Any) -> None:
+        """
+        Commit the progress of the query if changed, along with other values.
+
+        :param values: Other attributes of the query to commit, e.g. its
+               tracking URL
+        """
+        if self._progress > self._committed_progress:
+            values["progress"] = self._progress
+        if not values:
+            return
+        for key, value in values.items():
+            setattr(self._query, key, value)
+        self._session.commit()
+        self._committed_progress = self._progress
+        self._last_commit = time.monotonic()
+
+
+class QueryProgressChannel:
+    """
+    Channel pushing the stop requests of queries to the workers running them.
+    """
+
+    def __init__(self) -> None:
+        self._redis: Optional[redis.Redis] = None
+        self._max_poll_interval: float = 0
+        self._commit_interval: float = 0
+
+    def init_app(self, app: Flask) -> None:
+        redis_config: Optional[Dict[str, Any]] = app.config[
+            "SQLLAB_QUERY_PROGRESS_REDIS_CONFIG"
+        ]
+        self._redis = (
+            redis.Redis(**redis_config, decode_responses=True)  # type: ignore
+            if redis_config
+            else None
+        )
+        self._max_poll_interval = app.config["SQLLAB_MAX_POLL_INTERVAL"]
+        self._commit_interval = app.config["SQLLAB_PROGRESS_COMMIT_INTERVAL"]
+
+    @staticmethod
+    def get_channel(query_id: int) -> str:
+        return f"superset-query-stop-{query_id}"
+
+    def request_stop(self, query_id: int) -> None:
+        """
+        Notify the worker running a query that it was stopped. The key set
+        along with the message covers workers that haven't subscribed yet.
+
+        :param query_id: Id of the query
+        """
+        if self._redis is None:
+            return
+        channel = self.get_channel(query_id)
+        try:
+            self._redis.set(channel, 1, ex=STOP_KEY_TIMEOUT)
+            self._redis.publish(channel, 1)
+        except redis.RedisError:
+            logger.warning("Failed to notify query %i was stopped", query_id)
+
+    @contextmanager
+    def track(
+        self, query: "Query", session: Session, poll_interval: float
+    ) -> Iterator[QueryProgressTracker]:
+        """
+        Track the progress of a running query, the pending progress being
+        committed when the block exits.
+
+        :param query: The running query
+        :param session: Session the query is bound to
+        :param poll_interval: Initial time in seconds between two polls
+        """
+        pubsub = None
+        stopped = False
+        if self._redis is not None:
+            channel = self.get_channel(query.id)
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(channel)
+                stopped = bool(self._redis.exists(channel))
+            except redis.RedisError:
+                logger.warning(
+                    "Failed to subscribe to the stop requests of query %i, "
+                    "falling back to polling the metadata database",
+                    query.id,
+                )
+                pubsub = None
+
+        tracker = QueryProgressTracker(
+            query,
+            session,
+            poll_interval,
+            self._max_poll_interval,
+            self._commit_interval,
+            pubsub,
+            stopped,
+        )
+        try:
+            yield tracker
+            tracker.commit()
+        finally:
+            if pubsub is not None:
+                pubsub.close()
@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from flask import Flask, g, has_app_context
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+from superset.utils.dates import now_as_float
+
+
+class GeneratedQuery(NamedTuple):
+    extra_cache_keys: List[Any]
+    labels_expected: List[str]
+    prequeries: List[str]
+    sql: str
+
+
+class SqlGenerationCache:
+    """
+    Cache of the SQL generated for query objects, so that templates are rendered
+    and statements compiled once per request, even though the SQL is needed both
+    to compute the cache key of a query and to run it.
+
+    Generated queries are memoized for the duration of the request, and the
+    `SQL_GENERATION_CACHE_SIZE` most recently used ones that don't depend on the
+    request (e.g. that aren't templated) are kept across requests.
+    """
+
+    def __init__(self) -> None:
+        self._queries: "OrderedDict[str, GeneratedQuery]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = 0
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+
+    def init_app(self, app: Flask) -> None:
+        self._max_size = app.config["SQL_GENERATION_CACHE_SIZE"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+        app.teardown_request(self._clear_memo)
+
+    @staticmethod
+    def _clear_memo(  # pylint: disable=unused-argument
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        # the application context may outlive the request, e.g. in tests
+        g.pop("generated_queries", None)
+
+    def get(
+        self, key: str, generate: Callable[[], GeneratedQuery], shareable: bool
+    ) -> GeneratedQuery:
+        """
+        Return the query generated for a key, generating it if needed.
+
+        :param key: Key identifying the query object, datasource version and row
+               level security filters the query is generated from
+        :param generate: Function generating the query
+        :param shareable: Whether the query can be reused across requests
+        :return: Generated query
+        """
+        memo: Dict[str, GeneratedQuery] = (
+            g.setdefault("generated_queries", {}) if has_app_context() else {}
+        )
+        query = memo.get(key)
+        if query:
+            self._stats_logger.incr("sql_generation_cache.memo_hit")
+            return query
+
+        shareable = shareable and self._max_size > 0
+        if shareable:
+            with self._lock:
+                query = self._queries.get(key)
+                if query:
+                    self._queries.move_to_end(key)
+            if query:
+                self._stats_logger.incr("sql_generation_cache.hit")
+                memo[key] = query
+                return query
+
+        self._stats_logger.incr("sql_generation_cache.miss")
+        start = now_as_float()
+        query = generate()
+        self._stats_logger.timing(
+            "sql_generation_cache.generate_time", now_as_float() - start
+        )
+        memo[key] = query
+        if shareable:
+            with self._lock:
+                self._queries[key] = query
+                while len(self._queries) > self._max_size:
+                    self._queries.popitem(last=False)
+        return query
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queries.clear()
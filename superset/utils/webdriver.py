@@ -16,8 +16,9 @@
 # under the License.
 
 import logging
-import time
-from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, Optional, Tuple, TYPE_CHECKING
 
 from flask import current_app
 from retry.api import retry_call
@@ -25,10 +26,11 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver import chrome, firefox
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from superset.extensions import machine_auth_provider_factory
+from superset.extensions import machine_auth_provider_factory, webdriver_pool
 
 WindowSize = Tuple[int, int]
 logger = logging.getLogger(__name__)
@@ -36,13 +38,41 @@ logger = logging.getLogger(__name__)
 # Time in seconds, we will wait for the page to load and render
 SELENIUM_CHECK_INTERVAL = 2
 SELENIUM_RETRIES = 5
-SELENIUM_HEADSTART = 3
 
 
 if TYPE_CHECKING:
     from flask_appbuilder.security.sqla.models import User
 
 
+def wait_for_element(
+    driver: WebDriver, element_name: str, locate_wait: int, load_wait: int
+) -> WebElement:
+    """
+    Wait for an element of the page to be rendered, i.e. for the page to be
+    loaded, the element to be present and the loading spinners to be gone.
+
+    :param driver: Driver the page was requested with
+    :param element_name: Class name of the element
+    :param locate_wait: Time in seconds to wait for the element to be present
+    :param load_wait: Time in seconds to wait for the loading spinners to be gone
+    :return: The element
+    :raises TimeoutException: If the element isn't rendered in time
+    """
+    logger.debug("Wait for the page to be loaded")
+    WebDriverWait(driver, locate_wait).until(
+        lambda driver: driver.execute_script("return document.readyState") == "complete"
+    )
+    logger.debug("Wait for the presence of %s", element_name)
+    element = WebDriverWait(driver, locate_wait).until(
+        EC.presence_of_element_located((By.CLASS_NAME, element_name))
+    )
+    logger.debug("Wait for .loading to be done")
+    WebDriverWait(driver, load_wait).until_not(
+        EC.presence_of_all_elements_located((By.CLASS_NAME, "loading"))
+    )
+    return element
+
+
 class WebDriverProxy:
     def __init__(
         self, driver_type: str, window: Optional[WindowSize] = None,
@@ -80,6 +110,33 @@ class WebDriverProxy:
             driver, user
         )
 
+    @contextmanager
+    def lease(
+        self, user: Optional["User"], retries: int = SELENIUM_RETRIES
+    ) -> Iterator[WebDriver]:
+        """
+        Lease a driver authenticated as a user from the pool of the process.
+
+        Drivers authenticated with the cookies of the current request rather than
+        as a user are never pooled.
+
+        :param user: User to authenticate the driver as
+        :param retries: Number of attempts at closing the driver when destroyed
+        """
+        destroy = partial(self.destroy, tries=retries)
+        if not user:
+            driver = self.auth(user)  # type: ignore
+            try:
+                yield driver
+            finally:
+                destroy(driver)
+            return
+
+        with webdriver_pool.lease(
+            (self._driver_type, user.id), partial(self.auth, user), destroy
+        ) as driver:
+            yield driver
+
     @staticmethod
     def destroy(driver: WebDriver, tries: int = 2) -> None:
         """Destroy a driver"""
@@ -101,30 +158,24 @@ class WebDriverProxy:
         user: "User",
         retries: int = SELENIUM_RETRIES,
     ) -> Optional[bytes]:
-        driver = self.auth(user)
-        driver.set_window_size(*self._window)
-        driver.get(url)
         img: Optional[bytes] = None
-        logger.debug("Sleeping for %i seconds", SELENIUM_HEADSTART)
-        time.sleep(SELENIUM_HEADSTART)
-        try:
-            logger.debug("Wait for the presence of %s", element_name)
-            element = WebDriverWait(driver, self._screenshot_locate_wait).until(
-                EC.presence_of_element_located((By.CLASS_NAME, element_name))
-            )
-            logger.debug("Wait for .loading to be done")
-            WebDriverWait(driver, self._screenshot_load_wait).until_not(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "loading"))
-            )
-            logger.info("Taking a PNG screenshot or url %s", url)
-            img = element.screenshot_as_png
-        except TimeoutException:
-            logger.error("Selenium timed out requesting url %s", url, exc_info=True)
-        except WebDriverException as ex:
-            logger.error(ex, exc_info=True)
-            # Some webdrivers do not support screenshots for elements.
-            # In such cases, take a screenshot of the entire page.
-            img = driver.screenshot()  # pylint: disable=no-member
-        finally:
-            self.destroy(driver, retries)
+        with self.lease(user, retries) as driver:
+            driver.set_window_size(*self._window)
+            driver.get(url)
+            try:
+                element = wait_for_element(
+                    driver,
+                    element_name,
+                    self._screenshot_locate_wait,
+                    self._screenshot_load_wait,
+                )
+                logger.info("Taking a PNG screenshot or url %s", url)
+                img = element.screenshot_as_png
+            except TimeoutException:
+                logger.error("Selenium timed out requesting url %s", url, exc_info=True)
+            except WebDriverException as ex:
+                logger.error(ex, exc_info=True)
+                # Some webdrivers do not support screenshots for elements.
+                # In such cases, take a screenshot of the entire page.
+                img = driver.screenshot()  # pylint: disable=no-member
         return img
@@ -0,0 +1,194 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Hashable, Iterator, List, Optional
+
+from flask import Flask
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+
+logger = logging.getLogger(__name__)
+
+
+class PooledWebDriver:  # pylint: disable=too-few-public-methods
+    def __init__(self, key: Hashable, driver: WebDriver) -> None:
+        self.key = key
+        self.driver = driver
+        self.uses = 0
+        self.last_used = time.monotonic()
+
+
+class WebDriverPool:
+    """
+    Pool of the headless browsers of a process, keeping at most
+    `WEBDRIVER_POOL_SIZE` of them around between screenshots.
+
+    Drivers are keyed by type and user, so that a driver handed out is already
+    authenticated as the user the screenshot is taken for. They are health
+    checked when leased, and recycled after `WEBDRIVER_POOL_MAX_USES` uses or
+    `WEBDRIVER_POOL_IDLE_TIMEOUT` seconds without being used.
+    """
+
+    def __init__(self) -> None:
+        self._idle: List[PooledWebDriver] = []
+        self._leased = 0
+        self._lock = threading.Lock()
+        self._size = 0
+        self._max_uses = 0
+        self._idle_timeout = 0
+        self._stats_logger: BaseStatsLogger = DummyStatsLogger()
+
+    def init_app(self, app: Flask) -> None:
+        self._size = app.config["WEBDRIVER_POOL_SIZE"]
+        self._max_uses = app.config["WEBDRIVER_POOL_MAX_USES"]
+        self._idle_timeout = app.config["WEBDRIVER_POOL_IDLE_TIMEOUT"]
+        self._stats_logger = app.config["STATS_LOGGER"]
+        if self.enabled:
+            atexit.register(self.clear)
+
+    @property
+    def enabled(self) -> bool:
+        return self._size > 0
+
+    @contextmanager
+    def lease(
+        self,
+        key: Hashable,
+        create: Callable[[], WebDriver],
+        destroy: Callable[[WebDriver], None],
+    ) -> Iterator[WebDriver]:
+        """
+        Lease a driver from the pool, creating it if no idle driver is available
+        for the key. The driver is returned to the pool when the block exits,
+        unless it raised an exception, in which case it is destroyed.
+
+        :param key: Key of the driver, e.g. its type and the id of the user it
+               is authenticated as
+        :param create: Function creating an authenticated driver
+        :param destroy: Function destroying a driver
+        """
+        if not self.enabled:
+            driver = create()
+            try:
+                yield driver
+            finally:
+                destroy(driver)
+            return
+
+        pooled = self._acquire(key, destroy)
+        if pooled is None:
+            self._stats_logger.incr("webdriver_pool.created")
+            try:
+                pooled = PooledWebDriver(key, create())
+            except Exception:
+                with self._lock:
+                    self._leased -= 1
+                raise
+        else:
+            self._stats_logger.incr("webdriver_pool.reused")
+
+        healthy = False
+        try:
+            yield pooled.driver
+            healthy = True
+        finally:
+            self._release(pooled, healthy, destroy)
+
+    def _acquire(
+        self, key: Hashable, destroy: Callable[[WebDriver], None]
+    ) -> Optional[PooledWebDriver]:
+        now = time.monotonic()
+        pooled = None
+        evicted = []
+        with self._lock:
+            self._leased += 1
+            for idle in list(self._idle):
+                if now - idle.last_used > self._idle_timeout:
+                    self._idle.remove(idle)
+                    evicted.append(idle)
+                elif pooled is None and idle.key == key:
+                    self._idle.remove(idle)
+                    pooled = idle
+            # make room for the new driver by recycling the least recently used
+            # driver of another user
+            if (
+                pooled is None
+                and self._idle
+                and len(self._idle) + self._leased > self._size
+            ):
+                evicted.append(self._idle.pop(0))
+
+        for idle in evicted:
+            self._stats_logger.incr("webdriver_pool.evicted")
+            destroy(idle.driver)
+
+        if pooled is not None and not self._is_healthy(pooled.driver):
+            self._stats_logger.incr("webdriver_pool.unhealthy")
+            destroy(pooled.driver)
+            pooled = None
+        return pooled
+
+    def _release(
+        self,
+        pooled: PooledWebDriver,
+        healthy: bool,
+        destroy: Callable[[WebDriver], None],
+    ) -> None:
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            self._leased -= 1
+            keep = (
+                healthy
+                and (not self._max_uses or pooled.uses < self._max_uses)
+                and len(self._idle) + self._leased < self._size
+            )
+            if keep:
+                self._idle.append(pooled)
+            idle_count = len(self._idle)
+            leased_count = self._leased
+
+        if not keep:
+            destroy(pooled.driver)
+        self._stats_logger.gauge("webdriver_pool.idle", idle_count)
+        self._stats_logger.gauge("webdriver_pool.leased", leased_count)
+
+    @staticmethod
+    def _is_healthy(driver: WebDriver) -> bool:
+        try:
+            driver.execute_script("return 1")
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Discarding unresponsive webdriver", exc_info=True)
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Quit all the idle drivers"""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+
+        for pooled in idle:
+            try:
+                pooled.driver.quit()
+            except Exception:  # pylint: disable=broad-except
+                pass
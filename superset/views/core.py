@@ -19,14 +19,24 @@ import logging
 import re
 from contextlib import closing
 from datetime import datetime, timedelta
-from typing import Any, Callable, cast, Dict, List, Optional, Union
+from typing import Any, Callable, cast, Dict, Iterator, List, Optional, Union
 from urllib import parse
 
 import backoff
 import humanize
 import pandas as pd
 import simplejson as json
-from flask import abort, flash, g, Markup, redirect, render_template, request, Response
+from flask import (
+    abort,
+    flash,
+    g,
+    Markup,
+    redirect,
+    render_template,
+    request,
+    Response,
+    stream_with_context,
+)
 from flask_appbuilder import expose
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_appbuilder.security.decorators import (
@@ -84,7 +94,11 @@ from superset.exceptions import (
     SupersetTemplateParamsErrorException,
     SupersetTimeoutException,
 )
-from superset.extensions import async_query_manager, cache_manager
+from superset.extensions import (
+    async_query_manager,
+    cache_manager,
+    query_progress_channel,
+)
 from superset.jinja_context import get_template_processor
 from superset.models.core import Database, FavStar, Log
 from superset.models.dashboard import Dashboard
@@ -123,6 +137,7 @@ from superset.views.base import (
 )
 from superset.views.utils import (
     _deserialize_results_payload,
+    _iter_results_payload,
     apply_display_max_row_limit,
     bootstrap_user_data,
     check_datasource_perms,
@@ -169,6 +184,41 @@ PARAMETER_MISSING_ERR = (
 )
 
 
+def _log_csv_export(query: Query, client_id: str, row_count: int) -> None:
+    event_info = {
+        "event_type": "data_export",
+        "client_id": client_id,
+        "row_count": row_count,
+        "database": query.database.name,
+        "schema": query.schema,
+        "sql": query.sql,
+        "exported_format": "csv",
+    }
+    event_rep = repr(event_info)
+    logger.info("CSV exported: %s", event_rep, extra={"superset_event": event_info})
+
+
+def _stream_query_csv(
+    query: Query, client_id: str, dfs: Iterator[pd.DataFrame]
+) -> Iterator[str]:
+    """Write the results of a query as CSV, one data frame at a time"""
+    row_count = 0
+    row_limit = config["CSV_EXPORT_MAX_ROWS"]
+
+    def count_rows(dfs: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        nonlocal row_count
+        for df in dfs:
+            row_count += len(df.index)
+            yield df
+
+    yield from csv.df_to_escaped_csv_chunks(
+        count_rows(dfs), row_limit=row_limit, index=False, **config["CSV_EXPORT"]
+    )
+    if row_limit is not None:
+        row_count = min(row_count, row_limit)
+    _log_csv_export(query, client_id, row_count)
+
+
 class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
     """The base views for Superset!"""
 
@@ -2143,7 +2193,9 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
         """Serves a key off of the results backend
 
         It is possible to pass the `rows` query argument to limit the number
-        of rows returned.
+        of rows returned, the `offset` query argument to skip the first rows,
+        and the `columns` query argument, a comma separated list of column
+        names, to only return some of the columns.
         """
         if not results_backend:
             return json_error_response("Results backend isn't configured")
@@ -2172,10 +2224,38 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
         except SupersetSecurityException as ex:
             return json_errors_response([ex.error], status=403)
 
-        payload = utils.zlib_decompress(blob, decode=not results_backend_use_msgpack)
+        rows = None
+        display_limit = None
+        if "rows" in request.args:
+            try:
+                rows = int(request.args["rows"])
+            except ValueError:
+                return json_error_response("Invalid `rows` argument", status=400)
+            display_limit = rows or config["DISPLAY_MAX_ROW"] or None
+        try:
+            offset = int(request.args.get("offset", 0))
+            if offset < 0:
+                raise ValueError("Negative offset")
+        except ValueError:
+            return json_error_response("Invalid `offset` argument", status=400)
+        columns = (
+            request.args["columns"].split(",") if "columns" in request.args else None
+        )
+
+        # Arrow payloads are compressed by record batch, not as a whole
+        payload = (
+            blob
+            if results_backend_use_msgpack
+            else utils.zlib_decompress(blob, decode=True)
+        )
         try:
             obj = _deserialize_results_payload(
-                payload, query, cast(bool, results_backend_use_msgpack)
+                payload,
+                query,
+                cast(bool, results_backend_use_msgpack),
+                offset=offset,
+                limit=display_limit,
+                columns=columns,
             )
         except SerializationError:
             return json_error_response(
@@ -2183,18 +2263,10 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
                 status=404,
             )
 
-        if "rows" in request.args:
-            try:
-                rows = int(request.args["rows"])
-            except ValueError:
-                return json_error_response("Invalid `rows` argument", status=400)
-            obj = apply_display_max_row_limit(obj, rows)
+        if rows is not None:
+            obj = apply_display_max_row_limit(obj, rows, offset)
 
-        return json_success(
-            json.dumps(
-                obj, default=utils.json_iso_dttm_ser, ignore_nan=True, encoding=None
-            )
-        )
+        return json_success(utils.json_dumps_data(obj, default=utils.json_iso_dttm_ser))
 
     @has_access_api
     @expose("/stop_query/", methods=["POST"])
@@ -2224,6 +2296,7 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
             return self.json_response("OK")
         query.status = QueryStatus.STOPPED
         db.session.commit()
+        query_progress_channel.request_stop(query.id)
 
         return self.json_response("OK")
 
@@ -2609,17 +2682,34 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
         if results_backend and query.results_key:
             logger.info("Fetching CSV from results backend [%s]", query.results_key)
             blob = results_backend.get(query.results_key)
+        streaming = config["CSV_STREAMING_EXPORT"]
+        chunk_size = config["CSV_EXPORT_CHUNK_SIZE"]
         if blob:
             logger.info("Decompressing")
-            payload = utils.zlib_decompress(
-                blob, decode=not results_backend_use_msgpack
-            )
-            obj = _deserialize_results_payload(
-                payload, query, cast(bool, results_backend_use_msgpack)
-            )
-            columns = [c["name"] for c in obj["columns"]]
-            df = pd.DataFrame.from_records(obj["data"], columns=columns)
-            logger.info("Using pandas to convert to CSV")
+            payload = (
+                blob
+                if results_backend_use_msgpack
+                else utils.zlib_decompress(blob, decode=True)
+            )
+            if streaming:
+                dfs = (
+                    pd.DataFrame.from_records(
+                        obj["data"], columns=[c["name"] for c in obj["columns"]]
+                    )
+                    for obj in _iter_results_payload(
+                        payload,
+                        query,
+                        cast(bool, results_backend_use_msgpack),
+                        chunk_size,
+                    )
+                )
+            else:
+                obj = _deserialize_results_payload(
+                    payload, query, cast(bool, results_backend_use_msgpack)
+                )
+                columns = [c["name"] for c in obj["columns"]]
+                df = pd.DataFrame.from_records(obj["data"], columns=columns)
+                logger.info("Using pandas to convert to CSV")
         else:
             logger.info("Running a query to turn into CSV")
             if query.select_sql:
@@ -2635,25 +2725,23 @@ class Superset(BaseSupersetView):  # pylint: disable=too-many-public-methods
             }:
                 # remove extra row from `increased_limit`
                 limit -= 1
-            df = query.database.get_df(sql, query.schema)[:limit]
+            if streaming:
+                dfs = query.database.iter_dfs(sql, query.schema, chunk_size, limit)
+            else:
+                df = query.database.get_df(sql, query.schema)[:limit]
 
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
         quoted_csv_name = parse.quote(query.name)
-        response = CsvResponse(
-            csv_data, headers=generate_download_headers("csv", quoted_csv_name)
-        )
-        event_info = {
-            "event_type": "data_export",
-            "client_id": client_id,
-            "row_count": len(df.index),
-            "database": query.database.name,
-            "schema": query.schema,
-            "sql": query.sql,
-            "exported_format": "csv",
-        }
-        event_rep = repr(event_info)
-        logger.info("CSV exported: %s", event_rep, extra={"superset_event": event_info})
-        return response
+        headers = generate_download_headers("csv", quoted_csv_name)
+        if streaming:
+            logger.info("Streaming CSV")
+            return CsvResponse(
+                stream_with_context(_stream_query_csv(query, client_id, dfs)),
+                headers=headers,
+            )
+
+        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+        _log_csv_export(query, client_id, len(df.index))
+        return CsvResponse(csv_data, headers=headers)
 
     @api
     @handle_api_exception
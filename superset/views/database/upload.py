@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any, Callable, Dict, IO, Optional, Union
+
+import pandas as pd
+from flask import current_app
+
+from superset import db
+from superset.connectors.sqla.models import SqlaTable
+from superset.models.core import Database
+from superset.sql_parse import Table
+
+
+def load_csv(  # pylint: disable=too-many-arguments
+    database: Database,
+    table: Table,
+    csv_file: Union[str, IO[Any]],
+    read_csv_kwargs: Dict[str, Any],
+    to_sql_kwargs: Dict[str, Any],
+    user_id: Optional[int],
+    progress: Optional[Callable[[int], None]] = None,
+) -> SqlaTable:
+    """
+    Load a CSV file into a database table chunk by chunk, and create or refresh the
+    dataset of the table.
+
+    :param database: The database to upload the data to
+    :param table: The table to upload the data to
+    :param csv_file: The path or file object of the CSV file
+    :param read_csv_kwargs: The kwargs to be passed to `pandas.read_csv`
+    :param to_sql_kwargs: The kwargs to be passed to `pandas.DataFrame.to_sql`
+    :param user_id: The id of the owner of a new dataset
+    :param progress: Called with the number of rows uploaded so far
+    :return: The dataset of the table
+    """
+    dfs = pd.read_csv(
+        csv_file,
+        chunksize=current_app.config["CSV_UPLOAD_CHUNK_SIZE"],
+        iterator=True,
+        **read_csv_kwargs,
+    )
+    database.db_engine_spec.dfs_to_sql(
+        database, table, dfs, to_sql_kwargs, progress=progress
+    )
+    return register_table(database, table, user_id)
+
+
+def register_table(
+    database: Database, table: Table, user_id: Optional[int]
+) -> SqlaTable:
+    """
+    Create or refresh the dataset of a table that was uploaded to a database.
+
+    :param database: The database the data was uploaded to
+    :param table: The uploaded table
+    :param user_id: The id of the owner of a new dataset
+    :return: The dataset of the table
+    """
+    # Connect table to the database that should be used for exploration.
+    # E.g. if hive was used to upload a csv, presto will be a better option
+    # to explore the table.
+    expore_database = database
+    explore_database_id = database.explore_database_id
+    if explore_database_id:
+        expore_database = (
+            db.session.query(Database).filter_by(id=explore_database_id).one_or_none()
+            or database
+        )
+
+    sqla_table = (
+        db.session.query(SqlaTable)
+        .filter_by(
+            table_name=table.table, schema=table.schema, database_id=expore_database.id,
+        )
+        .one_or_none()
+    )
+
+    if sqla_table:
+        sqla_table.fetch_metadata()
+    if not sqla_table:
+        sqla_table = SqlaTable(table_name=table.table)
+        sqla_table.database = expore_database
+        sqla_table.database_id = database.id
+        sqla_table.user_id = user_id
+        sqla_table.schema = table.schema
+        sqla_table.fetch_metadata()
+        db.session.add(sqla_table)
+    db.session.commit()
+    return sqla_table
@@ -16,7 +16,7 @@
 # under the License.
 import os
 import tempfile
-from typing import TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 
 import pandas as pd
 from flask import flash, g, redirect
@@ -30,7 +30,6 @@ from wtforms.validators import ValidationError
 
 import superset.models.core as models
 from superset import app, db, is_feature_enabled
-from superset.connectors.sqla.models import SqlaTable
 from superset.constants import MODEL_VIEW_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.exceptions import CertificateException
 from superset.sql_parse import Table
@@ -40,6 +39,7 @@ from superset.views.base import DeleteMixin, SupersetModelView, YamlExportMixin
 
 from .forms import CsvToDatabaseForm, ExcelToDatabaseForm
 from .mixins import DatabaseMixin
+from .upload import load_csv, register_table
 from .validators import schema_allows_csv_upload, sqlalchemy_uri_validator
 
 if TYPE_CHECKING:
@@ -150,80 +150,48 @@ class CsvToDatabaseView(SimpleFormView):
             flash(message, "danger")
             return redirect("/csvtodatabaseview/form")
 
-        try:
-            df = pd.concat(
-                pd.read_csv(
-                    chunksize=1000,
-                    encoding="utf-8",
-                    filepath_or_buffer=form.csv_file.data,
-                    header=form.header.data if form.header.data else 0,
-                    index_col=form.index_col.data,
-                    infer_datetime_format=form.infer_datetime_format.data,
-                    iterator=True,
-                    keep_default_na=not form.null_values.data,
-                    mangle_dupe_cols=form.mangle_dupe_cols.data,
-                    na_values=form.null_values.data if form.null_values.data else None,
-                    nrows=form.nrows.data,
-                    parse_dates=form.parse_dates.data,
-                    sep=form.sep.data,
-                    skip_blank_lines=form.skip_blank_lines.data,
-                    skipinitialspace=form.skipinitialspace.data,
-                    skiprows=form.skiprows.data,
-                )
-            )
+        read_csv_kwargs = {
+            "encoding": "utf-8",
+            "header": form.header.data if form.header.data else 0,
+            "index_col": form.index_col.data,
+            "infer_datetime_format": form.infer_datetime_format.data,
+            "keep_default_na": not form.null_values.data,
+            "mangle_dupe_cols": form.mangle_dupe_cols.data,
+            "na_values": form.null_values.data if form.null_values.data else None,
+            "nrows": form.nrows.data,
+            "parse_dates": form.parse_dates.data,
+            "sep": form.sep.data,
+            "skip_blank_lines": form.skip_blank_lines.data,
+            "skipinitialspace": form.skipinitialspace.data,
+            "skiprows": form.skiprows.data,
+        }
+        to_sql_kwargs = {
+            "chunksize": 1000,
+            "if_exists": form.if_exists.data,
+            "index": form.index.data,
+            "index_label": form.index_label.data,
+        }
 
+        try:
             database = (
                 db.session.query(models.Database)
                 .filter_by(id=form.data.get("con").data.get("id"))
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
-                database,
-                csv_table,
-                df,
-                to_sql_kwargs={
-                    "chunksize": 1000,
-                    "if_exists": form.if_exists.data,
-                    "index": form.index.data,
-                    "index_label": form.index_label.data,
-                },
-            )
-
-            # Connect table to the database that should be used for exploration.
-            # E.g. if hive was used to upload a csv, presto will be a better option
-            # to explore the table.
-            expore_database = database
-            explore_database_id = database.explore_database_id
-            if explore_database_id:
-                expore_database = (
-                    db.session.query(models.Database)
-                    .filter_by(id=explore_database_id)
-                    .one_or_none()
-                    or database
+            if config["CSV_UPLOAD_ASYNC"]:
+                return self._load_csv_async(
+                    form, database, csv_table, read_csv_kwargs, to_sql_kwargs
                 )
 
-            sqla_table = (
-                db.session.query(SqlaTable)
-                .filter_by(
-                    table_name=csv_table.table,
-                    schema=csv_table.schema,
-                    database_id=expore_database.id,
-                )
-                .one_or_none()
+            sqla_table = load_csv(
+                database,
+                csv_table,
+                form.csv_file.data,
+                read_csv_kwargs,
+                to_sql_kwargs,
+                g.user.get_id(),
             )
-
-            if sqla_table:
-                sqla_table.fetch_metadata()
-            if not sqla_table:
-                sqla_table = SqlaTable(table_name=csv_table.table)
-                sqla_table.database = expore_database
-                sqla_table.database_id = database.id
-                sqla_table.user_id = g.user.get_id()
-                sqla_table.schema = csv_table.schema
-                sqla_table.fetch_metadata()
-                db.session.add(sqla_table)
-            db.session.commit()
         except Exception as ex:  # pylint: disable=broad-except
             db.session.rollback()
             message = _(
@@ -252,6 +220,44 @@ class CsvToDatabaseView(SimpleFormView):
         stats_logger.incr("successful_csv_upload")
         return redirect("/tablemodelview/list/")
 
+    @staticmethod
+    def _load_csv_async(
+        form: CsvToDatabaseForm,
+        database: models.Database,
+        csv_table: Table,
+        read_csv_kwargs: Dict[str, Any],
+        to_sql_kwargs: Dict[str, Any],
+    ) -> Response:
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.upload import load_csv_to_database
+
+        utils.ensure_path_exists(config["UPLOAD_FOLDER"])
+        with tempfile.NamedTemporaryFile(
+            dir=config["UPLOAD_FOLDER"], suffix=".csv", delete=False
+        ) as file:
+            upload_stream_write(form.csv_file.data, file.name)
+
+        result = load_csv_to_database.delay(
+            database.id,
+            csv_table.table,
+            csv_table.schema,
+            file.name,
+            read_csv_kwargs,
+            to_sql_kwargs,
+            g.user.get_id(),
+        )
+        message = _(
+            'CSV file "%(csv_filename)s" is being uploaded to table "%(table_name)s" '
+            'in database "%(db_name)s" (task %(task_id)s)',
+            csv_filename=form.csv_file.data.filename,
+            table_name=str(csv_table),
+            db_name=database.database_name,
+            task_id=result.id,
+        )
+        flash(message, "info")
+        stats_logger.incr("async_csv_upload")
+        return redirect("/tablemodelview/list/")
+
 
 class ExcelToDatabaseView(SimpleFormView):
     form = ExcelToDatabaseForm
@@ -331,40 +337,7 @@ class ExcelToDatabaseView(SimpleFormView):
                 },
             )
 
-            # Connect table to the database that should be used for exploration.
-            # E.g. if hive was used to upload a excel, presto will be a better option
-            # to explore the table.
-            expore_database = database
-            explore_database_id = database.explore_database_id
-            if explore_database_id:
-                expore_database = (
-                    db.session.query(models.Database)
-                    .filter_by(id=explore_database_id)
-                    .one_or_none()
-                    or database
-                )
-
-            sqla_table = (
-                db.session.query(SqlaTable)
-                .filter_by(
-                    table_name=excel_table.table,
-                    schema=excel_table.schema,
-                    database_id=expore_database.id,
-                )
-                .one_or_none()
-            )
-
-            if sqla_table:
-                sqla_table.fetch_metadata()
-            if not sqla_table:
-                sqla_table = SqlaTable(table_name=excel_table.table)
-                sqla_table.database = expore_database
-                sqla_table.database_id = database.id
-                sqla_table.user_id = g.user.get_id()
-                sqla_table.schema = excel_table.schema
-                sqla_table.fetch_metadata()
-                db.session.add(sqla_table)
-            db.session.commit()
+            sqla_table = register_table(database, excel_table, g.user.get_id())
         except Exception as ex:  # pylint: disable=broad-except
             db.session.rollback()
             message = _(
@@ -18,11 +18,21 @@ import logging
 from collections import defaultdict
 from datetime import date
 from functools import wraps
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    cast,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib import parse
 
-import msgpack
-import pyarrow as pa
 import simplejson as json
 from flask import g, request
 from flask_appbuilder.security.sqla import models as ab_models
@@ -36,7 +46,6 @@ from superset.connectors.connector_registry import ConnectorRegistry
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
     CacheLoadError,
-    SerializationError,
     SupersetException,
     SupersetSecurityException,
 )
@@ -47,6 +56,11 @@ from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
 from superset.typing import FormData
+from superset.utils.arrow_results import (
+    deserialize_table,
+    get_num_rows,
+    unpack_payload,
+)
 from superset.utils.core import QueryStatus, TimeRangeEndpoint
 from superset.utils.decorators import stats_timing
 from superset.viz import BaseViz
@@ -232,7 +246,7 @@ def get_datasource_info(
 
 
 def apply_display_max_row_limit(
-    sql_results: Dict[str, Any], rows: Optional[int] = None
+    sql_results: Dict[str, Any], rows: Optional[int] = None, offset: int = 0
 ) -> Dict[str, Any]:
     """
     Given a `sql_results` nested structure, applies a limit to the number of rows
@@ -243,18 +257,17 @@ def apply_display_max_row_limit(
     metadata.
 
     :param sql_results: The results of a sql query from sql_lab.get_sql_results
+    :param rows: The maximum number of rows to return
+    :param offset: The number of rows skipped before the data of `sql_results`
     :returns: The mutated sql_results structure
     """
 
     display_limit = rows or app.config["DISPLAY_MAX_ROW"]
 
-    if (
-        display_limit
-        and sql_results["status"] == QueryStatus.SUCCESS
-        and display_limit < sql_results["query"]["rows"]
-    ):
+    if display_limit and sql_results["status"] == QueryStatus.SUCCESS:
         sql_results["data"] = sql_results["data"][:display_limit]
-        sql_results["displayLimitReached"] = True
+        if offset + len(sql_results["data"]) < sql_results["query"]["rows"]:
+            sql_results["displayLimitReached"] = True
     return sql_results
 
 
@@ -559,24 +572,50 @@ def check_slice_perms(_self: Any, slice_id: int) -> None:
         viz_obj.raise_for_access()
 
 
-def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+def _deserialize_results_payload(  # pylint: disable=too-many-arguments,too-many-locals
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
+    """
+    Deserialize query results read from the results backend.
+
+    :param payload: Payload as stored in the results backend
+    :param query: Query the results belong to
+    :param use_msgpack: Whether the payload holds the results as Arrow data
+    :param offset: Index of the first row to return
+    :param limit: Number of rows to return, defaults to all the remaining ones
+    :param columns: Names of the selected columns to return, defaults to all of
+           them. Arrow data is only decoded for the requested rows and columns.
+    :return: Query results
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
             "sqllab.query.results_backend_msgpack_deserialize", stats_logger
         ):
-            ds_payload = msgpack.loads(payload, raw=False)
+            ds_payload, data = unpack_payload(cast(bytes, payload))
+
+        if columns is not None:
+            # unknown columns are ignored, as they are for JSON payloads
+            ds_payload["selected_columns"] = [
+                column
+                for column in ds_payload["selected_columns"]
+                if column["name"] in columns
+            ]
+            columns = [column["name"] for column in ds_payload["selected_columns"]]
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                pa_table = pa.deserialize(ds_payload["data"])
-            except pa.ArrowSerializationError:
-                raise SerializationError("Unable to deserialize table")
+            pa_table = deserialize_table(data, offset, limit, columns)
 
         df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+        if app.config["DATA_JSON_BACKEND"] == "columnar":
+            ds_payload["data"] = dataframe.df_to_json_records(df) or []
+        else:
+            ds_payload["data"] = dataframe.df_to_records(df) or []
 
         db_engine_spec = query.database.db_engine_spec
         all_columns, data, expanded_columns = db_engine_spec.expand_data(
@@ -589,7 +628,59 @@ def _deserialize_results_payload(
         return ds_payload
 
     with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+        ds_payload = json.loads(payload)
+
+    if offset or limit is not None:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:end]
+    if columns is not None:
+        # columns expanded from nested ones are named after their parent column
+        names = {
+            column["name"]
+            for column in ds_payload["columns"]
+            if column["name"] in columns or column["name"].split(".")[0] in columns
+        }
+        ds_payload["data"] = [
+            {key: value for key, value in row.items() if key in names}
+            for row in ds_payload["data"]
+        ]
+        for key in ("columns", "selected_columns", "expanded_columns"):
+            ds_payload[key] = [
+                column
+                for column in ds_payload.get(key) or []
+                if column["name"] in names
+            ]
+    return ds_payload
+
+
+def _iter_results_payload(
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    batch_size: int = 10000,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Deserialize query results read from the results backend, batch by batch.
+    Arrow data is decoded one batch at a time, JSON data is decoded at once.
+
+    :param payload: Payload as stored in the results backend
+    :param query: Query the results belong to
+    :param use_msgpack: Whether the payload holds the results as Arrow data
+    :param batch_size: Maximum number of rows of the batches
+    :return: Query results of each batch, the first batch always being returned
+    """
+    if use_msgpack:
+        _, data = unpack_payload(cast(bytes, payload))
+        for offset in range(0, get_num_rows(data) or 1, batch_size):
+            yield _deserialize_results_payload(
+                payload, query, use_msgpack, offset, batch_size
+            )
+        return
+
+    ds_payload = _deserialize_results_payload(payload, query, use_msgpack)
+    rows = ds_payload["data"]
+    for offset in range(0, len(rows) or 1, batch_size):
+        yield {**ds_payload, "data": rows[offset : offset + batch_size]}
 
 
 def get_cta_schema_name(
@@ -27,6 +27,7 @@ import math
 import re
 from collections import defaultdict, OrderedDict
 from datetime import date, datetime, timedelta
+from functools import partial
 from itertools import product
 from typing import (
     Any,
@@ -69,6 +70,11 @@ from superset.models.helpers import QueryResult
 from superset.typing import QueryObjectDict, VizData, VizPayload
 from superset.utils import core as utils, csv
 from superset.utils.cache import set_and_log_cache
+from superset.utils.concurrency import (
+    get_concurrency_limit_key,
+    load_datasource_relationships,
+    run_concurrently,
+)
 from superset.utils.core import (
     DTTM_ALIAS,
     JS_MAX_INTEGER,
@@ -92,6 +98,14 @@ relative_start = config["DEFAULT_RELATIVE_START_TIME"]
 relative_end = config["DEFAULT_RELATIVE_END_TIME"]
 logger = logging.getLogger(__name__)
 
+# Fixed length time grains the results of a time comparison query can be split on
+SINGLE_SCAN_TIME_GRAINS = {
+    "PT1S": timedelta(seconds=1),
+    "PT1M": timedelta(minutes=1),
+    "PT1H": timedelta(hours=1),
+    "P1D": timedelta(days=1),
+}
+
 METRIC_KEYS = [
     "metric",
     "metrics",
@@ -501,7 +515,7 @@ class BaseViz:
             if cache_value:
                 stats_logger.incr("loading_from_cache")
                 try:
-                    df = cache_value["df"]
+                    df = config["DATA_CACHE_CODEC"].decode(cache_value)["df"]
                     self.query = cache_value["query"]
                     self.status = utils.QueryStatus.SUCCESS
                     is_loaded = True
@@ -574,7 +588,7 @@ class BaseViz:
                 set_and_log_cache(
                     cache_manager.data_cache,
                     cache_key,
-                    {"df": df, "query": self.query},
+                    config["DATA_CACHE_CODEC"].encode({"df": df, "query": self.query}),
                     self.cache_timeout,
                     self.datasource.uid,
                 )
@@ -1334,7 +1348,10 @@ class NVD3TimeSeriesViz(NVD3Viz):
 
         return df
 
-    def run_extra_queries(self) -> None:
+    def get_time_compare_query_objs(
+        self,
+    ) -> List[Tuple[str, timedelta, QueryObjectDict]]:
+        """Returns the time shift, delta and query object of each time comparison"""
         fd = self.form_data
 
         time_compare = fd.get("time_compare") or []
@@ -1342,6 +1359,7 @@ class NVD3TimeSeriesViz(NVD3Viz):
         if not isinstance(time_compare, list):
             time_compare = [time_compare]
 
+        query_objs = []
         for option in time_compare:
             query_object = self.query_obj()
             try:
@@ -1360,8 +1378,108 @@ class NVD3TimeSeriesViz(NVD3Viz):
                 )
             query_object["from_dttm"] -= delta
             query_object["to_dttm"] -= delta
+            query_objs.append((option, delta, query_object))
+        return query_objs
+
+    def can_single_scan(
+        self, query_objs: List[Tuple[str, timedelta, QueryObjectDict]]
+    ) -> bool:
+        """
+        Whether the time comparison queries can be replaced with a single query
+        over their combined time range without changing the results: the shifted
+        windows must overlap or touch, no series limit may apply, and the window
+        boundaries must fall on time grain boundaries so no time bucket straddles
+        two windows.
+        """
+        if self.datasource.type != "table" or len(query_objs) < 2:
+            return False
+        query_object = query_objs[0][2]
+        if query_object.get("timeseries_limit"):
+            return False
+        time_grain = (query_object.get("extras") or {}).get("time_grain_sqla")
+        if time_grain and time_grain not in SINGLE_SCAN_TIME_GRAINS:
+            return False
+
+        windows = sorted((qry["from_dttm"], qry["to_dttm"]) for _, _, qry in query_objs)
+        for (_, to_dttm), (from_dttm, _) in zip(windows, windows[1:]):
+            if from_dttm > to_dttm:
+                return False
+        if time_grain:
+            grain = SINGLE_SCAN_TIME_GRAINS[time_grain]
+            epoch = datetime(1970, 1, 1, tzinfo=windows[0][0].tzinfo)
+            for window in windows:
+                if any((dttm - epoch) % grain for dttm in window):
+                    return False
+        return True
+
+    def get_single_scan_dfs(
+        self, query_objs: List[Tuple[str, timedelta, QueryObjectDict]]
+    ) -> Optional[List[Optional[pd.DataFrame]]]:
+        """
+        Runs a single query over the combined time range of the time comparison
+        queries, and splits its result into the shifted windows.
+
+        Returns None when the result was truncated by the row limit, in which case
+        the queries need to be run separately.
+        """
+        query_object = copy.copy(query_objs[0][2])
+        query_object["from_dttm"] = min(qry["from_dttm"] for _, _, qry in query_objs)
+        query_object["to_dttm"] = max(qry["to_dttm"] for _, _, qry in query_objs)
+        df = self.get_df_payload(
+            query_object, time_compare=[option for option, _, _ in query_objs]
+        ).get("df")
+        if df is None or DTTM_ALIAS not in df:
+            return [df] * len(query_objs)
+        row_limit = query_object.get("row_limit")
+        if row_limit and len(df.index) >= row_limit:
+            return None
+
+        # timestamps were shifted by the datasource offset and the chart time shift
+        shift = timedelta(hours=self.datasource.offset or 0) + self.time_shift
+        dfs: List[Optional[pd.DataFrame]] = []
+        for _, _, qry in query_objs:
+            mask = (df[DTTM_ALIAS] >= qry["from_dttm"] + shift) & (
+                df[DTTM_ALIAS] < qry["to_dttm"] + shift
+            )
+            dfs.append(df[mask].reset_index(drop=True))
+        return dfs
+
+    def get_time_compare_df_payload(
+        self, query_obj: QueryObjectDict, time_compare: str
+    ) -> Dict[str, Any]:
+        """
+        Get the payload of a time shifted query on a copy of the viz, as
+        `get_df_payload` keeps the results, query and status of the query on the
+        viz and the time shifts may be queried concurrently.
+        """
+        viz = copy.copy(self)
+        viz.errors = []
+        return viz.get_df_payload(query_obj, time_compare=time_compare)
+
+    def run_extra_queries(self) -> None:
+        query_objs = self.get_time_compare_query_objs()
+
+        dfs = None
+        if config["TIME_COMPARE_SINGLE_SCAN"] and self.can_single_scan(query_objs):
+            dfs = self.get_single_scan_dfs(query_objs)
+        if dfs is None:
+            max_workers = config["CHART_DATA_QUERY_THREADS"]
+            if max_workers > 1 and len(query_objs) > 1:
+                load_datasource_relationships(self.datasource)
+            payloads = run_concurrently(
+                [
+                    partial(self.get_time_compare_df_payload, query_object, option)
+                    for option, _, query_object in query_objs
+                ],
+                max_workers=max_workers,
+                limit_key=get_concurrency_limit_key(self.datasource),
+                limit=config["CHART_DATA_QUERY_THREADS_PER_DATABASE"],
+            )
+            dfs = [payload.get("df") for payload in payloads]
+            for payload in payloads:
+                self.errors.extend(payload.get("errors") or [])
 
-            df2 = self.get_df_payload(query_object, time_compare=option).get("df")
+        for (option, delta, _), df2 in zip(query_objs, dfs):
             if df2 is not None and DTTM_ALIAS in df2:
                 dttm_series = df2[DTTM_ALIAS] + delta
                 df2 = df2.drop(DTTM_ALIAS, axis=1)
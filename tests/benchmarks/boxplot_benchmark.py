@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare calculating boxplot statistics with per-group numpy callables, as the
+boxplot post processing operation used to, with its vectorized implementation.
+
+    python -m tests.benchmarks.boxplot_benchmark --rows 1000000 --groups 10000
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils import pandas_postprocessing
+from superset.utils.core import PostProcessingBoxplotWhiskerType
+from tests.benchmarks.utils import measure, report
+
+
+def generate_data(num_rows: int, num_groups: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "name": rng.integers(0, num_groups, num_rows).astype(str),
+            "sum__num": rng.standard_normal(num_rows),
+            "count": rng.integers(0, 1000, num_rows),
+        }
+    )
+
+
+def legacy_boxplot(
+    df: pd.DataFrame,
+    groupby: List[str],
+    metrics: List[str],
+    whisker_type: PostProcessingBoxplotWhiskerType,
+    percentiles: Optional[Tuple[float, float]] = None,
+) -> pd.DataFrame:
+    def quartile1(series: pd.Series) -> float:
+        return np.nanpercentile(series, 25, interpolation="midpoint")
+
+    def quartile3(series: pd.Series) -> float:
+        return np.nanpercentile(series, 75, interpolation="midpoint")
+
+    if whisker_type == PostProcessingBoxplotWhiskerType.TUKEY:
+
+        def whisker_high(series: pd.Series) -> float:
+            upper_outer_lim = quartile3(series) + 1.5 * (
+                quartile3(series) - quartile1(series)
+            )
+            return series[series <= upper_outer_lim].max()
+
+        def whisker_low(series: pd.Series) -> float:
+            lower_outer_lim = quartile1(series) - 1.5 * (
+                quartile3(series) - quartile1(series)
+            )
+            return series[series >= lower_outer_lim].min()
+
+    elif whisker_type == PostProcessingBoxplotWhiskerType.PERCENTILE:
+        low, high = percentiles  # type: ignore
+
+        def whisker_high(series: pd.Series) -> float:
+            return np.nanpercentile(series, high)
+
+        def whisker_low(series: pd.Series) -> float:
+            return np.nanpercentile(series, low)
+
+    else:
+        whisker_high = np.max
+        whisker_low = np.min
+
+    def outliers(series: pd.Series) -> List[float]:
+        above = series[series > whisker_high(series)]
+        below = series[series < whisker_low(series)]
+        return above.tolist() + below.tolist()
+
+    operators: Dict[str, Callable[[Any], Any]] = {
+        "mean": np.mean,
+        "median": np.median,
+        "max": whisker_high,
+        "min": whisker_low,
+        "q1": quartile1,
+        "q3": quartile3,
+        "count": np.ma.count,
+        "outliers": outliers,
+    }
+    aggregates: Dict[str, Dict[str, Any]] = {
+        f"{metric}__{operator_name}": {"column": metric, "operator": operator}
+        for operator_name, operator in operators.items()
+        for metric in metrics
+    }
+    return pandas_postprocessing.aggregate(df, groupby=groupby, aggregates=aggregates)
+
+
+@click.command()
+@click.option("--rows", default=1000000, help="Number of rows to process.")
+@click.option(
+    "--groups",
+    type=int,
+    default=(10, 1000, 10000),
+    multiple=True,
+    help="Number of groups, can be repeated.",
+)
+@click.option(
+    "--whisker-type",
+    type=click.Choice([member.value for member in PostProcessingBoxplotWhiskerType]),
+    default=PostProcessingBoxplotWhiskerType.TUKEY.value,
+    help="Whisker type of the boxplot.",
+)
+@click.option("--repeat", default=3, help="Number of runs per implementation.")
+def main(rows: int, groups: Tuple[int, ...], whisker_type: str, repeat: int) -> None:
+    options = {
+        "groupby": ["name"],
+        "metrics": ["sum__num", "count"],
+        "whisker_type": PostProcessingBoxplotWhiskerType(whisker_type),
+        "percentiles": (5, 95),
+    }
+    for num_groups in groups:
+        df = generate_data(rows, num_groups)
+        click.echo(f"{num_groups} groups")
+        report(
+            {
+                "callables": measure(
+                    lambda df=df: legacy_boxplot(df, **options), repeat
+                ),
+                "vectorized": measure(
+                    lambda df=df: pandas_postprocessing.boxplot(df, **options), repeat
+                ),
+            }
+        )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare storing chart query results in the data cache as pickled dataframes with
+the Arrow and Parquet codecs, as cache backends pickle the values they store.
+
+    python -m tests.benchmarks.data_cache_codec_benchmark --rows 500000
+"""
+import pickle
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils.cache_codecs import (
+    ArrowDataCacheCodec,
+    DataCacheCodec,
+    ParquetDataCacheCodec,
+)
+from tests.benchmarks.utils import measure, report
+
+CODECS: Dict[str, DataCacheCodec] = {
+    "pickle": DataCacheCodec(),
+    "arrow (lz4)": ArrowDataCacheCodec(),
+    "arrow (zstd)": ArrowDataCacheCodec("zstd"),
+    "parquet (snappy)": ParquetDataCacheCodec(),
+}
+
+
+def generate_df(num_rows: int) -> pd.DataFrame:
+    """A time series grouped by two dimensions, as returned for a line chart"""
+    start = datetime(2021, 1, 1)
+    return pd.DataFrame(
+        {
+            "__timestamp": [start + timedelta(hours=i // 100) for i in range(num_rows)],
+            "country": [f"country_{i % 100}" for i in range(num_rows)],
+            "gender": np.where(np.arange(num_rows) % 2, "boy", "girl").astype(object),
+            "sum__num": np.random.randint(0, 10000, num_rows),
+            "avg__value": np.random.random(num_rows),
+        }
+    )
+
+
+def dumps(codec: DataCacheCodec, value: Dict[str, Any]) -> bytes:
+    return pickle.dumps(codec.encode(value), pickle.HIGHEST_PROTOCOL)
+
+
+def loads(
+    codec: DataCacheCodec, data: bytes, columns: Optional[Any] = None
+) -> pd.DataFrame:
+    return codec.decode(pickle.loads(data), columns)["df"]
+
+
+@click.command()
+@click.option("--rows", default=500000, help="Number of rows in the dataframe.")
+@click.option("--repeat", default=3, help="Number of runs per codec.")
+def main(rows: int, repeat: int) -> None:
+    value = {"df": generate_df(rows), "query": "SELECT ..."}
+    serialized = {name: dumps(codec, value) for name, codec in CODECS.items()}
+
+    click.echo("Size")
+    for name, data in serialized.items():
+        click.echo(f"{name:>24}: {len(data) / 1024 ** 2:8.1f} MiB")
+    click.echo("Write")
+    report(
+        {
+            name: measure(lambda codec=codec: dumps(codec, value), repeat)
+            for name, codec in CODECS.items()
+        }
+    )
+    click.echo("Read")
+    report(
+        {
+            name: measure(lambda name=name: loads(CODECS[name], data), repeat)
+            for name, data in serialized.items()
+        }
+    )
+    click.echo("Read a single column")
+    report(
+        {
+            name: measure(
+                lambda name=name: loads(CODECS[name], data, ["sum__num"]), repeat
+            )
+            for name, data in serialized.items()
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,109 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# isort:skip_file
+"""
+Compare the current encoding of chart data and SQL Lab results to JSON, which
+builds the records value by value and serializes them with simplejson, with the
+columnar backend, with and without orjson.
+
+    python -m tests.benchmarks.json_serialization_benchmark --rows 100000
+"""
+from typing import Any, Callable
+from unittest import mock
+
+import click
+import numpy as np
+import pandas as pd
+
+from tests.test_app import app
+from superset.dataframe import df_to_json_records, df_to_records
+from superset.utils import core as utils
+from superset.utils.core import (
+    json_dumps_data,
+    json_int_dttm_ser,
+    json_iso_dttm_ser,
+)
+from tests.benchmarks.utils import measure, report
+
+
+def generate_data(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2000-01-01", periods=num_rows, freq="s"),
+            "id": np.arange(num_rows, dtype="int64") * 2 ** 40,
+            "name": [f"name_{i % 1000}" for i in range(num_rows)],
+            "value": rng.random(num_rows),
+            "count": rng.integers(0, 1000, num_rows),
+            "ratio": np.where(rng.random(num_rows) < 0.1, np.nan, rng.random(num_rows)),
+            "flag": rng.random(num_rows) < 0.5,
+        }
+    )
+
+
+def encode_chart_data(df: pd.DataFrame, backend: str) -> Callable[[], Any]:
+    def func() -> str:
+        with mock.patch.dict(app.config, {"DATA_JSON_BACKEND": backend}):
+            if backend == "columnar":
+                data = df_to_json_records(
+                    df, dttm_format="epoch", convert_big_integers=False
+                )
+            else:
+                data = df.to_dict(orient="records")
+            return json_dumps_data(
+                {"result": [{"data": data}]}, default=json_int_dttm_ser
+            )
+
+    return func
+
+
+def encode_sql_lab_results(df: pd.DataFrame, backend: str) -> Callable[[], Any]:
+    def func() -> str:
+        with mock.patch.dict(app.config, {"DATA_JSON_BACKEND": backend}):
+            if backend == "columnar":
+                data = df_to_json_records(df)
+            else:
+                data = df_to_records(df)
+            return json_dumps_data({"data": data}, default=json_iso_dttm_ser)
+
+    return func
+
+
+@click.command()
+@click.option("--rows", default=100000, help="Number of rows to encode.")
+@click.option("--repeat", default=3, help="Number of runs per implementation.")
+def main(rows: int, repeat: int) -> None:
+    df = generate_data(rows)
+    with app.app_context():
+        for label, encode in (
+            ("chart data", encode_chart_data),
+            ("SQL Lab results", encode_sql_lab_results),
+        ):
+            click.echo(f"{label}:")
+            results = {
+                "simplejson": measure(encode(df, "simplejson"), repeat),
+                "columnar": measure(encode(df, "columnar"), repeat),
+            }
+            with mock.patch.object(utils, "orjson", None):
+                results["columnar (simplejson)"] = measure(
+                    encode(df, "columnar"), repeat
+                )
+            report(results)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
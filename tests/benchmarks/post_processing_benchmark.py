@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare running chart post processing operations one after the other, each of them
+copying the frame, with the planned pipeline fusing and updating them in place.
+
+    python -m tests.benchmarks.post_processing_benchmark --rows 1000000
+"""
+from typing import Any, Dict, List
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.common.post_processing import plan_post_processing, run_post_processing
+from superset.utils import pandas_postprocessing
+from tests.benchmarks.utils import measure, report
+
+PIPELINE: List[Dict[str, Any]] = [
+    {"operation": "sort", "options": {"columns": {"__timestamp": True}}},
+    {
+        "operation": "rolling",
+        "options": {
+            "columns": {"sum__num": "sum__num_rolling"},
+            "rolling_type": "mean",
+            "window": 7,
+        },
+    },
+    {
+        "operation": "cum",
+        "options": {"columns": {"count": "count_cum"}, "operator": "sum"},
+    },
+    {"operation": "diff", "options": {"columns": {"ratio": "ratio_diff"}}},
+    {"operation": "contribution", "options": {"columns": ["sum__num", "count"]}},
+    {"operation": "sort", "options": {"columns": {"sum__num_rolling": False}}},
+    {
+        "operation": "select",
+        "options": {
+            "columns": ["__timestamp", "name", "sum__num_rolling", "count_cum"],
+        },
+    },
+]
+
+
+def generate_data(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2000-01-01", periods=num_rows, freq="min"),
+            "name": [f"name_{i % 1000}" for i in range(num_rows)],
+            "sum__num": rng.random(num_rows),
+            "count": rng.integers(0, 1000, num_rows),
+            "ratio": rng.random(num_rows),
+            "other": rng.random(num_rows),
+        }
+    )
+
+
+def run_sequentially(df: pd.DataFrame) -> pd.DataFrame:
+    for post_process in PIPELINE:
+        operation = getattr(pandas_postprocessing, post_process["operation"])
+        df = operation(df, **post_process["options"])
+    return df
+
+
+@click.command()
+@click.option("--rows", default=1000000, help="Number of rows to process.")
+@click.option("--repeat", default=3, help="Number of runs per implementation.")
+def main(rows: int, repeat: int) -> None:
+    df = generate_data(rows)
+    steps = plan_post_processing(PIPELINE)
+    report(
+        {
+            "sequential": measure(lambda: run_sequentially(df), repeat),
+            "planned": measure(lambda: run_post_processing(df, steps), repeat),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,175 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# isort:skip_file
+"""
+Compare the row-oriented `PrestoEngineSpec.expand_data`, which inserted the
+unnested rows one at a time into the list of rows, with the columnar one, on
+wide rows and on deeply nested arrays.
+
+    python -m tests.benchmarks.presto_expand_data_benchmark --rows 100000
+"""
+import copy
+from collections import defaultdict, deque
+from typing import Any, Callable, cast, Dict, List, Optional, Tuple, Union
+from unittest import mock
+
+import click
+
+import tests.test_app
+from superset.db_engine_specs.presto import get_children, PrestoEngineSpec
+from superset.result_set import destringify
+from tests.benchmarks.utils import measure, report
+
+Columns = List[Dict[str, Any]]
+Data = List[Dict[str, Any]]
+
+WIDE_COLUMNS = [
+    {"name": "id", "type": "BIGINT"},
+    {"name": "user", "type": "ROW(ID BIGINT, FIRST_NAME VARCHAR, LAST_NAME VARCHAR)"},
+    {"name": "tags", "type": "ARRAY(VARCHAR)"},
+    {"name": "scores", "type": "ARRAY(DOUBLE)"},
+    {"name": "meta", "type": "ROW(SOURCE VARCHAR, VERSION BIGINT)"},
+]
+DEEP_COLUMNS = [
+    {"name": "id", "type": "BIGINT"},
+    {
+        "name": "events",
+        "type": "ARRAY(ROW(NAME VARCHAR, ITEMS ARRAY(ROW(SKU VARCHAR, QTY BIGINT))))",
+    },
+]
+
+
+def generate_wide_data(num_rows: int) -> Data:
+    return [
+        {
+            "id": i,
+            "user": f'[{i}, "first_{i}", "last_{i}"]',
+            "tags": [f"tag_{j}" for j in range(i % 4)],
+            "scores": [j / 10 for j in range(i % 3)],
+            "meta": ["source", i % 10],
+        }
+        for i in range(num_rows)
+    ]
+
+
+def generate_deep_data(num_rows: int) -> Data:
+    return [
+        {
+            "id": i,
+            "events": [
+                [f"event_{j}", [[f"sku_{k}", k] for k in range((i + j) % 3)]]
+                for j in range(i % 4)
+            ],
+        }
+        for i in range(num_rows)
+    ]
+
+
+def legacy_expand_data(  # pylint: disable=too-many-locals,too-many-branches
+    columns: Columns, data: Data
+) -> Tuple[Columns, Data, Columns]:
+    """The row-oriented implementation that preceded the columnar one"""
+    to_process = deque((column, 0) for column in columns)
+    all_columns: Columns = []
+    expanded_columns = []
+    current_array_level = None
+    while to_process:
+        column, level = to_process.popleft()
+        if column["name"] not in [column["name"] for column in all_columns]:
+            all_columns.append(column)
+
+        if level != current_array_level:
+            unnested_rows: Dict[int, int] = defaultdict(int)
+            current_array_level = level
+
+        name = column["name"]
+        values: Optional[Union[str, List[Any]]]
+
+        if column["type"].startswith("ARRAY("):
+            to_process.append((get_children(column)[0], level + 1))
+            i = 0
+            while i < len(data):
+                row = data[i]
+                values = row.get(name)
+                if isinstance(values, str):
+                    row[name] = values = destringify(values)
+                if values:
+                    extra_rows = len(values) - 1
+                    current_unnested_rows = unnested_rows[i]
+                    missing = extra_rows - current_unnested_rows
+                    for _ in range(missing):
+                        data.insert(i + current_unnested_rows + 1, {})
+                        unnested_rows[i] += 1
+                    for j, value in enumerate(values):
+                        data[i + j][name] = value
+                    i += unnested_rows[i]
+                i += 1
+
+        if column["type"].startswith("ROW("):
+            expanded = get_children(column)
+            to_process.extendleft((column, level) for column in expanded[::-1])
+            expanded_columns.extend(expanded)
+            for row in data:
+                values = row.get(name) or []
+                if isinstance(values, str):
+                    row[name] = values = cast(List[Any], destringify(values))
+                for value, col in zip(values, expanded):
+                    row[col["name"]] = value
+
+    data = [{k["name"]: row.get(k["name"], "") for k in all_columns} for row in data]
+    return all_columns, data, expanded_columns
+
+
+def run(
+    expand_data: Callable[[Columns, Data], Tuple[Columns, Data, Columns]],
+    columns: Columns,
+    data: Data,
+    repeat: int,
+) -> Callable[[], Any]:
+    # both implementations update the nested values of the rows in place, so
+    # each run gets its own copy, made before measuring
+    copies = [copy.deepcopy(data) for _ in range(repeat)]
+    return lambda: expand_data(columns, copies.pop())
+
+
+@click.command()
+@click.option("--rows", default=100000, help="Number of rows before expansion.")
+@click.option("--repeat", default=3, help="Number of runs per implementation.")
+def main(rows: int, repeat: int) -> None:
+    with mock.patch.dict(
+        "superset.extensions.feature_flag_manager._feature_flags",
+        {"PRESTO_EXPAND_DATA": True},
+    ):
+        for label, columns, data in (
+            ("wide", WIDE_COLUMNS, generate_wide_data(rows)),
+            ("deep", DEEP_COLUMNS, generate_deep_data(rows)),
+        ):
+            click.echo(f"{label} rows:")
+            report(
+                {
+                    "legacy": measure(
+                        run(legacy_expand_data, columns, data, repeat), repeat
+                    ),
+                    "columnar": measure(
+                        run(PrestoEngineSpec.expand_data, columns, data, repeat), repeat
+                    ),
+                }
+            )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# isort:skip_file
+"""
+Compare the row-oriented `SupersetResultSet` construction, which went through a
+NumPy structured array of objects, with the columnar builder.
+
+    python -m tests.benchmarks.result_set_benchmark --rows 500000
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Any, List, Tuple
+
+import click
+import numpy as np
+import pyarrow as pa
+
+import tests.test_app
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.result_set import stringify_values, SupersetResultSet
+from tests.benchmarks.utils import measure, report
+
+CURSOR_DESCRIPTION = (
+    ("id", "BIGINT"),
+    ("name", "VARCHAR"),
+    ("value", "DOUBLE"),
+    ("ts", "TIMESTAMP"),
+    ("flag", "BOOLEAN"),
+    ("tags", "ARRAY"),
+)
+
+
+def generate_rows(num_rows: int) -> List[Tuple[Any, ...]]:
+    start = datetime(2021, 1, 1)
+    return [
+        (
+            i,
+            f"name_{i % 1000}",
+            random.random() if i % 10 else None,
+            start + timedelta(seconds=i),
+            bool(i % 2),
+            ["a", "b"] if i % 100 == 0 else None,
+        )
+        for i in range(num_rows)
+    ]
+
+
+def legacy_build_table(data: List[Tuple[Any, ...]]) -> pa.Table:
+    """The row-oriented implementation that preceded the columnar builder"""
+    column_names = [col[0] for col in CURSOR_DESCRIPTION]
+    array = np.array(data, dtype=[(name, "object") for name in column_names])
+    pa_data: List[pa.Array] = []
+    for column in column_names:
+        try:
+            pa_data.append(pa.array(array[column].tolist()))
+        except (pa.lib.ArrowInvalid, pa.lib.ArrowTypeError, TypeError):
+            pa_data.append(pa.array(stringify_values(array[column]).tolist()))
+    for i, column in enumerate(column_names):
+        if pa.types.is_nested(pa_data[i].type):
+            pa_data[i] = pa.array(stringify_values(array[column]).tolist())
+    return pa.Table.from_arrays(pa_data, names=column_names)
+
+
+@click.command()
+@click.option("--rows", default=500000, help="Number of rows in the result set.")
+@click.option("--repeat", default=3, help="Number of runs per implementation.")
+def main(rows: int, repeat: int) -> None:
+    data = generate_rows(rows)
+    report(
+        {
+            "legacy": measure(lambda: legacy_build_table(data), repeat),
+            "columnar": measure(
+                lambda: SupersetResultSet(data, CURSOR_DESCRIPTION, BaseEngineSpec),
+                repeat,
+            ),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,56 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import click
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> Tuple[float, int]:
+    """
+    Measure the best wall clock time and the peak Python memory allocated by a
+    function.
+
+    :param func: Function to benchmark
+    :param repeat: Number of times the function is called
+    :return: Best duration in seconds and peak allocated memory in bytes
+    """
+    durations: List[float] = []
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return min(durations), peak
+
+
+def report(results: Dict[str, Tuple[float, int]]) -> None:
+    """
+    Print the results of `measure` for a set of named implementations, relative to
+    the first one.
+    """
+    baseline, _ = next(iter(results.values()))
+    for name, (duration, peak) in results.items():
+        click.echo(
+            f"{name:>24}: {duration:8.3f}s "
+            f"({baseline / duration:5.2f}x) "
+            f"peak {peak / 1024 ** 2:8.1f} MiB"
+        )
@@ -0,0 +1,253 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# isort:skip_file
+"""
+Compare importing a bundle of dashboards, with their charts, datasets and database,
+with the importer looking up and creating the objects one at a time and parsing YAML
+in Python, as it used to, with the batched importer.
+
+    python -m tests.benchmarks.v1_import_benchmark --dashboards 100 --charts 10
+"""
+import copy
+import uuid
+from typing import Any, Callable, Dict, List, Set, Tuple
+from unittest import mock
+
+import click
+import yaml
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import select
+
+from tests.test_app import app
+from superset import db
+from superset.charts.commands.importers.v1.utils import import_chart
+from superset.connectors.sqla.models import SqlaTable
+from superset.dashboards.commands.importers.v1 import ImportDashboardsCommand
+from superset.dashboards.commands.importers.v1.utils import (
+    find_chart_uuids,
+    import_dashboard,
+    update_id_refs,
+)
+from superset.databases.commands.importers.v1.utils import import_database
+from superset.datasets.commands.importers.v1.utils import import_dataset
+from superset.models.core import Database
+from superset.models.dashboard import Dashboard, dashboard_slices
+from superset.models.slice import Slice
+from tests.benchmarks.utils import measure, report
+from tests.fixtures.importexport import (
+    chart_config,
+    dashboard_config,
+    dashboard_metadata_config,
+    database_config,
+    dataset_config,
+)
+
+
+def generate_bundle(
+    num_dashboards: int, num_charts: int, num_datasets: int
+) -> Dict[str, str]:
+    """Generate the contents of a bundle with new UUIDs"""
+    contents = {"metadata.yaml": yaml.safe_dump(dashboard_metadata_config)}
+    database = dict(database_config, uuid=str(uuid.uuid4()))
+    database["database_name"] = f"benchmark_{database['uuid']}"
+    contents["databases/benchmark.yaml"] = yaml.safe_dump(database)
+
+    datasets = []
+    for i in range(num_datasets):
+        dataset = dict(
+            copy.deepcopy(dataset_config),
+            uuid=str(uuid.uuid4()),
+            database_uuid=database["uuid"],
+            table_name=f"benchmark_{i}_{database['uuid']}",
+        )
+        datasets.append(dataset)
+        contents[f"datasets/benchmark_{i}.yaml"] = yaml.safe_dump(dataset)
+
+    chart_id = 0
+    for i in range(num_dashboards):
+        dashboard = copy.deepcopy(dashboard_config)
+        dashboard.update(
+            uuid=str(uuid.uuid4()), dashboard_title=f"benchmark {i}", metadata={}
+        )
+        position = dashboard["position"]
+        template = position.pop("CHART-SVAlICPOSJ")
+        position["ROW-dP_CHaK2q"]["children"] = []
+        for j in range(num_charts):
+            chart_id += 1
+            chart = dict(
+                copy.deepcopy(chart_config),
+                uuid=str(uuid.uuid4()),
+                slice_name=f"benchmark {i}/{j}",
+                dataset_uuid=datasets[chart_id % num_datasets]["uuid"],
+            )
+            contents[f"charts/benchmark_{chart_id}.yaml"] = yaml.safe_dump(chart)
+            child = copy.deepcopy(template)
+            child["id"] = f"CHART-{chart_id}"
+            child["meta"].update(chartId=chart_id, uuid=chart["uuid"])
+            position[child["id"]] = child
+            position["ROW-dP_CHaK2q"]["children"].append(child["id"])
+        contents[f"dashboards/benchmark_{i}.yaml"] = yaml.safe_dump(dashboard)
+
+    return contents
+
+
+def delete_bundle(contents: Dict[str, str]) -> None:
+    models = {
+        "dashboards/": Dashboard,
+        "charts/": Slice,
+        "datasets/": SqlaTable,
+        "databases/": Database,
+    }
+    for prefix, model in models.items():
+        uuids = [
+            yaml.safe_load(content)["uuid"]
+            for file_name, content in contents.items()
+            if file_name.startswith(prefix)
+        ]
+        for obj in db.session.query(model).filter(model.uuid.in_(uuids)):
+            db.session.delete(obj)
+        db.session.commit()
+
+
+class LegacyImportDashboardsCommand(ImportDashboardsCommand):
+    # pylint: disable=too-many-branches, too-many-locals
+    @staticmethod
+    def _import(
+        session: Session, configs: Dict[str, Any], overwrite: bool = False
+    ) -> None:
+        chart_uuids: Set[str] = set()
+        for file_name, config in configs.items():
+            if file_name.startswith("dashboards/"):
+                chart_uuids.update(find_chart_uuids(config["position"]))
+
+        dataset_uuids: Set[str] = set()
+        for file_name, config in configs.items():
+            if file_name.startswith("charts/") and config["uuid"] in chart_uuids:
+                dataset_uuids.add(config["dataset_uuid"])
+
+        database_uuids: Set[str] = set()
+        for file_name, config in configs.items():
+            if file_name.startswith("datasets/") and config["uuid"] in dataset_uuids:
+                database_uuids.add(config["database_uuid"])
+
+        database_ids: Dict[str, int] = {}
+        for file_name, config in configs.items():
+            if file_name.startswith("databases/") and config["uuid"] in database_uuids:
+                database = import_database(session, config, overwrite=False)
+                database_ids[str(database.uuid)] = database.id
+
+        dataset_info: Dict[str, Dict[str, Any]] = {}
+        for file_name, config in configs.items():
+            if (
+                file_name.startswith("datasets/")
+                and config["database_uuid"] in database_ids
+            ):
+                config["database_id"] = database_ids[config["database_uuid"]]
+                dataset = import_dataset(session, config, overwrite=False)
+                dataset_info[str(dataset.uuid)] = {
+                    "datasource_id": dataset.id,
+                    "datasource_type": "view" if dataset.is_sqllab_view else "table",
+                    "datasource_name": dataset.table_name,
+                }
+
+        chart_ids: Dict[str, int] = {}
+        for file_name, config in configs.items():
+            if (
+                file_name.startswith("charts/")
+                and config["dataset_uuid"] in dataset_info
+            ):
+                config.update(dataset_info[config["dataset_uuid"]])
+                chart = import_chart(session, config, overwrite=False)
+                chart_ids[str(chart.uuid)] = chart.id
+
+        existing_relationships = session.execute(
+            select([dashboard_slices.c.dashboard_id, dashboard_slices.c.slice_id])
+        ).fetchall()
+
+        dashboard_chart_ids: List[Tuple[int, int]] = []
+        for file_name, config in configs.items():
+            if file_name.startswith("dashboards/"):
+                config = update_id_refs(config, chart_ids)
+                dashboard = import_dashboard(session, config, overwrite=overwrite)
+                for uuid_ in find_chart_uuids(config["position"]):
+                    if uuid_ not in chart_ids:
+                        break
+                    chart_id = chart_ids[uuid_]
+                    if (dashboard.id, chart_id) not in existing_relationships:
+                        dashboard_chart_ids.append((dashboard.id, chart_id))
+
+        values = [
+            {"dashboard_id": dashboard_id, "slice_id": chart_id}
+            for (dashboard_id, chart_id) in dashboard_chart_ids
+        ]
+        # pylint: disable=no-value-for-parameter (sqlalchemy/issues/4656)
+        session.execute(dashboard_slices.insert(), values)
+
+    def run(self) -> None:
+        with mock.patch(
+            "superset.commands.importers.v1.utils.YAML_LOADER", yaml.SafeLoader
+        ):
+            super().run()
+
+
+IMPLEMENTATIONS: Dict[str, Callable[..., Any]] = {
+    "one at a time": LegacyImportDashboardsCommand,
+    "batched": ImportDashboardsCommand,
+}
+
+
+@click.command()
+@click.option("--dashboards", default=100, help="Number of dashboards.")
+@click.option("--charts", default=10, help="Number of charts per dashboard.")
+@click.option("--datasets", default=20, help="Number of datasets.")
+@click.option("--repeat", default=1, help="Number of runs per implementation.")
+def main(dashboards: int, charts: int, datasets: int, repeat: int) -> None:
+    with app.app_context():
+        bundles: List[Dict[str, str]] = []
+
+        def import_new_bundle(command: Callable[..., Any]) -> None:
+            bundles.append(generate_bundle(dashboards, charts, datasets))
+            command(bundles[-1]).run()
+
+        click.echo("new objects")
+        report(
+            {
+                name: measure(
+                    lambda command=command: import_new_bundle(command), repeat
+                )
+                for name, command in IMPLEMENTATIONS.items()
+            }
+        )
+
+        click.echo("existing objects, overwriting dashboards")
+        contents = bundles[-1]
+        report(
+            {
+                name: measure(
+                    lambda command=command: command(contents, overwrite=True).run(),
+                    repeat,
+                )
+                for name, command in IMPLEMENTATIONS.items()
+            }
+        )
+
+        for bundle in bundles:
+            delete_bundle(bundle)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -1183,6 +1183,24 @@ class TestChartApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixin):
         rv = self.post_assert_metric(CHART_DATA_URI, request_payload, "data")
         self.assertEqual(rv.status_code, 200)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(
+        "superset.common.query_context.config",
+        {"CSV_STREAMING_EXPORT": True, "CSV_EXPORT_CHUNK_SIZE": 2},
+    )
+    def test_chart_data_csv_result_format_streaming(self):
+        """
+        Chart data API: Test chart data with streamed CSV result format
+        """
+        self.login(username="admin")
+        request_payload = get_query_context("birth_names")
+        request_payload["result_format"] = "csv"
+        request_payload["queries"][0]["row_limit"] = 5
+        rv = self.post_assert_metric(CHART_DATA_URI, request_payload, "data")
+        self.assertEqual(rv.status_code, 200)
+        self.assertTrue(rv.is_streamed)
+        self.assertEqual(len(rv.data.decode("utf-8").splitlines()), 6)
+
     # Test chart csv without permission
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_chart_data_csv_result_format_permission_denined(self):
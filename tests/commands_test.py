@@ -15,9 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 # pylint: disable=no-self-use
+from unittest import mock
 
+import yaml
+
+from superset import db
 from superset.commands.exceptions import CommandInvalidError
-from superset.commands.importers.v1.utils import is_valid_config
+from superset.commands.importers.v1.utils import (
+    find_existing,
+    is_valid_config,
+    load_yamls,
+)
+from superset.models.core import Database
+from superset.utils.core import get_example_database
 from tests.base_tests import SupersetTestCase
 
 
@@ -35,3 +45,30 @@ class TestImportersV1Utils(SupersetTestCase):
         assert not is_valid_config(
             "__MACOSX/chart_export_20210111T145253/databases/._examples.yaml"
         )
+
+    def test_load_yamls(self):
+        contents = {
+            f"charts/chart_{i}.yaml": yaml.safe_dump({"slice_name": f"Chart {i}"})
+            for i in range(10)
+        }
+        contents["charts/invalid.yaml"] = "slice_name: [Chart"
+        expected = {
+            f"charts/chart_{i}.yaml": {"slice_name": f"Chart {i}"} for i in range(10)
+        }
+
+        assert load_yamls(contents) == expected
+        with mock.patch.dict(self.app.config, {"IMPORT_PARSE_PROCESSES": 2}):
+            assert load_yamls(contents) == expected
+
+    @mock.patch("superset.commands.importers.v1.utils.UUID_BATCH_SIZE", 1)
+    def test_find_existing(self):
+        database = get_example_database()
+        other = db.session.query(Database).filter(Database.id != database.id).first()
+        uuids = [str(database.uuid), "b8a1ccd3-779d-4ab7-8ad8-9ab119d7fe89"]
+        if other:
+            uuids.append(str(other.uuid))
+
+        existing = find_existing(db.session, Database, uuids)
+        assert existing[str(database.uuid)] == database
+        assert "b8a1ccd3-779d-4ab7-8ad8-9ab119d7fe89" not in existing
+        assert len(existing) == len(uuids) - 1
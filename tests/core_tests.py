@@ -63,6 +63,7 @@ from superset.models.slice import Slice
 from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.utils import core as utils
+from superset.utils.arrow_results import deserialize_table
 from superset.views import core as views
 from superset.views.database.views import DatabaseView
 
@@ -682,6 +683,30 @@ class TestCore(SupersetTestCase):
         assert "Charts" in self.get_resp("/chart/list/")
         assert "Dashboards" in self.get_resp("/dashboard/list/")
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(
+        "superset.views.core.config",
+        {
+            "CSV_STREAMING_EXPORT": True,
+            "CSV_EXPORT_CHUNK_SIZE": 2,
+            "CSV_EXPORT_MAX_ROWS": 3,
+        },
+    )
+    def test_csv_endpoint_streaming(self):
+        self.login()
+        client_id = "{}".format(random.getrandbits(64))[:10]
+        sql = "SELECT name FROM birth_names ORDER BY name LIMIT 5"
+        names = [
+            row["name"]
+            for row in self.run_sql(sql, client_id, raise_on_error=True)["data"]
+        ]
+
+        resp = self.client.get("/superset/csv/{}".format(client_id))
+        assert resp.is_streamed
+        data = csv.reader(io.StringIO(resp.data.decode("utf-8")))
+        assert list(data) == [["name"]] + [[name] for name in names[:3]]
+        self.logout()
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_csv_endpoint(self):
         self.login()
@@ -1235,6 +1260,112 @@ class TestCore(SupersetTestCase):
 
         app.config["RESULTS_BACKEND_USE_MSGPACK"] = use_msgpack
 
+    @mock.patch("superset.views.core.results_backend_use_msgpack", True)
+    @mock.patch("superset.views.core.results_backend")
+    def test_display_limit_arrow(self, mock_results_backend):
+        self.login()
+
+        db_engine_spec = BaseEngineSpec()
+        results = SupersetResultSet(
+            [(i,) for i in range(100)], (("col_0", "int"),), db_engine_spec
+        )
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = sql_lab._serialize_and_expand_data(results, db_engine_spec, True)
+        payload = {
+            "status": utils.QueryStatus.SUCCESS,
+            "query": {"rows": 100},
+            "data": data,
+            "columns": all_columns,
+            "selected_columns": selected_columns,
+            "expanded_columns": expanded_columns,
+        }
+        mock_results_backend.get.return_value = sql_lab._serialize_payload(
+            payload, True
+        )
+
+        query_mock = mock.Mock()
+        query_mock.database.db_engine_spec = db_engine_spec
+        with mock.patch("superset.views.core.db") as mock_superset_db:
+            mock_superset_db.session.query().filter_by().one_or_none.return_value = (
+                query_mock
+            )
+            result = json.loads(self.get_resp("/superset/results/key/"))
+            with mock.patch(
+                "superset.views.utils.deserialize_table", wraps=deserialize_table
+            ) as mock_deserialize_table:
+                result_limited = json.loads(
+                    self.get_resp("/superset/results/key/?rows=1")
+                )
+                assert mock_deserialize_table.call_args[0][1:] == (0, 1, None)
+            result_page = json.loads(
+                self.get_resp("/superset/results/key/?rows=2&offset=10&columns=col_0")
+            )
+            result_last_page = json.loads(
+                self.get_resp("/superset/results/key/?rows=2&offset=98")
+            )
+            resp = self.client.get("/superset/results/key/?offset=-1")
+            assert resp.status_code == 400
+
+        assert result["data"] == [{"col_0": i} for i in range(100)]
+        assert "displayLimitReached" not in result
+        assert result_limited["data"] == [{"col_0": 0}]
+        assert result_limited["displayLimitReached"]
+        assert result_page["data"] == [{"col_0": 10}, {"col_0": 11}]
+        assert result_page["displayLimitReached"]
+        assert result_last_page["data"] == [{"col_0": 98}, {"col_0": 99}]
+        assert "displayLimitReached" not in result_last_page
+
+    def test_results_default_deserialization_page(self):
+        payload = {
+            "status": utils.QueryStatus.SUCCESS,
+            "data": [{"a": i, "b": str(i)} for i in range(10)],
+            "columns": [{"name": "a"}, {"name": "b"}],
+            "selected_columns": [{"name": "a"}, {"name": "b"}],
+            "expanded_columns": [],
+        }
+        serialized_payload = sql_lab._serialize_payload(payload, False)
+        deserialized_payload = superset.views.utils._deserialize_results_payload(
+            serialized_payload, mock.Mock(), False, offset=2, limit=3, columns=["b"]
+        )
+        assert deserialized_payload["data"] == [{"b": "2"}, {"b": "3"}, {"b": "4"}]
+        assert deserialized_payload["columns"] == [{"name": "b"}]
+        assert deserialized_payload["selected_columns"] == [{"name": "b"}]
+
+    def test_iter_results_payload(self):
+        db_engine_spec = BaseEngineSpec()
+        results = SupersetResultSet(
+            [(i,) for i in range(5)], (("col_0", "int"),), db_engine_spec
+        )
+        query_mock = mock.Mock()
+        query_mock.database.db_engine_spec = db_engine_spec
+        for use_msgpack in (False, True):
+            (
+                data,
+                selected_columns,
+                all_columns,
+                expanded_columns,
+            ) = sql_lab._serialize_and_expand_data(results, db_engine_spec, use_msgpack)
+            payload = {
+                "status": utils.QueryStatus.SUCCESS,
+                "data": data,
+                "columns": all_columns,
+                "selected_columns": selected_columns,
+                "expanded_columns": expanded_columns,
+            }
+            serialized_payload = sql_lab._serialize_payload(payload, use_msgpack)
+            batches = superset.views.utils._iter_results_payload(
+                serialized_payload, query_mock, use_msgpack, batch_size=2
+            )
+            assert [batch["data"] for batch in batches] == [
+                [{"col_0": 0}, {"col_0": 1}],
+                [{"col_0": 2}, {"col_0": 3}],
+                [{"col_0": 4}],
+            ]
+
     def test_results_default_deserialization(self):
         use_new_deserialization = False
         data = [("a", 4, 4.0, "2019-08-18T16:39:16.660000")]
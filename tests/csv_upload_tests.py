@@ -42,6 +42,7 @@ test_client = app.test_client()
 CSV_UPLOAD_DATABASE = "csv_explore_db"
 CSV_FILENAME1 = "testCSV1.csv"
 CSV_FILENAME2 = "testCSV2.csv"
+CSV_FILENAME3 = "testCSV3.csv"
 EXCEL_FILENAME = "testExcel.xlsx"
 
 EXCEL_UPLOAD_TABLE = "excel_upload"
@@ -64,8 +65,16 @@ def setup_csv_upload():
         upload_db.allow_csv_upload = True
         db.session.commit()
 
+        upload_folder = app.config["UPLOAD_FOLDER"]
+        utils.ensure_path_exists(upload_folder)
+        uploaded_files = set(os.listdir(upload_folder))
+
         yield
 
+        # remove the temporary files the uploads left in the upload folder
+        for filename in set(os.listdir(upload_folder)) - uploaded_files:
+            os.remove(os.path.join(upload_folder, filename))
+
         upload_db = get_upload_db()
         engine = upload_db.get_sqla_engine()
         engine.execute(f"DROP TABLE IF EXISTS {EXCEL_UPLOAD_TABLE}")
@@ -289,6 +298,91 @@ def test_import_csv(setup_csv_upload, create_csv_files):
     assert data == [("john", 1, "x"), ("paul", 2, None)]
 
 
+@mock.patch("superset.db_engine_specs.hive.upload_to_s3", mock_upload_to_s3)
+def test_import_csv_in_chunks(setup_csv_upload, create_csv_files):
+    engine_spec = get_upload_db().db_engine_spec
+    with mock.patch.dict(app.config, {"CSV_UPLOAD_CHUNK_SIZE": 1}), mock.patch.object(
+        engine_spec, "df_to_sql", side_effect=engine_spec.df_to_sql
+    ) as df_to_sql:
+        resp = upload_csv(
+            CSV_FILENAME2, CSV_UPLOAD_TABLE, extra={"if_exists": "replace"}
+        )
+    assert f'CSV file "{CSV_FILENAME2}" uploaded to table "{CSV_UPLOAD_TABLE}"' in resp
+
+    if utils.backend() != "hive":
+        # the chunks are loaded into a staging table which replaces the table
+        assert [call[0][3]["if_exists"] for call in df_to_sql.call_args_list] == [
+            "fail",
+            "append",
+        ]
+        assert {call[0][1].table for call in df_to_sql.call_args_list} != {
+            CSV_UPLOAD_TABLE
+        }
+    data = (
+        get_upload_db()
+        .get_sqla_engine()
+        .execute(f"SELECT b, c, d from {CSV_UPLOAD_TABLE}")
+        .fetchall()
+    )
+    assert data == [("john", 1, "x"), ("paul", 2, None)]
+
+
+@mock.patch("superset.db_engine_specs.hive.upload_to_s3", mock_upload_to_s3)
+def test_import_csv_malformed_chunk(setup_csv_upload, create_csv_files):
+    upload_csv(CSV_FILENAME2, CSV_UPLOAD_TABLE, extra={"if_exists": "replace"})
+
+    with open(CSV_FILENAME3, "w+") as test_file:
+        for line in ["b,c,d", "p,10,x", "q,11,x", "r,12,x", "s,13,x", '"t,14,x']:
+            test_file.write(f"{line}\n")
+    try:
+        with mock.patch.dict(app.config, {"CSV_UPLOAD_CHUNK_SIZE": 2}):
+            resp = upload_csv(
+                CSV_FILENAME3, CSV_UPLOAD_TABLE, extra={"if_exists": "replace"}
+            )
+    finally:
+        os.remove(CSV_FILENAME3)
+    assert f'Unable to upload CSV file "{CSV_FILENAME3}"' in resp
+
+    # the table isn't replaced by the chunks read before the malformed line
+    data = (
+        get_upload_db()
+        .get_sqla_engine()
+        .execute(f"SELECT b, c, d from {CSV_UPLOAD_TABLE}")
+        .fetchall()
+    )
+    assert data == [("john", 1, "x"), ("paul", 2, None)]
+
+
+@mock.patch("superset.db_engine_specs.hive.upload_to_s3", mock_upload_to_s3)
+@mock.patch.dict("superset.views.database.views.config", {"CSV_UPLOAD_ASYNC": True})
+def test_import_csv_async(setup_csv_upload, create_csv_files):
+    from superset.tasks.upload import load_csv_to_database
+
+    with mock.patch.object(load_csv_to_database, "delay") as delay:
+        resp = upload_csv(
+            CSV_FILENAME1, CSV_UPLOAD_TABLE, extra={"if_exists": "replace"}
+        )
+    assert (
+        f'CSV file "{CSV_FILENAME1}" is being uploaded to table "{CSV_UPLOAD_TABLE}"'
+        in resp
+    )
+
+    # run the task as a worker would
+    args = delay.call_args[0]
+    path = args[3]
+    assert os.path.exists(path)
+    load_csv_to_database.apply(args)
+    assert not os.path.exists(path)
+
+    data = (
+        get_upload_db()
+        .get_sqla_engine()
+        .execute(f"SELECT a, b from {CSV_UPLOAD_TABLE}")
+        .fetchall()
+    )
+    assert data == [("john", 1), ("paul", 2)]
+
+
 @mock.patch("superset.db_engine_specs.hive.upload_to_s3", mock_upload_to_s3)
 def test_import_excel(setup_csv_upload, create_excel_files):
     if utils.backend() == "hive":
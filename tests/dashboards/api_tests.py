@@ -33,6 +33,7 @@ from sqlalchemy.sql import func
 from freezegun import freeze_time
 from sqlalchemy import and_
 from superset import db, security_manager
+from superset.connectors.sqla.models import SqlaTable
 from superset.models.dashboard import Dashboard
 from superset.models.core import FavStar, FavStarClassName
 from superset.models.reports import ReportSchedule, ReportScheduleType
@@ -52,6 +53,7 @@ from tests.fixtures.importexport import (
 )
 from tests.utils.get_dashboards import get_dashboards_ids
 from tests.fixtures.birth_names_dashboard import load_birth_names_dashboard_with_slices
+from tests.fixtures.query_context import get_query_context
 from tests.fixtures.world_bank_dashboard import load_world_bank_dashboard_with_slices
 
 DASHBOARDS_FIXTURE_COUNT = 10
@@ -260,6 +262,69 @@ class TestDashboardApi(SupersetTestCase, ApiOwnersTestCaseMixin, InsertChartMixi
             data["result"][0]["slice_name"], dashboard.slices[0].slice_name
         )
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_get_dashboard_chart_data(self):
+        """
+        Dashboard API: Test getting the data of charts with fused queries
+        """
+        self.login(username="admin")
+        sum_num = get_query_context("birth_names")
+        count = get_query_context("birth_names")
+        count["queries"][0]["metrics"] = [
+            {"expressionType": "SQL", "sqlExpression": "COUNT(*)", "label": "count"},
+            {"label": "sum__num"},
+        ]
+        count["queries"][0]["row_limit"] = 10
+        by_gender = get_query_context("birth_names")
+        by_gender["queries"][0]["groupby"] = ["gender"]
+        for query_context in (sum_num, count, by_gender):
+            query_context["force"] = True
+
+        uri = "api/v1/dashboard/births/charts/data"
+        with patch.object(
+            SqlaTable, "query", autospec=True, side_effect=SqlaTable.query
+        ) as query:
+            rv = self.post_assert_metric(
+                uri, {"queries": [sum_num, count, by_gender]}, "get_chart_data"
+            )
+        self.assertEqual(rv.status_code, 200)
+        # the queries grouped by name are fused
+        self.assertEqual(query.call_count, 2)
+        result = json.loads(rv.data.decode("utf-8"))["result"]
+        self.assertEqual(len(result), 3)
+        sum_num_data = result[0]["result"][0]["data"]
+        count_data = result[1]["result"][0]["data"]
+        self.assertEqual(result[0]["result"][0]["colnames"], ["name", "sum__num"])
+        self.assertEqual(
+            result[1]["result"][0]["colnames"], ["name", "count", "sum__num"]
+        )
+        self.assertEqual(len(count_data), 10)
+        self.assertEqual(
+            [row["sum__num"] for row in count_data],
+            [row["sum__num"] for row in sum_num_data[:10]],
+        )
+        self.assertEqual(result[2]["result"][0]["colnames"], ["gender", "sum__num"])
+
+        # each query is cached on its own
+        for query_context, data in ((sum_num, sum_num_data), (count, count_data)):
+            query_context["force"] = False
+            rv = self.client.post("api/v1/chart/data", json=query_context)
+            chart_result = json.loads(rv.data.decode("utf-8"))["result"][0]
+            self.assertTrue(chart_result["is_cached"])
+            self.assertEqual(chart_result["data"], data)
+
+    @pytest.mark.usefixtures("create_dashboards")
+    def test_get_dashboard_chart_data_not_found(self):
+        """
+        Dashboard API: Test getting the data of charts of a dashboard that does not
+        exist
+        """
+        self.login(username="admin")
+        bad_id = self.get_nonexistent_numeric_id(Dashboard)
+        uri = f"api/v1/dashboard/{bad_id}/charts/data"
+        rv = self.client.post(uri, json={"queries": []})
+        self.assertEqual(rv.status_code, 404)
+
     @pytest.mark.usefixtures("create_dashboards")
     def test_get_dashboard_charts_not_found(self):
         """
@@ -571,6 +571,7 @@ class TestImportDashboardsCommand(SupersetTestCase):
         dashboard = (
             db.session.query(Dashboard).filter_by(uuid=dashboard_config["uuid"]).one()
         )
+        assert len(dashboard.slices) == 1
         chart = dashboard.slices[0]
         dataset = chart.table
         database = dataset.database
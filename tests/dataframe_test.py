@@ -19,7 +19,7 @@ import numpy as np
 import pandas as pd
 
 import tests.test_app
-from superset.dataframe import df_to_records
+from superset.dataframe import df_to_json_records, df_to_records
 from superset.db_engine_specs import BaseEngineSpec
 from superset.result_set import SupersetResultSet
 
@@ -51,3 +51,45 @@ class TestSupersetDataFrame(SupersetTestCase):
                 {"a": 2, "b": 100, "c": "c2"},
             ],
         )
+
+    def test_df_to_json_records(self):
+        df = pd.DataFrame(
+            {
+                "a": [1, 1239162456494753670],
+                "b": pd.to_datetime(["2020-01-01", "2020-01-01 00:00:00.250"]),
+                "c": [1.5, 2.5],
+                "d": ["c1", None],
+            }
+        )
+        df["e"] = df["b"].dt.tz_localize("Europe/Paris")
+        df.loc[1, "b"] = pd.NaT
+
+        self.assertEqual(
+            df_to_json_records(df),
+            [
+                {
+                    "a": 1,
+                    "b": "2020-01-01T00:00:00",
+                    "c": 1.5,
+                    "d": "c1",
+                    "e": "2020-01-01T00:00:00+01:00",
+                },
+                {
+                    "a": "1239162456494753670",
+                    "b": None,
+                    "c": 2.5,
+                    "d": None,
+                    "e": "2020-01-01T00:00:00.250000+01:00",
+                },
+            ],
+        )
+
+        records = df_to_json_records(
+            df, dttm_format="epoch", convert_big_integers=False
+        )
+        self.assertEqual(records[0]["a"], 1)
+        self.assertEqual(records[1]["a"], 1239162456494753670)
+        self.assertEqual(records[0]["b"], 1577836800000.0)
+        self.assertIsNone(records[1]["b"])
+        # timezone aware values are read as UTC, like `json_int_dttm_ser` does
+        self.assertEqual(records[1]["e"], 1577836800250.0)
@@ -16,6 +16,8 @@
 # under the License.
 # pylint: disable=no-self-use, invalid-name, line-too-long
 
+import copy
+import io
 from operator import itemgetter
 from typing import Any, List
 from unittest.mock import patch
@@ -387,6 +389,41 @@ class TestImportDatasetsCommand(SupersetTestCase):
         db.session.delete(dataset.database)
         db.session.commit()
 
+    @patch("superset.datasets.commands.importers.v1.utils.request")
+    def test_import_v1_dataset_data(self, mock_request):
+        """Test that the data of a dataset is loaded in chunks"""
+        mock_request.urlopen.return_value = io.BytesIO(b"cnt\n1\n2\n3\n4\n5\n")
+        config = copy.deepcopy(dataset_config)
+        config["data"] = "https://example.com/imported_dataset.csv"
+        config["columns"][0]["type"] = "BIGINT"
+        config["schema"] = None
+        contents = {
+            "metadata.yaml": yaml.safe_dump(dataset_metadata_config),
+            "databases/imported_database.yaml": yaml.safe_dump(database_config),
+            "datasets/imported_dataset.yaml": yaml.safe_dump(config),
+        }
+        command = v1.ImportDatasetsCommand(contents)
+        with patch.dict(self.app.config, {"IMPORT_DATA_CHUNK_SIZE": 2}):
+            command.run()
+
+        example_database = get_example_database()
+        engine = example_database.get_sqla_engine()
+        assert engine.execute("SELECT cnt FROM imported_dataset").fetchall() == [
+            (1,),
+            (2,),
+            (3,),
+            (4,),
+            (5,),
+        ]
+
+        engine.execute("DROP TABLE imported_dataset")
+        dataset = (
+            db.session.query(SqlaTable).filter_by(uuid=dataset_config["uuid"]).one()
+        )
+        db.session.delete(dataset)
+        db.session.delete(dataset.database)
+        db.session.commit()
+
     def test_import_v1_dataset_validation(self):
         """Test different validations applied when importing a dataset"""
         # metadata.yaml must be present
@@ -15,20 +15,24 @@
 # specific language governing permissions and limitations
 # under the License.
 import datetime
+from typing import List
 from unittest import mock
 
+import pandas as pd
 import pytest
+from sqlalchemy import create_engine
 
 from superset.db_engine_specs import get_engine_specs
 from superset.db_engine_specs.base import (
     BaseEngineSpec,
     builtin_time_grains,
+    bulk_load_text_rows,
     LimitMethod,
 )
 from superset.db_engine_specs.mysql import MySQLEngineSpec
 from superset.db_engine_specs.sqlite import SqliteEngineSpec
-from superset.sql_parse import ParsedQuery
-from superset.utils.core import get_example_database
+from superset.sql_parse import ParsedQuery, Table
+from superset.utils.core import get_example_database, SeriesLimitStrategy
 from tests.db_engine_specs.base_tests import TestDbEngineSpec
 from tests.test_app import app
 
@@ -365,3 +369,156 @@ def test_get_time_grain_with_unkown_values():
         assert list(time_grains)[-1] == "weird"
 
     app.config = config
+
+
+def test_fetch_batches():
+    cursor = mock.Mock()
+    cursor.description = [("a", "INT"), ("b", "VARCHAR"), ("a", "INT")]
+    rows = [(1, "x", 10), (2, None, 20), (3, "z", 30)]
+    cursor.fetchmany.side_effect = lambda size: [
+        rows.pop(0) for _ in range(min(size, len(rows)))
+    ]
+
+    batches = list(BaseEngineSpec.fetch_batches(cursor, batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert batches[0].schema.names == ["a", "b", "a__1"]
+    assert batches[0].to_pydict() == {"a": [1, 2], "b": ["x", None], "a__1": [10, 20]}
+    assert batches[1].to_pydict() == {"a": [3], "b": ["z"], "a__1": [30]}
+
+
+def test_fetch_batches_limit():
+    cursor = mock.Mock()
+    cursor.description = [("a", "INT")]
+    cursor.fetchmany.side_effect = lambda size: [(i,) for i in range(size)]
+
+    batches = list(BaseEngineSpec.fetch_batches(cursor, batch_size=4, limit=6))
+    assert [batch.num_rows for batch in batches] == [4, 2]
+    assert cursor.fetchmany.call_args_list == [mock.call(4), mock.call(2)]
+
+
+def test_fetch_batches_no_description():
+    cursor = mock.Mock()
+    cursor.description = None
+    assert list(BaseEngineSpec.fetch_batches(cursor, batch_size=2)) == []
+    cursor.fetchmany.assert_not_called()
+
+
+def test_get_series_limit_strategy():
+    assert BaseEngineSpec.get_series_limit_strategy() == SeriesLimitStrategy.JOIN
+    with mock.patch.object(BaseEngineSpec, "allows_joins", False):
+        assert (
+            BaseEngineSpec.get_series_limit_strategy() == SeriesLimitStrategy.PREQUERY
+        )
+
+
+def test_bulk_load_text_rows():
+    rows = [(1, "a\tb", None), (2.5, "c\\d\ne", True)]
+    assert list(bulk_load_text_rows(rows)) == [
+        "1\ta\\tb\t\\N\n",
+        "2.5\tc\\\\d\\ne\t1\n",
+    ]
+
+
+@pytest.fixture
+def upload_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'upload.db'}")
+    engine.execute("CREATE TABLE my_table (a INTEGER)")
+    engine.execute("INSERT INTO my_table VALUES (10), (11)")
+    with mock.patch.object(BaseEngineSpec, "get_engine", return_value=engine):
+        yield engine
+
+
+def upload_chunks(if_exists, *dfs, progress=None):
+    return BaseEngineSpec.dfs_to_sql(
+        mock.ANY,
+        Table("my_table"),
+        iter(dfs),
+        {"if_exists": if_exists, "index": False},
+        progress,
+    )
+
+
+@pytest.mark.parametrize(
+    "if_exists,expected", [("replace", [1, 2, 3]), ("append", [10, 11, 1, 2, 3])]
+)
+def test_dfs_to_sql(upload_engine, if_exists, expected):
+    progress = mock.Mock()
+    rows = upload_chunks(
+        if_exists,
+        pd.DataFrame({"a": [1, 2]}),
+        pd.DataFrame({"a": [3]}),
+        progress=progress,
+    )
+    assert rows == 3
+    assert progress.call_args_list == [mock.call(2), mock.call(3)]
+    assert [a for (a,) in upload_engine.execute("SELECT a FROM my_table")] == expected
+    # the staging table was renamed or dropped
+    assert upload_engine.table_names() == ["my_table"]
+
+
+def test_dfs_to_sql_fail(upload_engine):
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]
+    with pytest.raises(ValueError):
+        upload_chunks("fail", *chunks)
+    upload_engine.execute("DROP TABLE my_table")
+    upload_chunks("fail", *chunks)
+    assert [a for (a,) in upload_engine.execute("SELECT a FROM my_table")] == [
+        1,
+        2,
+        3,
+    ]
+
+
+@pytest.mark.parametrize("if_exists", ["replace", "append"])
+def test_dfs_to_sql_failed_chunk(upload_engine, if_exists):
+    def chunks():
+        yield pd.DataFrame({"a": [1, 2]})
+        yield pd.DataFrame({"a": [3]})
+        raise pd.errors.ParserError("Error tokenizing data")
+
+    with pytest.raises(pd.errors.ParserError):
+        BaseEngineSpec.dfs_to_sql(
+            mock.ANY,
+            Table("my_table"),
+            chunks(),
+            {"if_exists": if_exists, "index": False},
+        )
+    # the table is left untouched and the staging table is dropped
+    assert [a for (a,) in upload_engine.execute("SELECT a FROM my_table")] == [10, 11]
+    assert upload_engine.table_names() == ["my_table"]
+
+
+@mock.patch.object(BaseEngineSpec, "df_to_sql")
+@mock.patch.object(BaseEngineSpec, "load_staging_table")
+def test_dfs_to_sql_nulls_in_later_chunk(load_staging_table, df_to_sql, upload_engine):
+    dfs = [
+        pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5]}),
+        pd.DataFrame({"a": [3, None], "b": [2.0, None]}),
+    ]
+    upload_chunks("replace", *dfs)
+    chunk = df_to_sql.call_args_list[1][0][2]
+    assert chunk.dtypes.to_dict() == {"a": "Int64", "b": "float64"}
+
+    # integers are written without a fraction by the bulk loaders
+    lines: List[str] = []
+    chunk.to_sql(
+        "chunk",
+        create_engine("sqlite://"),
+        index=False,
+        method=lambda table, conn, keys, data_iter: lines.extend(
+            bulk_load_text_rows(data_iter)
+        ),
+    )
+    assert lines == ["3\t2.0\n", "\\N\t\\N\n"]
+
+
+@mock.patch.object(BaseEngineSpec, "df_to_sql")
+@mock.patch.object(BaseEngineSpec, "supports_chunked_upload", False)
+def test_dfs_to_sql_not_chunked(df_to_sql):
+    dfs = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]}, index=[2])]
+    rows = BaseEngineSpec.dfs_to_sql(
+        mock.ANY, mock.ANY, iter(dfs), {"if_exists": "fail"}
+    )
+    assert rows == 3
+    df_to_sql.assert_called_once()
+    assert df_to_sql.call_args[0][2].equals(pd.DataFrame({"a": [1, 2, 3]}))
@@ -379,3 +379,12 @@ def test_where_latest_partition_no_columns_no_values(mock_method):
             "test_table", "test_schema", db, select()
         )
     assert result is None
+
+
+@mock.patch("superset.db_engine_specs.base.BaseEngineSpec.fetch_batches")
+def test_fetch_batches_programming_error(fetch_batches_mock):
+    from pyhive.exc import ProgrammingError
+
+    fetch_batches_mock.side_effect = ProgrammingError
+    cursor = mock.Mock()
+    assert list(HiveEngineSpec.fetch_batches(cursor, 100)) == []
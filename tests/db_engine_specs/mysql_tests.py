@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import unittest
+from unittest import mock
 
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects.mysql import DATE, NVARCHAR, TEXT, VARCHAR
@@ -214,3 +215,43 @@ class TestMySQLEngineSpecsDbEngineSpec(TestDbEngineSpec):
                 },
             )
         ]
+
+
+def test_load_data_local_infile():
+    """
+    DB Eng Specs (mysql): Test uploading rows with LOAD DATA LOCAL INFILE
+    """
+    database = mock.Mock()
+    database.get_extra.return_value = {}
+    engine = mock.Mock()
+    engine.dialect.supports_multivalues_insert = True
+    assert MySQLEngineSpec.get_df_to_sql_method(database, engine) == "multi"
+    database.get_extra.return_value = {
+        "engine_params": {"connect_args": {"local_infile": 1}}
+    }
+    method = MySQLEngineSpec.get_df_to_sql_method(database, engine)
+    assert method == MySQLEngineSpec.load_data_local_infile
+
+    pd_table = mock.Mock()
+    pd_table.name = "tbl"
+    pd_table.schema = None
+    conn = mock.Mock()
+    conn.dialect = mysql.dialect()
+    cursor = conn.connection.cursor.return_value
+    contents = []
+
+    def execute(sql, params):
+        with open(params[0]) as file:
+            contents.append(file.read())
+
+    cursor.execute.side_effect = execute
+    method(pd_table, conn, ["a", "100%"], iter([(1, None), (2, "x\ty")]))
+
+    sql = cursor.execute.call_args[0][0]
+    assert sql == (
+        "LOAD DATA LOCAL INFILE %s INTO TABLE tbl CHARACTER SET utf8mb4 "
+        "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+        "LINES TERMINATED BY '\\n' (a, `100%%`)"
+    )
+    assert contents == ["1\t\\N\n2\tx\\ty\n"]
+    cursor.close.assert_called_once()
@@ -454,3 +454,26 @@ def test_base_parameters_mixin():
         },
         "required": ["database", "host", "port"],
     }
+
+
+def test_copy_from_stdin():
+    """
+    DB Eng Specs (postgres): Test uploading rows with COPY FROM STDIN
+    """
+    engine = mock.Mock()
+    engine.dialect.driver = "psycopg2"
+    method = PostgresEngineSpec.get_df_to_sql_method(mock.ANY, engine)
+    assert method == PostgresEngineSpec.copy_from_stdin
+
+    pd_table = mock.Mock()
+    pd_table.name = "my table"
+    pd_table.schema = "public"
+    conn = mock.MagicMock()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    cursor.copy_expert.side_effect = lambda sql, file: file.read()
+    method(pd_table, conn, ["a", "100%"], iter([(1, "x"), (None, "y")]))
+
+    sql, file = cursor.copy_expert.call_args[0]
+    assert sql == 'COPY "public"."my table" ("a", "100%") FROM STDIN'
+    file.seek(0)
+    assert file.read() == "1\tx\n\\N\ty\n"
@@ -379,6 +379,35 @@ class TestPrestoDbEngineSpec(TestDbEngineSpec):
         self.assertEqual(actual_data, expected_data)
         self.assertEqual(actual_expanded_cols, expected_expanded_cols)
 
+    @mock.patch.dict(
+        "superset.extensions.feature_flag_manager._feature_flags",
+        {"PRESTO_EXPAND_DATA": True},
+        clear=True,
+    )
+    def test_presto_expand_data_with_sibling_array_columns(self):
+        cols = [
+            {"name": "id", "type": "BIGINT"},
+            {"name": "tags", "type": "ARRAY(VARCHAR)"},
+            {"name": "scores", "type": "ARRAY(BIGINT)"},
+        ]
+        data = [
+            {"id": 1, "tags": [], "scores": [1, 2]},
+            {"id": 2, "tags": ["x", "y"], "scores": [3, 4, 5]},
+        ]
+        actual_cols, actual_data, actual_expanded_cols = PrestoEngineSpec.expand_data(
+            cols, data
+        )
+        expected_data = [
+            {"id": 1, "tags": [], "scores": 1},
+            {"id": "", "tags": "", "scores": 2},
+            {"id": 2, "tags": "x", "scores": 3},
+            {"id": "", "tags": "y", "scores": 4},
+            {"id": "", "tags": "", "scores": 5},
+        ]
+        self.assertEqual(actual_cols, cols)
+        self.assertEqual(actual_data, expected_data)
+        self.assertEqual(actual_expanded_cols, [])
+
     def test_presto_extra_table_metadata(self):
         db = mock.Mock()
         db.get_indexes = mock.Mock(return_value=[{"column_names": ["ds", "hour"]}])
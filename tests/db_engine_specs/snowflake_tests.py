@@ -15,6 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 import json
+from unittest import mock
+
+import pyarrow as pa
 
 from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
 from superset.models.core import Database
@@ -43,3 +46,22 @@ class TestSnowflakeDbEngineSpec(TestDbEngineSpec):
             {"engine_params": {"connect_args": {"validate_default_parameters": True}}},
             engine_params,
         )
+
+    def test_fetch_batches_arrow(self):
+        table = pa.Table.from_pydict({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        cursor = mock.Mock()
+        cursor.fetch_arrow_batches.return_value = iter([table, table])
+
+        batches = list(SnowflakeEngineSpec.fetch_batches(cursor, 2, limit=5))
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1, 2])
+        self.assertEqual(batches[-1].to_pydict(), {"a": [1, 2], "b": ["x", "y"]})
+        cursor.fetchmany.assert_not_called()
+
+    def test_fetch_batches_without_arrow(self):
+        cursor = mock.Mock()
+        cursor.description = [("a", "NUMBER")]
+        cursor.fetch_arrow_batches.side_effect = Exception("not supported")
+        cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+
+        batches = list(SnowflakeEngineSpec.fetch_batches(cursor, 2))
+        self.assertEqual([batch.to_pydict() for batch in batches], [{"a": [1, 2]}])
@@ -19,7 +19,7 @@ import time
 import unittest
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Dict, Iterator, Optional, Type, Union
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from flask import current_app
 from freezegun import freeze_time
@@ -27,6 +27,7 @@ from freezegun import freeze_time
 from superset import security_manager
 from superset.utils.log import (
     AbstractEventLogger,
+    BufferedDBEventLogger,
     DBEventLogger,
     get_event_logger_from_cfg_value,
 )
@@ -230,3 +231,72 @@ class TestEventLogger(unittest.TestCase):
             )
 
         assert logger.records[0]["user_id"] == None
+
+    def log_records(self, logger, count):
+        logger.log(
+            None,
+            "foo",
+            dashboard_id=None,
+            duration_ms=None,
+            slice_id=None,
+            referrer=None,
+            records=[{"index": i} for i in range(count)],
+        )
+
+    def test_buffered_event_logger_flush(self):
+        logger = BufferedDBEventLogger(flush_interval=3600)
+        with app.app_context(), patch.object(logger, "save_logs") as save_logs:
+            with freeze_time("2020-01-01T00:00:00"):
+                self.log_records(logger, 3)
+            save_logs.assert_not_called()
+
+            with freeze_time("2020-01-01T00:01:00"):
+                logger.flush()
+            save_logs.assert_called_once()
+            logs = save_logs.call_args[0][0]
+            assert [log.json for log in logs] == [
+                '{"index": 0}',
+                '{"index": 1}',
+                '{"index": 2}',
+            ]
+            # logs are timestamped when logged rather than when saved
+            assert {log.dttm for log in logs} == {datetime(2020, 1, 1)}
+
+    def test_buffered_event_logger_batch_size(self):
+        logger = BufferedDBEventLogger(batch_size=2, flush_interval=3600)
+        with app.app_context(), patch.object(logger, "save_logs") as save_logs:
+            self.log_records(logger, 2)
+            for _ in range(50):
+                if save_logs.called:
+                    break
+                time.sleep(0.1)
+            save_logs.assert_called_once()
+            assert len(save_logs.call_args[0][0]) == 2
+
+    def test_buffered_event_logger_backpressure(self):
+        stats_logger = Mock()
+        with app.app_context(), patch.dict(
+            current_app.config, {"STATS_LOGGER": stats_logger}
+        ):
+            logger = BufferedDBEventLogger(
+                max_queue_size=4,
+                flush_interval=3600,
+                sample_threshold=0.5,
+                sample_rate=0,
+            )
+            with patch.object(logger, "save_logs") as save_logs:
+                self.log_records(logger, 5)
+                logger.flush()
+                assert len(save_logs.call_args[0][0]) == 2
+            assert stats_logger.incr.call_count == 3
+            stats_logger.incr.assert_called_with("event_logger.sampled_out")
+
+            logger = BufferedDBEventLogger(
+                max_queue_size=4, flush_interval=3600, sample_rate=1
+            )
+            stats_logger.reset_mock()
+            with patch.object(logger, "save_logs") as save_logs:
+                self.log_records(logger, 5)
+                logger.flush()
+                assert len(save_logs.call_args[0][0]) == 4
+            stats_logger.incr.assert_called_once_with("event_logger.dropped")
@@ -20,12 +20,17 @@ import unittest
 from unittest import mock
 from tests.fixtures.birth_names_dashboard import load_birth_names_dashboard_with_slices
 
+from collections import OrderedDict
+
 import pandas
 import pytest
+from cachelib import SimpleCache
+from sqlalchemy import column, Integer, String
 from sqlalchemy.engine.url import make_url
 
 import tests.test_app
 from superset import app, db as metadata_db
+from superset.connectors.sqla.models import SqlaTable
 from superset.models.core import Database
 from superset.models.slice import Slice
 from superset.utils.core import get_example_database, QueryStatus
@@ -203,6 +208,35 @@ class TestDatabaseModel(SupersetTestCase):
             "password": "original_user_password",
         }
 
+    @mock.patch("superset.models.core.engine_registry")
+    def test_get_sqla_engine_pooling(self, mocked_engine_registry):
+        uri = "presto://localhost/hive/default"
+        extra = """
+                {
+                    "engine_params": {"pool_size": 10, "max_overflow": 5}
+                }
+                """
+        model = Database(
+            id=1, database_name="test_database", sqlalchemy_uri=uri, extra=extra
+        )
+
+        mocked_engine_registry.enabled = True
+        engine = model.get_sqla_engine(schema="core_db")
+        assert engine == mocked_engine_registry.get_engine.return_value
+        call_args = mocked_engine_registry.get_engine.call_args
+        assert call_args[0][:3] == (1, None, "core_db")
+        assert str(call_args[0][3]) == "presto://localhost/hive/core_db"
+        assert call_args[0][4] == {"pool_size": 10, "max_overflow": 5}
+
+        mocked_engine_registry.get_engine.reset_mock()
+        engine = model.get_sqla_engine(schema="core_db", nullpool=True)
+        assert engine.pool.__class__.__name__ == "NullPool"
+        mocked_engine_registry.get_engine.assert_not_called()
+
+        mocked_engine_registry.enabled = False
+        model.get_sqla_engine()
+        mocked_engine_registry.get_engine.assert_not_called()
+
     @pytest.mark.usefixtures("load_energy_table_with_slice")
     def test_select_star(self):
         db = get_example_database()
@@ -412,6 +446,62 @@ class TestSqlaTableModel(SupersetTestCase):
 
         assert name_list2 == name_list1
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_series_limit_prequery(self):
+        tbl = self.get_table_by_name("birth_names")
+        spec = tbl.database.db_engine_spec
+        query_obj = dict(
+            groupby=["state", "gender"],
+            metrics=["sum__num"],
+            filter=[],
+            is_timeseries=True,
+            timeseries_limit=3,
+            columns=[],
+            granularity="ds",
+            from_dttm=None,
+            to_dttm=None,
+            extras=dict(time_grain_sqla="P1Y"),
+        )
+        with mock.patch.object(spec, "allows_joins", False), mock.patch.dict(
+            "superset.connectors.sqla.models.config",
+            {"SERIES_LIMIT_PREQUERY_CACHE_TIMEOUT": 60},
+        ), mock.patch(
+            "superset.connectors.sqla.models.cache_manager._data_cache", SimpleCache()
+        ), mock.patch.object(
+            SqlaTable, "query", autospec=True, side_effect=SqlaTable.query
+        ) as query:
+            for _ in range(2):
+                with app.test_request_context():
+                    qr = tbl.query(query_obj)
+                self.assertEqual(qr.status, QueryStatus.SUCCESS)
+                self.assertNotIn("JOIN", qr.query.upper())
+                self.assertEqual(len(qr.df.groupby(["state", "gender"])), 3)
+            # the results of the prequery are read from the cache the second time
+            prequeries = [
+                call for call in query.call_args_list if not call[0][1]["is_timeseries"]
+            ]
+            self.assertEqual(len(prequeries), 1)
+
+    def test_get_top_groups(self):
+        df = pandas.DataFrame({"a": ["x", "y", None], "b": [1, 2, 3]})
+        exprs = OrderedDict(a=column("a", String), b=column("b", Integer))
+
+        def compile_(predicate):
+            return str(predicate.compile(compile_kwargs={"literal_binds": True}))
+
+        self.assertEqual(
+            compile_(SqlaTable._get_top_groups(df, ["a"], exprs)),
+            "a IN ('x', 'y') OR a IS NULL",
+        )
+        self.assertEqual(
+            compile_(SqlaTable._get_top_groups(df, ["a", "b"], exprs, tuple_in=True)),
+            "(a, b) IN (('x', 1), ('y', 2)) OR a IS NULL AND b = 3",
+        )
+        self.assertEqual(
+            compile_(SqlaTable._get_top_groups(df, ["a", "b"], exprs)),
+            "a = 'x' AND b = 1 OR a = 'y' AND b = 2 OR a IS NULL AND b = 3",
+        )
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_query_with_expr_groupby(self):
         self.query_with_expr_helper(is_timeseries=False)
@@ -19,11 +19,13 @@ from datetime import datetime
 from importlib.util import find_spec
 import math
 from typing import Any, List, Optional
+from unittest import mock
 
-from pandas import DataFrame, Series, Timestamp
+from pandas import DataFrame, date_range, Series, Timestamp
 import pytest
 
 from superset.exceptions import QueryObjectValidationError
+from superset.extensions import cache_manager
 from superset.utils import pandas_postprocessing as proc
 from superset.utils.core import (
     DTTM_ALIAS,
@@ -47,6 +49,27 @@ AGGREGATES_MULTIPLE = {
 }
 
 
+def fake_prophet_fit_and_predict(
+    df: DataFrame, periods: int, freq: str, **kwargs: Any
+) -> DataFrame:
+    """
+    Stands in for fitting a prophet model by forecasting the mean of the series.
+    """
+    index = df["ds"].append(
+        Series(date_range(df["ds"].iloc[-1], periods=periods + 1, freq=freq)[1:])
+    )
+    mean = df["y"].mean()
+    return DataFrame(
+        {
+            "yhat": mean,
+            "yhat_lower": mean - 1,
+            "yhat_upper": mean + 1,
+            "y": df["y"].tolist() + [None] * periods,
+        },
+        index=index.rename("ds"),
+    )
+
+
 def series_to_list(series: Series) -> List[Any]:
     """
     Converts a `Series` to a regular list, and replaces non-numeric values to
@@ -597,6 +620,60 @@ class TestPostProcessing(SupersetTestCase):
                     df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
                 )
 
+    @mock.patch("superset.utils.pandas_postprocessing._import_prophet")
+    @mock.patch(
+        "superset.utils.pandas_postprocessing._prophet_fit_and_predict",
+        fake_prophet_fit_and_predict,
+    )
+    def test_prophet_processes(self, mock_import_prophet):
+        df = prophet_df.assign(c=[1.0, 2.0, 3.0, 4.0])
+        cache_manager.data_cache.clear()
+        expected = proc.prophet(
+            df=df, time_grain="P1M", periods=3, confidence_interval=0.9
+        )
+        cache_manager.data_cache.clear()
+        with mock.patch.dict(self.app.config, {"PROPHET_PROCESSES": 3}):
+            df = proc.prophet(
+                df=df, time_grain="P1M", periods=3, confidence_interval=0.9
+            )
+        cache_manager.data_cache.clear()
+        assert mock_import_prophet.call_count == 1
+        assert len(df) == 7
+        assert df.equals(expected)
+
+    def test_prophet_cache(self):
+        fit_and_predict = mock.Mock(side_effect=fake_prophet_fit_and_predict)
+        with mock.patch(
+            "superset.utils.pandas_postprocessing._prophet_fit_and_predict",
+            fit_and_predict,
+        ):
+            cache_manager.data_cache.clear()
+            expected = proc.prophet(
+                df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+            )
+            assert fit_and_predict.call_count == 2
+
+            df = proc.prophet(
+                df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+            )
+            assert fit_and_predict.call_count == 2
+            assert df.equals(expected)
+
+            proc.prophet(
+                df=prophet_df.assign(b=[4, 3, 4.1, 4]),
+                time_grain="P1M",
+                periods=3,
+                confidence_interval=0.9,
+            )
+            assert fit_and_predict.call_count == 3
+
+            with mock.patch.dict(self.app.config, {"PROPHET_CACHE_TIMEOUT": None}):
+                proc.prophet(
+                    df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+                )
+            assert fit_and_predict.call_count == 5
+            cache_manager.data_cache.clear()
+
     def test_prophet_missing_temporal_column(self):
         df = prophet_df.drop(DTTM_ALIAS, axis=1)
 
@@ -669,6 +746,61 @@ class TestPostProcessing(SupersetTestCase):
         }
         assert len(df) == 4
 
+    def test_boxplot_tukey_outliers(self):
+        df = DataFrame(
+            {
+                "group": ["a"] * 8 + ["b"] * 3 + [None],
+                "value": [100, 1, 2, 3, None, 4, -50, 5, 1, 2, 3, 1000],
+            }
+        )
+        df = proc.boxplot(
+            df=df,
+            groupby=["group"],
+            whisker_type=PostProcessingBoxplotWhiskerType.TUKEY,
+            metrics=["value"],
+        )
+        assert df["group"].tolist() == ["a", "b"]
+        assert df["value__q1"].tolist() == [1.5, 1.5]
+        assert df["value__q3"].tolist() == [4.5, 2.5]
+        assert df["value__min"].tolist() == [1, 1]
+        assert df["value__max"].tolist() == [5, 3]
+        assert df["value__outliers"].tolist() == [[100, -50], []]
+
+    def test_boxplot_empty(self):
+        columns = [
+            "group",
+            "value__mean",
+            "value__median",
+            "value__max",
+            "value__min",
+            "value__q1",
+            "value__q3",
+            "value__count",
+            "value__outliers",
+        ]
+        for whisker_type in PostProcessingBoxplotWhiskerType:
+            df = proc.boxplot(
+                df=DataFrame({"group": [], "value": []}),
+                groupby=["group"],
+                whisker_type=whisker_type,
+                metrics=["value"],
+                percentiles=[1, 99],
+            )
+            assert df.columns.tolist() == columns
+            assert len(df) == 0
+
+    def test_boxplot_null_groupby(self):
+        for whisker_type in PostProcessingBoxplotWhiskerType:
+            df = proc.boxplot(
+                df=DataFrame({"group": [None, None], "value": [1, 2]}),
+                groupby=["group"],
+                whisker_type=whisker_type,
+                metrics=["value"],
+                percentiles=[1, 99],
+            )
+            assert "value__q1" in df
+            assert len(df) == 0
+
     def test_boxplot_min_max(self):
         df = proc.boxplot(
             df=names_df,
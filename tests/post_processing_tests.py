@@ -0,0 +1,146 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any, Dict, List
+
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from superset.common.post_processing import plan_post_processing, run_post_processing
+from superset.exceptions import QueryObjectValidationError
+from superset.utils import pandas_postprocessing as proc
+
+from .fixtures.dataframes import categories_df
+
+PIPELINE = [
+    {
+        "operation": "aggregate",
+        "options": {
+            "groupby": ["dept"],
+            "aggregates": {
+                "asc_idx": {"operator": "sum"},
+                "idx_nulls": {"operator": "sum"},
+            },
+        },
+    },
+    {
+        "operation": "rolling",
+        "options": {
+            "columns": {"asc_idx": "asc_idx_rolling"},
+            "rolling_type": "sum",
+            "window": 2,
+        },
+    },
+    {
+        "operation": "cum",
+        "options": {"columns": {"asc_idx_rolling": "asc_idx_cum"}, "operator": "sum"},
+    },
+    {"operation": "diff", "options": {"columns": {"idx_nulls": "idx_nulls"}}},
+    {"operation": "contribution", "options": {"columns": ["asc_idx"]}},
+    {"operation": "sort", "options": {"columns": {"asc_idx_cum": False}}},
+    {
+        "operation": "select",
+        "options": {
+            "columns": ["dept", "asc_idx", "asc_idx_cum"],
+            "rename": {"asc_idx_cum": "total"},
+        },
+    },
+]
+
+
+def run_sequentially(df: DataFrame, post_processing: List[Dict[str, Any]]) -> DataFrame:
+    for post_process in post_processing:
+        df = getattr(proc, post_process["operation"])(df, **post_process["options"])
+    return df
+
+
+def test_plan_post_processing():
+    steps = plan_post_processing(PIPELINE)
+    assert [step.operations for step in steps] == [
+        ["aggregate"],
+        ["rolling", "cum", "diff"],
+        ["contribution"],
+        ["sort", "select"],
+    ]
+
+    # rolling operations dropping their first rows are not fused
+    rolling = {**PIPELINE[1], "options": {**PIPELINE[1]["options"], "min_periods": 2}}
+    steps = plan_post_processing([PIPELINE[3], rolling, PIPELINE[3]])
+    assert [step.operations for step in steps] == [["diff"], ["rolling"], ["diff"]]
+
+
+def test_plan_post_processing_invalid():
+    with pytest.raises(QueryObjectValidationError):
+        plan_post_processing([PIPELINE[0], {"options": {}}])
+    with pytest.raises(QueryObjectValidationError):
+        plan_post_processing([{"operation": "unknown"}])
+    with pytest.raises(QueryObjectValidationError):
+        plan_post_processing([{"operation": "_append_columns"}])
+    with pytest.raises(QueryObjectValidationError):
+        plan_post_processing([{"operation": "diff", "options": {"column": "x"}}])
+
+
+def test_run_post_processing():
+    df = categories_df.copy()
+    result, stats = run_post_processing(df, plan_post_processing(PIPELINE))
+    assert_frame_equal(result, run_sequentially(categories_df, PIPELINE))
+    assert_frame_equal(df, categories_df)
+    assert [step["operations"] for step in stats] == [
+        ["aggregate"],
+        ["rolling", "cum", "diff"],
+        ["contribution"],
+        ["sort", "select"],
+    ]
+    assert all(step["duration_ms"] >= 0 for step in stats)
+    assert all(step["peak_memory"] is None for step in stats)
+
+
+def test_run_post_processing_on_input_frame():
+    """
+    Ensure that the frame passed to the pipeline is not updated in place
+    """
+    post_processing = PIPELINE[1:]
+    df = categories_df.copy()
+    result, _ = run_post_processing(df, plan_post_processing(post_processing))
+    assert_frame_equal(result, run_sequentially(categories_df, post_processing))
+    assert_frame_equal(df, categories_df)
+
+
+def test_run_post_processing_sort_on_unselected_column():
+    post_processing = [
+        {"operation": "sort", "options": {"columns": {"desc_idx": True}}},
+        {"operation": "select", "options": {"columns": ["name"]}},
+    ]
+    result, _ = run_post_processing(
+        categories_df, plan_post_processing(post_processing)
+    )
+    assert_frame_equal(result, run_sequentially(categories_df, post_processing))
+
+
+def test_run_post_processing_missing_column():
+    post_processing = [
+        {"operation": "cum", "options": {"columns": {"x": "y"}, "operator": "sum"}},
+    ]
+    with pytest.raises(QueryObjectValidationError):
+        run_post_processing(categories_df, plan_post_processing(post_processing))
+
+
+def test_run_post_processing_trace_memory():
+    _, stats = run_post_processing(
+        categories_df, plan_post_processing(PIPELINE), trace_memory=True
+    )
+    assert all(step["peak_memory"] > 0 for step in stats)
@@ -14,17 +14,21 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import copy
 import re
 from typing import Any, Dict
+from unittest import mock
 
 import pytest
 
 from superset import db
 from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.query_context import QueryContext
+from superset.common.query_fusion import plan_fused_queries
 from superset.common.query_object import QueryObject
 from superset.connectors.connector_registry import ConnectorRegistry
 from superset.extensions import cache_manager
+from superset.utils.cache_codecs import ArrowDataCacheCodec
 from superset.utils.core import (
     AdhocMetricExpressionType,
     backend,
@@ -113,6 +117,69 @@ class TestQueryContext(SupersetTestCase):
         self.assertEqual(rehydrated_qc.result_format, query_context.result_format)
         self.assertFalse(rehydrated_qc.force)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_cache_codec(self):
+        """
+        Ensure that results stored by a columnar codec are served from cache
+        """
+        self.login(username="admin")
+        payload = get_query_context("birth_names")
+        payload["force"] = True
+        codec = ArrowDataCacheCodec()
+        with mock.patch.dict(
+            "superset.common.query_context.config", DATA_CACHE_CODEC=codec
+        ):
+            query_context = ChartDataQueryContextSchema().load(payload)
+            response = query_context.get_payload()["queries"][0]
+            cached = cache_manager.data_cache.get(response["cache_key"])
+            assert cached["df_header"]["format"] == "arrow"
+            assert isinstance(cached["df"], bytes)
+
+            payload["force"] = False
+            query_context = ChartDataQueryContextSchema().load(payload)
+            cached_response = query_context.get_payload()["queries"][0]
+        assert cached_response["is_cached"]
+        assert cached_response["data"] == response["data"]
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_raw_query_results_cache(self):
+        """
+        Ensure that query objects only differing by their post processing share the
+        cached raw results of their query
+        """
+        self.login(username="admin")
+        payload = get_query_context("birth_names")
+        payload["force"] = True
+        sort = {"operation": "sort", "options": {"columns": {"sum__num": False}}}
+        payload["queries"][0]["post_processing"] = [sort]
+        with mock.patch.dict(
+            "superset.common.query_context.config", DATA_CACHE_RAW_QUERY_RESULTS=True
+        ):
+            query_context = ChartDataQueryContextSchema().load(payload)
+            response = query_context.get_payload()["queries"][0]
+            assert not response["is_cached"]
+            assert [
+                step["operations"] for step in response["post_processing_stats"]
+            ] == [["sort"]]
+
+            payload["force"] = False
+            sort["options"]["columns"] = {"sum__num": True}
+            query_context = ChartDataQueryContextSchema().load(payload)
+            query_object = query_context.queries[0]
+            cache_manager.data_cache.delete(query_context.query_cache_key(query_object))
+            with mock.patch.object(
+                query_context.datasource, "query"
+            ) as query, mock.patch(
+                "superset.common.query_context.stats_logger"
+            ) as stats_logger:
+                cached_response = query_context.get_payload()["queries"][0]
+            query.assert_not_called()
+            stats_logger.incr.assert_any_call("loaded_from_raw_cache")
+        assert cached_response["is_cached"]
+        assert [row["sum__num"] for row in cached_response["data"]] == sorted(
+            row["sum__num"] for row in response["data"]
+        )
+
     def test_query_cache_key_changes_when_datasource_is_updated(self):
         self.login(username="admin")
         payload = get_query_context("birth_names")
@@ -246,6 +313,32 @@ class TestQueryContext(SupersetTestCase):
         self.assertIn("name,sum__num\n", data)
         self.assertEqual(len(data.split("\n")), 12)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(
+        "superset.common.query_context.config",
+        {
+            "CSV_STREAMING_EXPORT": True,
+            "CSV_EXPORT_CHUNK_SIZE": 3,
+            "CSV_EXPORT_MAX_ROWS": 5,
+        },
+    )
+    def test_csv_response_format_streaming(self):
+        """
+        Ensure that CSV result format can be streamed in chunks
+        """
+        self.login(username="admin")
+        payload = get_query_context("birth_names")
+        payload["result_format"] = ChartDataResultFormat.CSV.value
+        payload["queries"][0]["row_limit"] = 10
+        query_context = ChartDataQueryContextSchema().load(payload)
+        # the rows above the export limit aren't queried
+        self.assertEqual(query_context.queries[0].row_limit, 5)
+        responses = query_context.get_payload()
+        chunks = list(responses["queries"][0]["data"])
+        self.assertEqual(len(chunks), 2)
+        self.assertTrue(chunks[0].startswith("name,sum__num\n"))
+        self.assertEqual(len("".join(chunks).split("\n")), 7)
+
     def test_sql_injection_via_groupby(self):
         """
         Ensure that calling invalid columns names in groupby are caught
@@ -306,6 +399,30 @@ class TestQueryContext(SupersetTestCase):
         self.assertEqual(len(data), 5)
         self.assertNotIn("sum__num", data[0])
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_concurrent_queries(self):
+        """
+        Ensure that queries run in a thread pool keep their order and timings
+        """
+        self.login(username="admin")
+        payload = get_query_context("birth_names")
+        payload["queries"].append(copy.deepcopy(payload["queries"][0]))
+        payload["queries"][1]["row_limit"] = 5
+        sequential = ChartDataQueryContextSchema().load(payload).get_payload()
+        with mock.patch.dict(
+            "superset.common.query_context.config", CHART_DATA_QUERY_THREADS=2
+        ):
+            query_context = ChartDataQueryContextSchema().load(payload)
+            concurrent = query_context.get_payload()
+        assert len(concurrent["queries"]) == 2
+        for sequential_result, concurrent_result in zip(
+            sequential["queries"], concurrent["queries"]
+        ):
+            assert concurrent_result["status"] == "success"
+            assert concurrent_result["data"] == sequential_result["data"]
+            assert concurrent_result["duration_ms"] >= 0
+        assert concurrent["queries"][1]["rowcount"] == 5
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_query_response_type(self):
         """
@@ -435,3 +552,36 @@ class TestQueryContext(SupersetTestCase):
         responses = query_context.get_payload()
         new_cache_key = responses["queries"][0]["cache_key"]
         self.assertEqual(orig_cache_key, new_cache_key)
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_plan_fused_queries(self):
+        """
+        Ensure that only query objects that differ in their metrics are fused, and
+        that metrics with the same label must have the same definition
+        """
+        self.login(username="admin")
+        payloads = [get_query_context("birth_names") for _ in range(5)]
+        payloads[1]["queries"][0]["metrics"] = [
+            {"expressionType": "SQL", "sqlExpression": "COUNT(*)", "label": "cnt"}
+        ]
+        payloads[2]["queries"][0]["metrics"] = [
+            {"expressionType": "SQL", "sqlExpression": "MAX(num)", "label": "cnt"}
+        ]
+        payloads[3]["queries"][0]["groupby"] = ["gender"]
+        payloads[4]["queries"][0]["row_offset"] = 10
+        query_contexts = []
+        for payload in payloads:
+            payload["force"] = True
+            query_contexts.append(ChartDataQueryContextSchema().load(payload))
+
+        groups = plan_fused_queries(query_contexts)
+        assert [
+            [query_contexts.index(query_context) for query_context, _ in members]
+            for members in groups
+        ] == [[0, 1]]
+
+        # cached results aren't queried again, and the remaining query objects use
+        # conflicting definitions of the same label
+        query_contexts[0].get_payload()
+        query_contexts[0].force = False
+        assert plan_fused_queries(query_contexts) == []
@@ -17,6 +17,8 @@
 # isort:skip_file
 from datetime import datetime
 
+import pyarrow as pa
+
 import tests.test_app
 from superset.dataframe import df_to_records
 from superset.db_engine_specs import BaseEngineSpec
@@ -248,3 +250,61 @@ class TestSupersetResultSet(SupersetTestCase):
         ]
         results = SupersetResultSet(data, cursor_descr, BaseEngineSpec)
         self.assertEqual(results.columns, [])
+
+    def test_mixed_types(self):
+        data = [(1, 1), ("a", 2.5), (None, 3)]
+        cursor_descr = [("mixed",), ("number",)]
+        results = SupersetResultSet(data, cursor_descr, BaseEngineSpec)
+        self.assertEqual(results.columns[0]["type"], "STRING")
+        self.assertEqual(results.columns[1]["type"], "FLOAT")
+        df = results.to_pandas_df()
+        self.assertEqual(
+            df_to_records(df),
+            [
+                {"mixed": "1", "number": 1.0},
+                {"mixed": "a", "number": 2.5},
+                {"mixed": None, "number": 3.0},
+            ],
+        )
+
+    def test_batches(self):
+        data = [(None, None, 1), (None, None, 2), (1, "a", 3.5), (2, None, 4)]
+        cursor_descr = [("a", None), ("b", "varchar"), ("c", None)]
+        results = SupersetResultSet(data, cursor_descr, BaseEngineSpec, batch_size=2)
+        self.assertEqual(results.table.column(0).type, pa.int64())
+        self.assertEqual(results.table.column(1).type, pa.string())
+        self.assertEqual(results.table.column(2).type, pa.float64())
+        self.assertEqual(results.columns[0]["type"], "INT")
+        self.assertEqual(results.columns[1]["type"], "VARCHAR")
+        self.assertEqual(results.columns[2]["type"], "FLOAT")
+        df = results.to_pandas_df()
+        self.assertEqual(
+            df_to_records(df),
+            [
+                {"a": None, "b": None, "c": 1.0},
+                {"a": None, "b": None, "c": 2.0},
+                {"a": 1, "b": "a", "c": 3.5},
+                {"a": 2, "b": None, "c": 4.0},
+            ],
+        )
+
+    def test_from_record_batches(self):
+        batches = [
+            pa.RecordBatch.from_arrays(
+                [pa.array([None, None]), pa.array([[1, 2], None])], names=["a", "b"]
+            ),
+            pa.RecordBatch.from_arrays(
+                [pa.array([1]), pa.array([[3]])], names=["a", "b"]
+            ),
+        ]
+        cursor_descr = [("a", None), ("b", None)]
+        results = SupersetResultSet.from_record_batches(
+            batches, cursor_descr, BaseEngineSpec
+        )
+        self.assertEqual(results.size, 3)
+        self.assertEqual(results.columns[0]["type"], "INT")
+        self.assertEqual(results.columns[1]["type"], "STRING")
+        self.assertEqual(
+            df_to_records(results.to_pandas_df()),
+            [{"a": None, "b": "[1, 2]"}, {"a": None, "b": None}, {"a": 1, "b": "[3]"},],
+        )
@@ -165,7 +165,7 @@ class TestSchedules(SupersetTestCase):
         self.assertEqual(schedules[59], datetime.strptime("2018-03-30 17:40:00", fmt))
         self.assertEqual(schedules[60], datetime.strptime("2018-05-04 17:10:00", fmt))
 
-    @patch("superset.tasks.schedules.firefox.webdriver.WebDriver")
+    @patch("superset.utils.webdriver.firefox.webdriver.WebDriver")
     def test_create_driver(self, mock_driver_class):
         mock_driver = Mock()
         mock_driver_class.return_value = mock_driver
@@ -177,7 +177,7 @@ class TestSchedules(SupersetTestCase):
     @pytest.mark.usefixtures(
         "load_world_bank_dashboard_with_slices", "add_schedule_slice_and_dashboard"
     )
-    @patch("superset.tasks.schedules.firefox.webdriver.WebDriver")
+    @patch("superset.utils.webdriver.firefox.webdriver.WebDriver")
     @patch("superset.tasks.schedules.send_email_smtp")
     @patch("superset.tasks.schedules.time")
     def test_deliver_dashboard_inline(self, mtime, send_email_smtp, driver_class):
@@ -213,7 +213,7 @@ class TestSchedules(SupersetTestCase):
     @pytest.mark.usefixtures(
         "load_world_bank_dashboard_with_slices", "add_schedule_slice_and_dashboard"
     )
-    @patch("superset.tasks.schedules.firefox.webdriver.WebDriver")
+    @patch("superset.utils.webdriver.firefox.webdriver.WebDriver")
     @patch("superset.tasks.schedules.send_email_smtp")
     @patch("superset.tasks.schedules.time")
     def test_deliver_dashboard_as_attachment(
@@ -259,7 +259,7 @@ class TestSchedules(SupersetTestCase):
     @pytest.mark.usefixtures(
         "load_world_bank_dashboard_with_slices", "add_schedule_slice_and_dashboard"
     )
-    @patch("superset.tasks.schedules.firefox.webdriver.WebDriver")
+    @patch("superset.utils.webdriver.firefox.webdriver.WebDriver")
     @patch("superset.tasks.schedules.send_email_smtp")
     @patch("superset.tasks.schedules.time")
     def test_dashboard_chrome_like(self, mtime, send_email_smtp, driver_class):
@@ -305,7 +305,7 @@ class TestSchedules(SupersetTestCase):
     @pytest.mark.usefixtures(
         "load_world_bank_dashboard_with_slices", "add_schedule_slice_and_dashboard"
     )
-    @patch("superset.tasks.schedules.firefox.webdriver.WebDriver")
+    @patch("superset.utils.webdriver.firefox.webdriver.WebDriver")
     @patch("superset.tasks.schedules.send_email_smtp")
     @patch("superset.tasks.schedules.time")
     def test_deliver_email_options(self, mtime, send_email_smtp, driver_class):
@@ -350,7 +350,7 @@ class TestSchedules(SupersetTestCase):
         "load_world_bank_dashboard_with_slices", "add_schedule_slice_and_dashboard"
     )
     @patch("superset.tasks.slack_util.WebClient.files_upload")
-    @patch("superset.tasks.schedules.firefox.webdriver.WebDriver")
+    @patch("superset.utils.webdriver.firefox.webdriver.WebDriver")
     @patch("superset.tasks.schedules.send_email_smtp")
     @patch("superset.tasks.schedules.time")
     def test_deliver_slice_inline_image(
@@ -406,7 +406,7 @@ class TestSchedules(SupersetTestCase):
         "load_world_bank_dashboard_with_slices", "add_schedule_slice_and_dashboard"
     )
     @patch("superset.tasks.slack_util.WebClient.files_upload")
-    @patch("superset.tasks.schedules.firefox.webdriver.WebDriver")
+    @patch("superset.utils.webdriver.firefox.webdriver.WebDriver")
     @patch("superset.tasks.schedules.send_email_smtp")
     @patch("superset.tasks.schedules.time")
     def test_deliver_slice_attachment(
@@ -34,8 +34,10 @@ from superset.connectors.druid.models import DruidCluster, DruidDatasource
 from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetSecurityException
+from superset.extensions import cache_manager
 from superset.models.core import Database
 from superset.models.slice import Slice
+from superset.security.manager import RLS_FILTERS_VERSION_CACHE_KEY
 from superset.sql_parse import Table
 from superset.utils.core import get_example_database
 
@@ -1192,6 +1194,86 @@ class TestRowLevelSecurity(SupersetTestCase):
         # base query should be present
         assert self.BASE_FILTER_REGEX.search(sql)
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_rls_filters_memoized(self):
+        g.user = self.get_user(username="gamma")
+        tbl = self.get_table_by_name("birth_names")
+        with patch.object(
+            security_manager,
+            "_get_rls_filters_query",
+            wraps=security_manager._get_rls_filters_query,
+        ) as mock_query:
+            filters = security_manager.get_rls_filters(tbl)
+            assert security_manager.get_rls_filters(tbl) == filters
+            assert security_manager.get_rls_ids(tbl) == sorted(f.id for f in filters)
+            assert mock_query.call_count == 1
+
+            # changing a filter invalidates the memoized filters
+            self.rls_entry2.clause = "name like 'C%'"
+            db.session.commit()
+            filters = security_manager.get_rls_filters(tbl)
+            assert mock_query.call_count == 2
+        assert "name like 'C%'" in {f.clause for f in filters}
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @patch.dict("flask.current_app.config", {"RLS_FILTERS_CACHE_TIMEOUT": 60})
+    def test_rls_filters_cached(self):
+        g.user = self.get_user(username="gamma")
+        tbl = self.get_table_by_name("birth_names")
+        with patch.object(
+            security_manager,
+            "_get_rls_filters_query",
+            wraps=security_manager._get_rls_filters_query,
+        ) as mock_query:
+            filters = security_manager.get_rls_filters(tbl)
+            # the filters are shared across requests
+            g.pop("rls_filters")
+            assert security_manager.get_rls_filters(tbl) == filters
+            assert mock_query.call_count == 1
+
+            # changing a filter invalidates the cached filters
+            self.rls_entry3.roles = []
+            db.session.commit()
+            g.pop("rls_filters", None)
+            filters = security_manager.get_rls_filters(tbl)
+            assert mock_query.call_count == 2
+        assert "name like 'Q%'" not in {f.clause for f in filters}
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @patch.dict("flask.current_app.config", {"RLS_FILTERS_CACHE_TIMEOUT": 60})
+    def test_rls_filters_cache_version(self):
+        g.user = self.get_user(username="gamma")
+        tbl = self.get_table_by_name("birth_names")
+        cache = cache_manager.cache
+        with patch.object(
+            security_manager,
+            "_get_rls_filters_query",
+            wraps=security_manager._get_rls_filters_query,
+        ) as mock_query:
+            # a missing version is a cache miss, and sets a new version
+            cache.delete(RLS_FILTERS_VERSION_CACHE_KEY)
+            filters = security_manager.get_rls_filters(tbl)
+            version = cache.get(RLS_FILTERS_VERSION_CACHE_KEY)
+            assert version is not None
+            g.pop("rls_filters")
+            assert security_manager.get_rls_filters(tbl) == filters
+            assert mock_query.call_count == 1
+
+        # the version is only rotated once the change is committed
+        self.rls_entry3.clause = "name like 'R%'"
+        db.session.flush()
+        assert cache.get(RLS_FILTERS_VERSION_CACHE_KEY) == version
+        db.session.commit()
+        assert cache.get(RLS_FILTERS_VERSION_CACHE_KEY) != version
+
+        # rolled back changes don't rotate the version
+        version = cache.get(RLS_FILTERS_VERSION_CACHE_KEY)
+        self.rls_entry3.clause = "name like 'S%'"
+        db.session.flush()
+        db.session.rollback()
+        db.session.commit()
+        assert cache.get(RLS_FILTERS_VERSION_CACHE_KEY) == version
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_rls_filter_doesnt_alter_admin_birth_names_query(self):
         g.user = self.get_user(username="admin")
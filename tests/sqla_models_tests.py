@@ -20,7 +20,7 @@ from typing import Any, Dict, NamedTuple, List, Pattern, Tuple, Union
 from unittest.mock import patch
 import pytest
 
-from superset import db
+from superset import app, db
 from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.db_engine_specs.bigquery import BigQueryEngineSpec
 from superset.db_engine_specs.druid import DruidEngineSpec
@@ -164,6 +164,36 @@ class TestDatabaseModel(SupersetTestCase):
             db.session.delete(table)
         db.session.commit()
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_sql_generated_once(self):
+        table = self.get_table_by_name("birth_names")
+        query_obj = {
+            "granularity": None,
+            "from_dttm": None,
+            "to_dttm": None,
+            "groupby": ["name"],
+            "metrics": [],
+            "is_timeseries": False,
+            "filter": [],
+            "extras": {"where": "name != '{{ cache_key_wrapper('abc') }}'"},
+        }
+        with app.test_request_context(), patch.object(
+            SqlaTable,
+            "get_sqla_query",
+            autospec=True,
+            side_effect=SqlaTable.get_sqla_query,
+        ) as get_sqla_query:
+            assert table.get_extra_cache_keys(query_obj) == ["abc"]
+            result = table.query(query_obj)
+            assert get_sqla_query.call_count == 1
+            assert "name != 'abc'" in result.query
+
+            # changing the datasource generates the SQL again
+            table.columns[0].expression = "'abc'"
+            table.query(query_obj)
+            assert get_sqla_query.call_count == 2
+        db.session.rollback()
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_where_operators(self):
         class FilterTestCase(NamedTuple):
@@ -18,6 +18,8 @@
 """Unit tests for Superset cache warmup"""
 import datetime
 import json
+import threading
+from unittest import mock
 from unittest.mock import MagicMock
 from tests.fixtures.birth_names_dashboard import load_birth_names_dashboard_with_slices
 
@@ -25,6 +27,7 @@ from sqlalchemy import String, Date, Float
 
 import pytest
 import pandas as pd
+from flask_caching import Cache
 
 from superset.models.slice import Slice
 from superset.utils.core import get_example_database
@@ -36,7 +39,10 @@ from superset.models.tags import get_tag, ObjectTypes, TaggedObject, TagTypes
 from superset.tasks.cache import (
     DashboardTagsStrategy,
     get_form_data,
+    prioritize_charts,
     TopNDashboardsStrategy,
+    warm_up_charts,
+    WarmUpStatus,
 )
 
 from .base_tests import SupersetTestCase
@@ -258,3 +264,74 @@ class TestCacheWarmUp(SupersetTestCase):
         result = sorted(strategy.get_urls())
         expected = sorted(tag1_urls + tag2_urls)
         self.assertEqual(result, expected)
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_prioritize_charts(self):
+        db.session.query(Log).delete()
+        dash = self.get_dash_by_slug("births")
+        first, second = dash.slices[:2]
+        for _ in range(3):
+            db.session.add(Log(action="explore_json", slice_id=second.id))
+        db.session.add(Log(action="explore_json", slice_id=first.id))
+        db.session.commit()
+
+        charts = [(first, None), (second, None), (first, None)]
+        self.assertEqual(prioritize_charts(charts), [(second, None), (first, None)])
+        db.session.query(Log).delete()
+        db.session.commit()
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_warm_up_charts(self):
+        data_cache = Cache(config={"CACHE_TYPE": "simple"})
+        data_cache.init_app(self.app)
+        dash = self.get_dash_by_slug("births")
+        slices = [slc for slc in dash.slices if slc.viz_type in ("table", "line")]
+        chart_ids = sorted(slc.id for slc in slices)
+        charts = [(slc, None) for slc in slices]
+
+        with mock.patch("superset.extensions.cache_manager._data_cache", data_cache):
+            result = warm_up_charts(charts)
+            self.assertEqual(sorted(result[WarmUpStatus.WARMED]), chart_ids)
+            self.assertEqual(result[WarmUpStatus.FAILED], [])
+
+            # charts whose data is still cached are skipped
+            result = warm_up_charts(charts)
+            self.assertEqual(result[WarmUpStatus.WARMED], [])
+            self.assertEqual(sorted(result[WarmUpStatus.FRESH]), chart_ids)
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_warm_up_charts_time_compare_threads(self):
+        data_cache = Cache(config={"CACHE_TYPE": "simple"})
+        data_cache.init_app(self.app)
+        dash = self.get_dash_by_slug("births")
+        slices = [slc for slc in dash.slices if slc.viz_type == "line"]
+        form_data = {"time_compare": ["1 year ago", "2 years ago"]}
+        thread_config = {
+            "CACHE_WARMUP_THREADS": 4,
+            "CACHE_WARMUP_THREADS_PER_DATABASE": 1,
+            "CHART_DATA_QUERY_THREADS": 2,
+            "CHART_DATA_QUERY_THREADS_PER_DATABASE": 1,
+        }
+
+        class TimeoutSemaphore(threading.BoundedSemaphore):
+            # fail rather than block forever on a limit held by the caller
+            def __enter__(self):
+                if not self.acquire(timeout=10):
+                    raise TimeoutError("Concurrency limit not acquired")
+
+        # the time shifted queries of the charts run in threads subject to the
+        # limit of chart data requests, which the warm up mustn't hold
+        with mock.patch(
+            "superset.extensions.cache_manager._data_cache", data_cache
+        ), mock.patch.dict(self.app.config, thread_config), mock.patch.dict(
+            "superset.viz.config", thread_config
+        ), mock.patch.dict(
+            "superset.utils.concurrency._semaphores", clear=True
+        ), mock.patch(
+            "superset.utils.concurrency.threading.BoundedSemaphore", TimeoutSemaphore
+        ):
+            result = warm_up_charts([(slc, form_data) for slc in slices])
+
+        assert slices
+        assert result[WarmUpStatus.FAILED] == []
+        assert sorted(result[WarmUpStatus.WARMED]) == sorted(slc.id for slc in slices)
@@ -0,0 +1,85 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=no-self-use
+from unittest import mock
+
+import pyarrow as pa
+import pytest
+from pyarrow import feather
+
+from superset.exceptions import SerializationError
+from superset.utils.arrow_results import (
+    deserialize_table,
+    get_num_rows,
+    pack_payload,
+    serialize_table,
+    unpack_payload,
+)
+
+TABLE = pa.table({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_serialize_table(compression):
+    data = serialize_table(TABLE, compression=compression, batch_size=30)
+    assert deserialize_table(data).equals(TABLE)
+    assert deserialize_table(data, limit=45).equals(TABLE.slice(0, 45))
+    assert deserialize_table(data, limit=1000).equals(TABLE)
+    assert deserialize_table(data, offset=25, limit=10).equals(TABLE.slice(25, 10))
+    assert deserialize_table(data, offset=95).equals(TABLE.slice(95))
+    assert deserialize_table(data, offset=200).equals(TABLE.slice(0, 0))
+    assert deserialize_table(data, offset=40, limit=5, columns=["b"]).equals(
+        TABLE.select(["b"]).slice(40, 5)
+    )
+
+
+def test_serialize_empty_table():
+    data = serialize_table(TABLE.slice(0, 0))
+    assert deserialize_table(data).equals(TABLE.slice(0, 0))
+    assert get_num_rows(data) == 0
+
+
+def test_get_num_rows():
+    assert get_num_rows(serialize_table(TABLE, batch_size=30)) == 100
+    with pytest.raises(SerializationError):
+        get_num_rows(b"invalid")
+
+
+def test_deserialize_table_reads_needed_row_groups():
+    data = serialize_table(TABLE, batch_size=30)
+    with mock.patch(
+        "superset.utils.arrow_results.feather.read_table", wraps=feather.read_table
+    ) as read_table:
+        deserialize_table(data, offset=35, limit=30, columns=["a"])
+    # only the second and third row groups are read, and only their `a` column
+    assert read_table.call_count == 2
+    assert all(call[1]["columns"] == ["a"] for call in read_table.call_args_list)
+
+
+def test_deserialize_table_invalid():
+    with pytest.raises(SerializationError):
+        deserialize_table(b"invalid")
+
+
+def test_pack_payload():
+    payload = {"status": "success", "query": {"rows": 100}, "data": b"table"}
+    metadata, data = unpack_payload(pack_payload(payload))
+    assert metadata == {"status": "success", "query": {"rows": 100}}
+    assert data.to_pybytes() == b"table"
+
+    with pytest.raises(SerializationError):
+        unpack_payload(b"x\x9c legacy zlib compressed payload")
@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=no-self-use
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from superset.utils.cache_codecs import (
+    ArrowDataCacheCodec,
+    DataCacheCodec,
+    ParquetDataCacheCodec,
+)
+
+DF = pd.DataFrame(
+    {
+        "int": [1, 2, 3],
+        "float": [1.5, None, 3.5],
+        "str": ["a", None, "c"],
+        "dttm": [datetime(2021, 1, 1), None, datetime(2021, 1, 3)],
+        "decimal": [Decimal("1.1"), None, Decimal("3.3")],
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [ArrowDataCacheCodec(), ArrowDataCacheCodec("zstd"), ParquetDataCacheCodec()],
+)
+def test_columnar_codecs(codec):
+    value = codec.encode({"df": DF, "query": "SELECT 1"})
+    assert isinstance(value["df"], bytes)
+    assert value["query"] == "SELECT 1"
+    assert value["df_header"] == {
+        "format": codec.format,
+        "rowcount": 3,
+    }
+
+    decoded = codec.decode(value)
+    assert "df_header" not in decoded
+    pd.testing.assert_frame_equal(decoded["df"], DF)
+    pd.testing.assert_frame_equal(codec.decode(value, ["str"])["df"], DF[["str"]])
+    # values can be decoded regardless of the configured codec
+    pd.testing.assert_frame_equal(DataCacheCodec().decode(value)["df"], DF)
+
+
+@pytest.mark.parametrize("codec", [ArrowDataCacheCodec(), ParquetDataCacheCodec()])
+def test_columnar_codecs_nullable_int(codec):
+    # integer columns with nulls are returned by the result set as objects
+    df = pd.DataFrame({"int": [1, None, 3]}, dtype=object)
+    decoded = codec.decode(codec.encode({"df": df}))["df"]
+    pd.testing.assert_frame_equal(decoded, df)
+    assert decoded["int"].tolist() == [1, None, 3]
+
+
+def test_columnar_codec_fallback():
+    codec = ArrowDataCacheCodec()
+    mixed = pd.DataFrame({"a": [1, "a"]})
+    assert codec.encode({"df": mixed})["df"] is mixed
+    multi_index = DF.set_index(["int", "str"]).unstack()
+    assert codec.encode({"df": multi_index})["df"] is multi_index
+    assert codec.encode({"df": None}) == {"df": None}
+    # pickled dataframes written by the default codec are still readable
+    pd.testing.assert_frame_equal(codec.decode({"df": DF})["df"], DF)
+
+
+def test_default_codec():
+    codec = DataCacheCodec()
+    value = {"df": DF, "query": "SELECT 1"}
+    assert codec.encode(value) is value
+    pd.testing.assert_frame_equal(codec.decode(value, ["int"])["df"], DF[["int"]])
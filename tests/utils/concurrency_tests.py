@@ -0,0 +1,72 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+
+from flask import g, request
+
+from superset.utils.concurrency import run_concurrently
+from tests.test_app import app
+
+
+def test_run_concurrently_keeps_order():
+    funcs = [lambda i=i: time.sleep(0.01 * (5 - i)) or i for i in range(5)]
+    assert run_concurrently(funcs, max_workers=5) == [0, 1, 2, 3, 4]
+    assert run_concurrently(funcs, max_workers=1) == [0, 1, 2, 3, 4]
+
+
+def test_run_concurrently_reraises():
+    def fail():
+        raise ValueError("failed")
+
+    try:
+        run_concurrently([lambda: 1, fail], max_workers=2)
+    except ValueError as ex:
+        assert str(ex) == "failed"
+    else:
+        assert False, "exception not reraised"
+
+
+def test_run_concurrently_copies_context():
+    with app.test_request_context("/chart/data?foo=bar"):
+        g.user = "admin"
+        main_thread = threading.get_ident()
+
+        def get_context():
+            return threading.get_ident() != main_thread, g.user, request.args["foo"]
+
+        assert run_concurrently([get_context] * 2, max_workers=2) == [
+            (True, "admin", "bar"),
+            (True, "admin", "bar"),
+        ]
+
+
+def test_run_concurrently_limit():
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def query():
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.pop()
+
+    run_concurrently([query] * 6, max_workers=6, limit_key="test_limit", limit=2)
+    assert max(max_running) == 2
@@ -78,3 +78,25 @@ def test_df_to_escaped_csv():
         ["a", "'=b"],  # pandas seems to be removing the leading ""
         ["' =a", "b"],
     ]
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame({"col_a": ["=a", "b", "c"], "=col_b": [1, 2, 3]})
+
+    chunks = list(
+        csv.df_to_escaped_csv_chunks(csv.split_df(df, 2), index=False, encoding="utf8")
+    )
+    assert chunks == ["col_a,'=col_b\n'=a,1\nb,2\n", "c,3\n"]
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+
+    chunks = list(
+        csv.df_to_escaped_csv_chunks(csv.split_df(df, 1), row_limit=2, index=False)
+    )
+    assert chunks == ["col_a,'=col_b\n'=a,1\n", "b,2\n"]
+
+
+def test_split_df_empty():
+    df = pd.DataFrame({"col_a": []})
+
+    chunks = list(csv.df_to_escaped_csv_chunks(csv.split_df(df, 2), index=False))
+    assert chunks == ["col_a\n"]
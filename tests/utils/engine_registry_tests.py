@@ -0,0 +1,88 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=no-self-use
+from unittest import mock
+
+import pytest
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import QueuePool
+
+from superset.utils.engine_registry import EngineRegistry
+
+SQLITE_URL = make_url("sqlite://")
+
+
+@pytest.fixture
+def registry():
+    app = mock.Mock()
+    app.config = {
+        "SQLALCHEMY_ENGINE_POOLING": True,
+        "SQLALCHEMY_ENGINE_POOLING_MAX_ENGINES": 2,
+        "STATS_LOGGER": mock.Mock(),
+    }
+    registry = EngineRegistry()
+    registry.init_app(app)
+    yield registry
+    registry.clear()
+
+
+def test_get_engine_reuses_engines(registry):
+    engine = registry.get_engine(1, None, None, SQLITE_URL, {})
+    assert registry.get_engine(1, None, None, SQLITE_URL, {}) is engine
+    assert registry.get_engine(1, None, "schema", SQLITE_URL, {}) is not engine
+    assert registry.get_engine(1, "user", None, SQLITE_URL, {}) is not engine
+    assert registry.get_engine(2, None, None, SQLITE_URL, {}) is not engine
+
+
+def test_get_engine_params_change(registry):
+    engine = registry.get_engine(1, None, None, SQLITE_URL, {})
+    assert registry.get_engine(1, None, None, SQLITE_URL, {"echo": True}) is not engine
+    assert registry.get_engine(1, None, None, make_url("sqlite:///a.db"), {}) is not (
+        engine
+    )
+
+
+def test_get_engine_evicts_least_recently_used(registry):
+    engine_1 = registry.get_engine(1, None, None, SQLITE_URL, {})
+    engine_2 = registry.get_engine(2, None, None, SQLITE_URL, {})
+    assert registry.get_engine(1, None, None, SQLITE_URL, {}) is engine_1
+
+    with mock.patch.object(engine_2, "dispose") as dispose:
+        registry.get_engine(3, None, None, SQLITE_URL, {})
+        dispose.assert_called_once()
+
+    assert registry.get_engine(1, None, None, SQLITE_URL, {}) is engine_1
+    assert registry.get_engine(2, None, None, SQLITE_URL, {}) is not engine_2
+
+
+def test_invalidate(registry):
+    engine_1 = registry.get_engine(1, None, None, SQLITE_URL, {})
+    engine_2 = registry.get_engine(2, None, None, SQLITE_URL, {})
+
+    registry.invalidate(1)
+    assert registry.get_engine(1, None, None, SQLITE_URL, {}) is not engine_1
+    assert registry.get_engine(2, None, None, SQLITE_URL, {}) is engine_2
+
+
+def test_pool_stats(registry):
+    stats_logger = registry._stats_logger
+    engine = registry.get_engine(1, None, None, SQLITE_URL, {"poolclass": QueuePool})
+    with engine.connect():
+        registry.log_pool_stats()
+        stats_logger.gauge.assert_any_call("engine_registry.engines", 1)
+        stats_logger.gauge.assert_any_call("engine_registry.connections.checked_out", 1)
+    stats_logger.incr.assert_called_with("engine_registry.miss")
@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=no-self-use
+from unittest import mock
+
+import pytest
+
+from superset.models.sql_lab import Query
+from superset.utils.core import QueryStatus
+from superset.utils.query_progress import QueryProgressChannel
+
+
+@pytest.fixture
+def channel():
+    app = mock.Mock()
+    app.config = {
+        "SQLLAB_QUERY_PROGRESS_REDIS_CONFIG": None,
+        "SQLLAB_MAX_POLL_INTERVAL": 5,
+        "SQLLAB_PROGRESS_COMMIT_INTERVAL": 5,
+    }
+    channel = QueryProgressChannel()
+    channel.init_app(app)
+    return channel
+
+
+@pytest.fixture
+def query():
+    return Query(id=1, progress=0)
+
+
+@mock.patch("superset.utils.query_progress.time.monotonic")
+def test_poll_interval_grows_with_query_age(monotonic, channel, query):
+    monotonic.return_value = 0
+    with channel.track(query, mock.Mock(), 1) as tracker:
+        assert tracker.poll_interval == 1
+        monotonic.return_value = 60
+        assert tracker.poll_interval == 3
+        monotonic.return_value = 3600
+        assert tracker.poll_interval == 5
+
+
+@mock.patch("superset.utils.query_progress.time.monotonic")
+def test_progress_commits_are_coalesced(monotonic, channel, query):
+    session = mock.Mock()
+    monotonic.return_value = 0
+    with channel.track(query, session, 1) as tracker:
+        tracker.set_progress(10)
+        tracker.set_progress(20)
+        session.commit.assert_not_called()
+
+        monotonic.return_value = 6
+        tracker.set_progress(30)
+        session.commit.assert_called_once()
+        assert query.progress == 30
+
+        tracker.set_progress(20)
+        tracker.set_progress(40)
+        assert query.progress == 30
+
+    # the pending progress is committed when done tracking
+    assert session.commit.call_count == 2
+    assert query.progress == 40
+
+
+def test_is_stopped_reads_status(channel, query):
+    session = mock.Mock()
+    session.query().filter_by().scalar.return_value = QueryStatus.RUNNING
+    with channel.track(query, session, 1) as tracker:
+        assert not tracker.is_stopped()
+        session.query().filter_by().scalar.return_value = QueryStatus.STOPPED
+        assert tracker.is_stopped()
+
+
+@mock.patch("superset.utils.query_progress.redis.Redis")
+def test_stop_requests_are_pushed(redis, channel, query):
+    channel._redis = redis()
+    redis().exists.return_value = 0
+    pubsub = redis().pubsub()
+    pubsub.get_message.return_value = {"type": "message", "data": "1"}
+    session = mock.Mock()
+
+    with channel.track(query, session, 1) as tracker:
+        pubsub.subscribe.assert_called_once_with("superset-query-stop-1")
+        assert not tracker.is_stopped()
+        tracker.wait()
+        assert tracker.is_stopped()
+    session.query.assert_not_called()
+    pubsub.close.assert_called_once()
+
+    channel.request_stop(1)
+    redis().publish.assert_called_once_with("superset-query-stop-1", 1)
+
+    # queries stopped before subscribing
+    redis().exists.return_value = 1
+    with channel.track(query, session, 1) as tracker:
+        assert tracker.is_stopped()
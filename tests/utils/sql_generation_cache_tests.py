@@ -0,0 +1,83 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=no-self-use
+from unittest import mock
+
+import pytest
+from flask import Flask
+
+from superset.utils.sql_generation_cache import GeneratedQuery, SqlGenerationCache
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config["SQL_GENERATION_CACHE_SIZE"] = 2
+    app.config["STATS_LOGGER"] = mock.Mock()
+    return app
+
+
+@pytest.fixture
+def sql_generation_cache(app):
+    sql_generation_cache = SqlGenerationCache()
+    sql_generation_cache.init_app(app)
+    return sql_generation_cache
+
+
+def generate(sql):
+    return mock.Mock(return_value=GeneratedQuery([], ["a"], [], sql))
+
+
+def test_get_memoizes_for_the_request(app, sql_generation_cache):
+    generate_1 = generate("SELECT 1")
+    with app.test_request_context():
+        assert sql_generation_cache.get("1", generate_1, False).sql == "SELECT 1"
+        assert sql_generation_cache.get("1", generate_1, False).sql == "SELECT 1"
+        assert generate_1.call_count == 1
+    with app.test_request_context():
+        sql_generation_cache.get("1", generate_1, False)
+        assert generate_1.call_count == 2
+    app.config["STATS_LOGGER"].incr.assert_any_call("sql_generation_cache.memo_hit")
+
+
+def test_get_shares_across_requests(app, sql_generation_cache):
+    generate_1, generate_2, generate_3 = [generate(f"SELECT {i}") for i in range(1, 4)]
+    with app.test_request_context():
+        sql_generation_cache.get("1", generate_1, True)
+        sql_generation_cache.get("2", generate_2, True)
+    with app.test_request_context():
+        assert sql_generation_cache.get("1", generate_1, True).sql == "SELECT 1"
+        assert generate_1.call_count == 1
+        # the least recently used query is evicted
+        sql_generation_cache.get("3", generate_3, True)
+    with app.test_request_context():
+        sql_generation_cache.get("1", generate_1, True)
+        sql_generation_cache.get("2", generate_2, True)
+        assert generate_1.call_count == 1
+        assert generate_2.call_count == 2
+    app.config["STATS_LOGGER"].timing.assert_called()
+
+
+def test_get_disabled(app):
+    app.config["SQL_GENERATION_CACHE_SIZE"] = 0
+    sql_generation_cache = SqlGenerationCache()
+    sql_generation_cache.init_app(app)
+    generate_1 = generate("SELECT 1")
+    for _ in range(2):
+        with app.test_request_context():
+            sql_generation_cache.get("1", generate_1, True)
+    assert generate_1.call_count == 2
@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=no-self-use
+from unittest import mock
+
+import pytest
+
+from superset.utils.webdriver_pool import WebDriverPool
+
+
+@pytest.fixture
+def pool():
+    app = mock.Mock()
+    app.config = {
+        "WEBDRIVER_POOL_SIZE": 2,
+        "WEBDRIVER_POOL_MAX_USES": 3,
+        "WEBDRIVER_POOL_IDLE_TIMEOUT": 600,
+        "STATS_LOGGER": mock.Mock(),
+    }
+    pool = WebDriverPool()
+    pool.init_app(app)
+    yield pool
+    pool.clear()
+
+
+def lease(pool, key, destroy=None):
+    with pool.lease(key, mock.Mock, destroy or mock.Mock()) as driver:
+        return driver
+
+
+def test_lease_reuses_drivers_by_key(pool):
+    driver = lease(pool, ("chrome", 1))
+    assert lease(pool, ("chrome", 1)) is driver
+    assert lease(pool, ("chrome", 2)) is not driver
+    assert lease(pool, ("chrome", 1)) is driver
+
+
+def test_lease_disabled():
+    pool = WebDriverPool()
+    destroy = mock.Mock()
+    driver = lease(pool, ("chrome", 1), destroy)
+    destroy.assert_called_once_with(driver)
+    assert lease(pool, ("chrome", 1)) is not driver
+
+
+def test_lease_recycles_after_max_uses(pool):
+    destroy = mock.Mock()
+    driver = lease(pool, ("chrome", 1), destroy)
+    assert lease(pool, ("chrome", 1), destroy) is driver
+    assert lease(pool, ("chrome", 1), destroy) is driver
+    destroy.assert_called_once_with(driver)
+    assert lease(pool, ("chrome", 1), destroy) is not driver
+
+
+def test_lease_destroys_drivers_raising(pool):
+    destroy = mock.Mock()
+    with pytest.raises(Exception):
+        with pool.lease(("chrome", 1), mock.Mock, destroy) as driver:
+            raise Exception("Error")
+    destroy.assert_called_once_with(driver)
+    assert lease(pool, ("chrome", 1)) is not driver
+
+
+def test_lease_discards_unhealthy_drivers(pool):
+    destroy = mock.Mock()
+    driver = lease(pool, ("chrome", 1), destroy)
+    driver.execute_script.side_effect = Exception("Browser crashed")
+    assert lease(pool, ("chrome", 1), destroy) is not driver
+    destroy.assert_called_once_with(driver)
+
+
+def test_lease_evicts_idle_drivers_of_other_keys(pool):
+    destroy = mock.Mock()
+    driver_1 = lease(pool, ("chrome", 1), destroy)
+    driver_2 = lease(pool, ("chrome", 2), destroy)
+    with pool.lease(("chrome", 3), mock.Mock, destroy):
+        destroy.assert_called_once_with(driver_1)
+    assert lease(pool, ("chrome", 2), destroy) is driver_2
+
+
+def test_lease_idle_timeout(pool):
+    destroy = mock.Mock()
+    driver = lease(pool, ("chrome", 1), destroy)
+    with mock.patch(
+        "superset.utils.webdriver_pool.time.monotonic", return_value=10 ** 9
+    ):
+        assert lease(pool, ("chrome", 1), destroy) is not driver
+    destroy.assert_called_once_with(driver)
@@ -52,6 +52,7 @@ from superset.utils.core import (
     get_email_address_list,
     get_or_create_db,
     get_stacktrace,
+    json_dumps_data,
     json_int_dttm_ser,
     json_iso_dttm_ser,
     JSONEncodedDict,
@@ -128,6 +129,29 @@ class TestUtils(SupersetTestCase):
         assert isinstance(base_json_conv(uuid.uuid4()), str) is True
         assert isinstance(base_json_conv(timedelta(0)), str) is True
 
+    def test_json_dumps_data(self):
+        payload = {
+            "data": [
+                {"dttm": datetime(2020, 1, 1), "value": float("nan")},
+                {"dttm": None, "value": Decimal("1.5")},
+            ]
+        }
+        expected = {
+            "data": [
+                {"dttm": 1577836800000.0, "value": None},
+                {"dttm": None, "value": 1.5},
+            ]
+        }
+        for backend in ("simplejson", "columnar"):
+            with patch.dict(app.config, {"DATA_JSON_BACKEND": backend}):
+                json_str = json_dumps_data(payload, default=json_int_dttm_ser)
+                self.assertEqual(json.loads(json_str), expected)
+                # integers over 64 bits are left to simplejson
+                json_str = json_dumps_data({"big": 2 ** 70}, json_int_dttm_ser)
+                self.assertEqual(json.loads(json_str), {"big": 2 ** 70})
+                with self.assertRaises(TypeError):
+                    json_dumps_data({"obj": object()}, default=json_int_dttm_ser)
+
     def test_zlib_compression(self):
         json_str = '{"test": 1}'
         blob = zlib_compress(json_str)
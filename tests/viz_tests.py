@@ -18,6 +18,7 @@
 from datetime import date, datetime, timezone
 import logging
 from math import nan
+import threading
 from unittest.mock import Mock, patch
 from typing import Any, Dict, List, Set
 
@@ -30,6 +31,7 @@ import superset.viz as viz
 from superset import app
 from superset.constants import NULL_STRING
 from superset.exceptions import QueryObjectValidationError, SpatialException
+from superset.utils import core as utils
 from superset.utils.core import DTTM_ALIAS
 
 from .base_tests import SupersetTestCase
@@ -1311,6 +1313,118 @@ class TestTimeSeriesViz(SupersetTestCase):
             [1.0, 2.0, np.nan, np.nan, 5.0, np.nan, 7.0],
         )
 
+    def get_time_compare_viz(self, time_grain="P1D"):
+        datasource = self.get_datasource_mock()
+        datasource.offset = 0
+        form_data = {"metrics": ["y"], "time_compare": ["1 day ago", "2 days ago"]}
+        test_viz = viz.NVD3TimeSeriesViz(datasource, form_data)
+        test_viz.query_obj = Mock(
+            side_effect=lambda: {
+                "from_dttm": datetime(2019, 1, 3),
+                "to_dttm": datetime(2019, 1, 5),
+                "extras": {"time_grain_sqla": time_grain},
+                "row_limit": 100,
+            }
+        )
+        return test_viz
+
+    def test_run_extra_queries(self):
+        test_viz = self.get_time_compare_viz()
+        df = pd.DataFrame(
+            {DTTM_ALIAS: pd.to_datetime(["2019-01-01", "2019-01-02"]), "y": [1.0, 2.0],}
+        )
+        test_viz.get_df_payload = Mock(return_value={"df": df})
+        with patch.dict(viz.config, CHART_DATA_QUERY_THREADS=2):
+            test_viz.run_extra_queries()
+
+        assert test_viz.get_df_payload.call_count == 2
+        query_objs = [call[0][0] for call in test_viz.get_df_payload.call_args_list]
+        assert [qry["from_dttm"] for qry in query_objs] == [
+            datetime(2019, 1, 2),
+            datetime(2019, 1, 1),
+        ]
+        assert [label for label, _ in test_viz._extra_chart_data] == [
+            "1 day ago offset",
+            "2 days ago offset",
+        ]
+        assert (
+            test_viz._extra_chart_data[1][1].index.tolist()
+            == pd.to_datetime(["2019-01-03", "2019-01-04"]).tolist()
+        )
+
+    def test_run_extra_queries_concurrently(self):
+        test_viz = self.get_time_compare_viz()
+        test_viz.cache_key = Mock(return_value=None)
+        query_obj = test_viz.query_obj
+        test_viz.query_obj = Mock(
+            side_effect=lambda: {**query_obj(), "granularity": "ds"}
+        )
+        test_viz.datasource.get_column = Mock(return_value=None)
+        # both queries have kept their results on the viz before reading them
+        barrier = threading.Barrier(2, timeout=5)
+
+        class QueryResult:
+            status = utils.QueryStatus.SUCCESS
+            errors: List[Dict[str, Any]] = []
+
+            def __init__(self, query_obj):
+                self.df = pd.DataFrame(
+                    {
+                        DTTM_ALIAS: [query_obj["from_dttm"]],
+                        "y": [query_obj["from_dttm"].day],
+                    }
+                )
+
+            @property
+            def query(self):
+                barrier.wait()
+                return ""
+
+        test_viz.datasource.query = Mock(side_effect=QueryResult)
+        with patch.dict(viz.config, CHART_DATA_QUERY_THREADS=2):
+            test_viz.run_extra_queries()
+
+        assert [
+            (label, df["y"].tolist()) for label, df in test_viz._extra_chart_data
+        ] == [("1 day ago offset", [2]), ("2 days ago offset", [1])]
+
+    def test_run_extra_queries_single_scan(self):
+        test_viz = self.get_time_compare_viz()
+        df = pd.DataFrame(
+            {
+                DTTM_ALIAS: pd.to_datetime(["2019-01-01", "2019-01-02", "2019-01-03"]),
+                "y": [1.0, 2.0, 3.0],
+            }
+        )
+        test_viz.get_df_payload = Mock(return_value={"df": df})
+        with patch.dict(viz.config, TIME_COMPARE_SINGLE_SCAN=True):
+            test_viz.run_extra_queries()
+
+        test_viz.get_df_payload.assert_called_once()
+        query_obj = test_viz.get_df_payload.call_args[0][0]
+        assert query_obj["from_dttm"] == datetime(2019, 1, 1)
+        assert query_obj["to_dttm"] == datetime(2019, 1, 4)
+        one_day, two_days = [df2 for _, df2 in test_viz._extra_chart_data]
+        assert one_day["y"].tolist() == [2.0, 3.0]
+        assert two_days["y"].tolist() == [1.0, 2.0]
+        assert one_day.index.tolist() == two_days.index.tolist()
+
+    def test_can_single_scan(self):
+        test_viz = self.get_time_compare_viz()
+        assert test_viz.can_single_scan(test_viz.get_time_compare_query_objs())
+
+        test_viz = self.get_time_compare_viz(time_grain="P1W")
+        assert not test_viz.can_single_scan(test_viz.get_time_compare_query_objs())
+
+        test_viz = self.get_time_compare_viz()
+        test_viz.form_data["time_compare"] = ["1 day ago", "1 year ago"]
+        assert not test_viz.can_single_scan(test_viz.get_time_compare_query_objs())
+
+        test_viz = self.get_time_compare_viz(time_grain="PT1H")
+        query_objs = test_viz.get_time_compare_query_objs()
+        query_objs[0][2]["from_dttm"] = datetime(2019, 1, 2, 0, 30)
+        assert not test_viz.can_single_scan(query_objs)
+
     def test_apply_rolling(self):
         datasource = self.get_datasource_mock()
         df = pd.DataFrame(